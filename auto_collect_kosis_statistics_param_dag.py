@@ -5,7 +5,7 @@ import os, sys
 from pendulum import timezone
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "scripts"))
-from scripts.auto_collect_kosis_statstics import main
+# ⚡ 수집 모듈은 DAG 파싱 시간을 줄이기 위해 태스크 함수 안에서만 import (bench_dag_import로 확인)
 
 default_args = {
     'owner': 'airflow',
@@ -14,33 +14,95 @@ default_args = {
 
 local_tz = timezone("Asia/Seoul")
 
-def safe_main(**context):
+def safe_plan(**context):
     import logging
     logger = logging.getLogger("airflow.task")
     try:
+        from scripts.auto_collect_kosis_statstics import main, plan_kosis_run
         # 🔁 context["params"]로 DAG 파라미터 전달
         execute_date = context["params"].get("execute_date")  # YYYY-MM-DD
         days_back = context["params"].get("days_back")
-        logger.info(f"실행 파라미터: execute_date={execute_date}, days_back={days_back}")
-        main(execute_date=execute_date, days_back=days_back)
+        # 🔁 백필 범위 (둘 다 지정 시 execute_date 대신 start_date ~ end_date 전체 수집)
+        start_date = context["params"].get("start_date")  # YYYY-MM-DD
+        end_date = context["params"].get("end_date")  # YYYY-MM-DD
+        # ⏪ 보관 응답 재적재 (YYYYMMDD 지정 시 네트워크 요청 없이 output_dir 보관분으로 적재)
+        replay_date = context["params"].get("replay_date")
+        logger.info(f"실행 파라미터: execute_date={execute_date}, days_back={days_back}, "
+                    f"start_date={start_date}, end_date={end_date}, replay_date={replay_date}")
+        if replay_date:
+            # ⏪ replay는 네트워크 요청이 없으므로 샤드로 나누지 않고 이 태스크에서 바로 적재
+            summary = main(replay_date=replay_date)
+            context["ti"].xcom_push(key="kosis_metrics", value=summary)
+            context["ti"].xcom_push(key="plan_path", value=None)
+            return []
+        # 🔑 같은 날 정기 실행/백필 실행의 계획 파일이 섞이지 않도록 DAG 실행 run_id로 계획 파일 구분
+        plan = plan_kosis_run(execute_date=execute_date, days_back=days_back, start_date=start_date,
+                              end_date=end_date, run_id=context["run_id"])
+        context["ti"].xcom_push(key="plan_path", value=plan["plan_path"])
+        return plan["shards"]
     except Exception as e:
         logger.exception("❌ DAG 실행 중 오류 발생")
         raise
 
+def safe_run_shard(plan_path, shard_index, **context):
+    import logging
+    logger = logging.getLogger("airflow.task")
+    try:
+        from scripts.auto_collect_kosis_statstics import run_kosis_shard
+        summary = run_kosis_shard(plan_path, shard_index)
+        # 📈 실행 지표 요약 XCom 전달 (return_value, kosis_metrics)
+        context["ti"].xcom_push(key="kosis_metrics", value=summary)
+        return summary
+    except Exception as e:
+        logger.exception(f"❌ 샤드 {shard_index} 실행 중 오류 발생")
+        raise
+
+def safe_finalize(**context):
+    import logging
+    logger = logging.getLogger("airflow.task")
+    try:
+        plan_path = context["ti"].xcom_pull(task_ids="plan_kosis_collection", key="plan_path")
+        if not plan_path:
+            logger.info("⏪ replay 실행으로 마무리 단계 생략")
+            return None
+        from scripts.auto_collect_kosis_statstics import finalize_kosis_run
+        summary = finalize_kosis_run(plan_path)
+        context["ti"].xcom_push(key="kosis_metrics", value=summary)
+        return summary
+    except Exception as e:
+        logger.exception("❌ DAG 마무리 중 오류 발생")
+        raise
+
 with DAG(
     dag_id='auto_collect_kosis_statistics_param_dag',
     schedule_interval=None,  # ✅ 스케줄러가 실행하지 않음
     start_date=datetime(2024, 1, 1, tzinfo=timezone("Asia/Seoul")),
     catchup=False,
-    tags=['kosis', 'manual']
+    tags=['kosis', 'manual'],
+    params={
+        "execute_date": "2025-05-25",
+        "days_back": 7,
+        "start_date": None,
+        "end_date": None,
+        "replay_date": None
+    }
 ) as dag:
 
-    run_kosis_etl = PythonOperator(
-        task_id='run_kosis_statistics_collection',
-        python_callable=safe_main,
-        provide_context=True,
-        params={
-            "execute_date": "2025-05-25",
-            "days_back": 7
-        }
+    plan_kosis = PythonOperator(
+        task_id='plan_kosis_collection',
+        python_callable=safe_plan
     )
+
+    # ✅ 샤드 수만큼 태스크 동적 생성 (Celery 워커별 병렬 실행)
+    run_kosis_shards = PythonOperator.partial(
+        task_id='run_kosis_shard',
+        python_callable=safe_run_shard
+    ).expand(op_kwargs=plan_kosis.output)
+
+    finalize_kosis = PythonOperator(
+        task_id='finalize_kosis_collection',
+        python_callable=safe_finalize,
+        trigger_rule='none_failed'
+    )
+
+    plan_kosis >> run_kosis_shards >> finalize_kosis
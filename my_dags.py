@@ -9,7 +9,9 @@ from pendulum import timezone
 # scripts 디렉토리 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), "scripts"))
 
-from scripts.auto_collect_kosis_statstics import main
+# ⚡ 수집 모듈(pandas, numpy, requests, oracledb 등)은 태스크 함수 안에서만 import
+# - 스케줄러가 DAG 파일을 파싱할 때마다 무거운 모듈을 불러오지 않도록 모듈 최상단 import 금지
+# - python -m scripts.benchmarks.bench_dag_import 로 DAG 파싱 시간/무거운 모듈 로드 여부 확인
 
 default_args = {
     'owner': 'airflow',
@@ -18,14 +20,45 @@ default_args = {
 
 local_tz = timezone("Asia/Seoul")
 
-# ✅ Airflow UI 실시간 로그 연동용 래퍼 함수
-def safe_main():
+# ✅ 1단계: 수집 계획 (대상 조회, 메타 요청, URL 샤드 분할)
+# - 샤드 목록을 반환하여 run_kosis_shard 태스크를 샤드 수만큼 동적으로 생성
+def safe_plan(**context):
     logger = logging.getLogger("airflow.task")
     try:
-        logger.info("🚀 KOSIS 수집 DAG 시작")
-        main()
+        from scripts.auto_collect_kosis_statstics import plan_kosis_run
+        logger.info("🚀 KOSIS 수집 DAG 시작 (수집 계획)")
+        # 🔑 같은 날 여러 실행의 계획 파일이 섞이지 않도록 DAG 실행 run_id로 계획 파일 구분
+        plan = plan_kosis_run(run_id=context["run_id"])
+        context["ti"].xcom_push(key="plan_path", value=plan["plan_path"])
+        return plan["shards"]
     except Exception as e:
-        logger.exception("❌ KOSIS 수집 중 예외 발생")
+        logger.exception("❌ KOSIS 수집 계획 중 예외 발생")
+        raise
+
+# ✅ 2단계: 샤드별 수집/저장 (매핑된 태스크, Celery 워커별 병렬 실행)
+# - 실행 지표 요약을 반환하여 XCom(return_value, kosis_metrics)으로 전달
+def safe_run_shard(plan_path, shard_index, **context):
+    logger = logging.getLogger("airflow.task")
+    try:
+        from scripts.auto_collect_kosis_statstics import run_kosis_shard
+        summary = run_kosis_shard(plan_path, shard_index)
+        context["ti"].xcom_push(key="kosis_metrics", value=summary)
+        return summary
+    except Exception as e:
+        logger.exception(f"❌ KOSIS 샤드 {shard_index} 수집 중 예외 발생")
+        raise
+
+# ✅ 3단계: 샤드 결과 집계 및 COMPLETE_YN = 'Y' 갱신
+def safe_finalize(**context):
+    logger = logging.getLogger("airflow.task")
+    try:
+        from scripts.auto_collect_kosis_statstics import finalize_kosis_run
+        plan_path = context["ti"].xcom_pull(task_ids="plan_kosis_collection", key="plan_path")
+        summary = finalize_kosis_run(plan_path)
+        context["ti"].xcom_push(key="kosis_metrics", value=summary)
+        return summary
+    except Exception as e:
+        logger.exception("❌ KOSIS 수집 마무리 중 예외 발생")
         raise
 
 with DAG(
@@ -38,9 +71,25 @@ with DAG(
     tags=['kosis', 'daily', 'oracle']
 ) as dag:
 
-    run_kosis_etl = PythonOperator(
-        task_id='run_kosis_statistics_collection',
-        python_callable=safe_main
+    plan_kosis = PythonOperator(
+        task_id='plan_kosis_collection',
+        python_callable=safe_plan
     )
 
-    run_kosis_etl.doc = "KOSIS 통계 데이터를 수집하고 Oracle DB에 저장하는 태스크입니다."
+    # ✅ 샤드 수만큼 태스크 동적 생성 (실패 시 해당 샤드만 재시도)
+    run_kosis_shards = PythonOperator.partial(
+        task_id='run_kosis_shard',
+        python_callable=safe_run_shard
+    ).expand(op_kwargs=plan_kosis.output)
+
+    # ✅ 수집 URL이 없어 샤드가 0개인 경우(skipped)에도 상태 플래그 갱신
+    finalize_kosis = PythonOperator(
+        task_id='finalize_kosis_collection',
+        python_callable=safe_finalize,
+        trigger_rule='none_failed'
+    )
+
+    plan_kosis >> run_kosis_shards >> finalize_kosis
+
+    plan_kosis.doc = "수집 대상 통계표와 URL을 계획하고 샤드로 분할하는 태스크입니다."
+    finalize_kosis.doc = "샤드별 수집 결과를 집계하고 수집 완료 플래그를 갱신하는 태스크입니다."
@@ -16,23 +16,45 @@
 ■ 주요 흐름
 1. kosis_config.ini에서 실행일자, DB 설정, 라이선스 키, 로그 경로 등을 로드
 2. 설정된 실행일(execute_date)을 기준으로, 이전 N일간 업데이트된 통계표를 필터링
+   - 백필 모드(start_date ~ end_date)에서는 범위 내 모든 실행일자의 갱신일 범위를 합집합으로 사용
 3. Oracle에서 수집 대상 통계표 목록 조회 (CD_KOSIS_REQ_MPP_P)
    - kosis_config.ini에 지정된 TBL_ID만 필터링 가능 (선택적)
    - 수집 대상 목록 info 로그 출력 및 중복 TBL_ID 자동 경고
-4. 각 통계표별 '자료갱신일' 메타정보 요청 (재시도 및 백오프 포함)
+4. 각 통계표별 '자료갱신일' 메타정보 병렬 요청 (재시도 및 백오프 포함, 입력 순서 유지)
 5. 자료갱신일이 지정 범위 내인 경우만 수집 대상 선정
-6. URL을 생성하고 중복 제거 후, ThreadPoolExecutor를 사용해 병렬 요청 수행
-   - 요청 실패 시 최대 10회 재시도, timeout=(120초, 300초)
+   - 대상 목록 조회 및 메타정보 요청은 실행일자 수와 무관하게 1회만 수행
+6. URL을 생성하고 (실행일자 간 포함) 중복 제거 후, 하나의 ThreadPoolExecutor로 병렬 요청 수행
+   - 같은 통계표의 연속 수록시점은 startPrdDe ~ endPrdDe 범위 요청 1건으로 병합 (kosis_planner.py)
+   - split_large_tables = true 시 통계표설명/분류항목으로 분류 구성을 조회하고, 셀 제한을 넘을 수 있는 요청은
+     userStatsId 선택 범위를 수록시점 1개로 확인한 뒤 선택 범위 기준 예상 셀 수가 큰 요청만
+     C1(또는 ITM_ID) 분류값 묶음별 통계자료(파라미터) 요청으로 분할 후 병렬 수집 (조각은 선택 범위의 분류값만 요청)
+   - 요청 실패 시 최대 10회 재시도 (지터 지수 백오프), timeout=(120초, 300초)
+   - adaptive_concurrency 사용 시 응답 지연/오류율에 따라 동시 요청 수 자동 조절
 7. 응답 데이터를 컬럼 정규화, 결측값/비정상값 제거 후 Oracle DB에 청크 단위로 저장
+   - 요청과 저장을 동시에 진행하는 스트리밍 파이프라인 (응답 도착 즉시 마이크로 배치로 정제/저장)
+   - 응답은 코드 컬럼 범주형 + 수치 OBS_VALUE의 저메모리 DataFrame으로 파싱하여 DB 바인딩 직전까지 유지
+   - write_mode = upsert 시 자연키(KOSTAT_TBL_ID, TIME_PERIOD, ITM_ID, C1~C8) 기준 MERGE로 중복 없이 저장
+   - batch error 모드로 실행하여 오류 행만 제외하고 나머지는 저장
+   - skip_unchanged = true 시 관측값 지문과 같은 행(days_back 기간 재수집분)과 실행 내 중복 행은 저장 생략
 8. 프로그램 실행 전 COMPLETE_YN = 'N', 실행 후 'Y'로 변경
    - 상태 관리 테이블: CD_COLLECT_KOSIS_OPENAPI_YN
 9. 전체 수집 건수 및 성공률 로그 출력
+   - 단계별 소요시간/URL 지연시간 분포/처리량을 JSON, Prometheus textfile로 저장하고 XCom으로 반환
+10. Airflow 분산 실행 시 plan → 샤드별 수집(동적 태스크 매핑) → finalize 3단계로 나누어 실행
+   - plan_kosis_run() : 대상 조회/메타 요청/URL 계획 후 TBL_ID 해시 또는 예상 크기 기준 num_shards개 샤드로 분할
+   - run_kosis_shard() : 샤드 1개 수집/저장 (Celery 워커별 병렬 실행, 실패 시 해당 샤드만 재시도)
+   - finalize_kosis_run() : 샤드 결과 집계 및 COMPLETE_YN = 'Y' 갱신
+11. (선택) checkpoint = true 시 URL별 상태/행 수/시도 횟수를 CD_COLLECT_KOSIS_URL_LOG에 기록
+   - 재실행(Airflow retries) 시 같은 수집일자에 완료된 URL은 건너뛰고 실패/미처리 URL만 수집 (resume)
+12. (선택) archive_raw = true 시 원본 응답을 output_dir에 gzip 보관, replay_date 지정 시 보관 응답만으로 재적재
 
 ------------------------------------------------------------
 ■ 실행 환경
 - Python 3.7 이상
 - Oracle Instant Client 설치 및 환경변수 설정 필요
 - 의존 패키지: oracledb, pandas, numpy, requests, configparser 등
+- (선택) aiohttp : meta_async = true 시 메타정보 비동기 요청에 사용
+- (선택) orjson : 설치 시 응답 JSON 디코딩에 사용 (미설치 시 표준 json)
 
 ------------------------------------------------------------
 ■ 구성 파일
@@ -41,14 +63,34 @@
     execute_date = 2025-05-21
     days_back = 6
     max_workers = 15
+    meta_max_workers = 5
     tbl_id = DT_1EA1201, DT_1F02005
-- kosis_reader.py : 통계청 OpenAPI 메타 요청 전용 클래스
+- kosis_reader.py : 통계청 OpenAPI 메타 요청 전용 클래스 (선택적 디스크 캐시 KosisCache, 레코드 모드 get_records 포함)
+- kosis_ledger.py : URL 단위 수집 체크포인트 (CD_COLLECT_KOSIS_URL_LOG, 재실행 시 이어받기)
+- kosis_fingerprint.py : 관측값 지문 기반 변경 감지 (CD_KOSTAT_OPENAPI_FP, skip_unchanged = true 시 사용)
+- kosis_metrics.py : 실행 지표 집계 (단계별 시간, 지연시간 히스토그램, 카운터)
+- kosis_archive.py : 원본 응답 보관소 (수집일자 + URL 해시, 보관 기간 관리)
+- kosis_planner.py : 수록시점 범위 병합 및 셀 제한 초과 시 범위 분할
+- kosis_catalog.py : 통계목록 트리 로컬 미러 (sqlite, 변경/만료 목록만 재탐색, 통계표 검색)
+- kosis_async.py : asyncio/aiohttp 기반 KOSIS 클라이언트 (get_many, meta_async = true 시 메타 요청에 사용)
+- kosis_logging.py : 큐 기반 비동기 로깅(QueueListener) 및 URL 로그 표본 추출/요약
+- kosis_http.py : fetch_url과 Kosis가 공유하는 keep-alive HTTP 세션 (커넥션 풀 = max_workers)
 - kosis_logs/ : 날짜별 info/error 로그 자동 생성 (TimedRotatingFileHandler)
+- benchmarks/ : 가짜 KOSIS 서버, Oracle 대체 싱크, 종단간/단계별 벤치마크 스크립트
+  - python -m scripts.benchmarks.run_pipeline_bench --tables 200 --workers 5 15 30
 
 ------------------------------------------------------------
 ■ 주요 함수
 - run_kosis_process_logging() : 수집, 정제, 저장 전체 프로세스 실행
+- load_target_tables() : 수집 대상 통계표 목록 조회
+- plan_kosis_run() / run_kosis_shard() / finalize_kosis_run() : Airflow 동적 태스크 매핑용 분산 실행 단계
+- run_kosis_replay() : 보관된 원본 응답을 네트워크 없이 재파싱하여 저장 (replay 모드)
+- stream_fetch_and_insert() : 수집 → 정제 → 저장 생산자/소비자 파이프라인
+- normalize_kosis_frame() : 비정상값 필터링, 수치 변환, 공통 컬럼 세팅을 한 번에 수행하는 정제 함수
+- concat_kosis_frames() / bind_rows() : 배치 병합(코드 컬럼 범주형 변환), DB 바인딩 변환
+- plan_kosis_urls() : 실행일자별 URL 생성 및 실행일자 간 중복 URL 제거
 - fetch_url() : 단일 URL에 대한 API 요청 및 pandas DataFrame 변환
+- fetch_meta_parallel() : 통계표별 자료갱신일 메타정보 병렬 요청
 - upsert_complete_flag() : 상태 관리 테이블에 COMPLETE_YN 플래그 삽입 또는 갱신
 - setup_logger() : 일자별 로그 핸들러 생성 및 로그 레벨 설정
 
@@ -56,10 +98,13 @@
 ■ 로깅 및 디버깅
 - 수집 대상 통계표 수 및 TBL_ID 목록 info 로그 출력
 - 동일한 TBL_ID 중복 존재 시 warning 로그 출력
-- 메타 요청 실패 시 최대 5회 재시도 (2, 4, 6, 8, 10초 간격)
-- API 요청 실패 시 최대 10회 재시도 (점진적 백오프)
+- 메타 요청 실패 시 최대 5회 재시도 (지터 지수 백오프)
+- API 요청 실패 시 최대 10회 재시도 (지터 지수 백오프, 최대 60초)
+- timeout / 5xx / KOSIS 이용 제한(errMsg) 발생 시 동시 요청 수 축소
 - 응답 데이터에서 OBS_VALUE가 NaN, '-', '...'인 경우 자동 필터링
 - 모든 주요 작업은 로그로 기록 (info/error 로그 분리)
+- async_logging = true 시 로그 출력은 QueueListener 스레드 1개가 담당 (요청 스레드는 큐에 넣기만 함)
+- url_log_sample_rate / url_log_summary_interval로 URL별 요청 로그를 표본 추출하고 생략분은 주기적으로 요약
 - 예외 발생 시 traceback 포함한 logger.error 출력 및 raise 처리
 
 ------------------------------------------------------------
@@ -67,11 +112,27 @@
 - 병렬 처리 수(max_workers)를 kosis_config.ini로 설정 가능
   - [DEFAULT] 섹션에서 `max_workers = 15` 식으로 지정
   - 설정값은 ThreadPoolExecutor의 동시 요청 수 제한에 사용됨
+  - 공유 HTTP 세션의 커넥션 풀 크기도 같은 값으로 설정되어 TCP/TLS 연결을 재사용
+- parse_workers > 0 시 parse_min_bytes 이상인 응답은 요청 스레드가 bytes만 받고, JSON 디코딩/파싱은 파싱 프로세스 풀에서 수행
+  - 요청 스레드는 파싱을 기다리지 않고 바로 다음 요청을 처리 (파싱 작업 제출/결과 수거는 생산자 루프에서 수행)
+  - 작은 응답(errMsg 응답 포함)은 프로세스 간 전송 비용이 파싱보다 크므로 요청 스레드에서 바로 파싱
+  - 결과는 범주형 저메모리 DataFrame으로 전달 (parse_kosis_compact, pickle 크기가 응답 bytes보다 작음)
+- adaptive_concurrency = true 시 min_workers ~ max_workers 범위에서 동시 요청 수 자동 조절 (AIMD)
+  - 평균 응답 시간이 latency_target 이하이고 오류가 없으면 1씩 증가, 이용 제한/timeout 시 30% 축소
+- 메타정보 요청 병렬 처리 수(meta_max_workers)를 별도로 설정 가능
+  - [DEFAULT] 섹션에서 `meta_max_workers = 5` 식으로 지정
+  - 데이터 요청과 독립된 ThreadPoolExecutor에서 사용됨
+- 저장 대기 큐 크기(queue_size)와 마이크로 배치 행 수(batch_rows) 설정 가능
+  - 큐가 가득 차면 새 요청 제출을 멈춰 메모리 사용량을 일정하게 유지 (backpressure)
+- [CACHE] 섹션 활성화 시 메타 응답을 서비스별 TTL로 디스크 캐시
+  - 재실행 및 중복 TBL_ID의 동일 메타 요청은 API를 다시 호출하지 않음
 
 ------------------------------------------------------------
 ■ 출력 테이블
 1. 수집 데이터 저장: CD_KOSTAT_OPENAPI_VAL
    - 컬럼: KOSTAT_TBL_ID, TIME_PERIOD, FREQ, ITM_ID, C1~C8, OBS_VALUE 등
+   - [DB] write_mode = insert(기본) / upsert(자연키 MERGE), chunk_size, commit_interval 설정 가능
+   - [DB] writers > 1 이면 세션 풀 연결 writers개로 통계표별 분할 병렬 저장
    - 공통 컬럼 자동 설정: Z_REG_*, Z_MOD_*
 
 2. 수집 완료 여부: CD_COLLECT_KOSIS_OPENAPI_YN
@@ -79,6 +140,12 @@
    - 완료 후 COMPLETE_YN = 'Y'로 갱신됨
    - Z_REG_DTM은 최초 실행 시, Z_MOD_DTM은 매 실행 시 업데이트
 
+3. (선택) URL별 처리 상태: CD_COLLECT_KOSIS_URL_LOG (checkpoint = true)
+   - COLLECT_DATE, URL_HASH 기준으로 STATUS(Y/N), ROW_CNT, ATTEMPT_CNT 기록
+
+4. (선택) 관측값 지문: CD_KOSTAT_OPENAPI_FP (skip_unchanged = true)
+   - KOSTAT_TBL_ID, TIME_PERIOD, KEY_HASH(자연키 해시) 기준으로 VAL_HASH(FREQ, OBS_VALUE 해시) 기록
+
 ------------------------------------------------------------
 ■ 실행 결과 예시
 - kosis_logs/kosis_info_20250521.log : 정상 실행 로그
@@ -101,13 +168,21 @@
 
 
 import os
+import re
+import glob
+import json
+import uuid
 import time
+import queue
 import logging
-import requests
+import threading
 import configparser
+import zlib
+import multiprocessing
 import concurrent.futures
 import pandas as pd
 import numpy as np
+from pandas.api.types import union_categoricals
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from logging.handlers import TimedRotatingFileHandler
@@ -115,6 +190,14 @@ import urllib3
 import oracledb
 
 from scripts import kosis_reader as k_r
+from scripts import kosis_http
+from scripts import kosis_planner
+from scripts import kosis_archive
+from scripts import kosis_metrics
+from scripts import kosis_ledger
+from scripts import kosis_async
+from scripts import kosis_fingerprint
+from scripts import kosis_logging
 
 urllib3.disable_warnings()
 
@@ -123,6 +206,8 @@ urllib3.disable_warnings()
 # - 콘솔 출력 핸들러
 # - info level 파일 핸들러
 # - error level 파일 핸들러
+# - async_logging = true이면 start_log_listener()가 위 핸들러를 QueueListener 스레드로 옮기고 로거에는 QueueHandler만 연결
+#   (요청 스레드는 큐에 넣기만 하므로 로그 I/O와 핸들러 잠금 대기가 요청 지연시간에 더해지지 않음)
 def setup_logger(today: object, log_dir: object) -> object:
     logger = logging.getLogger(f"KOSISLogger_{today}")
     logger.setLevel(logging.DEBUG)
@@ -155,6 +240,14 @@ def setup_logger(today: object, log_dir: object) -> object:
 
     return logger
 
+# ✅ 비동기 로그 출력 시작 함수 ([DEFAULT] async_logging = true이면 QueueListener 반환, false이면 None)
+# 호출한 쪽에서 try/finally로 stop()을 호출하여 큐에 남은 로그를 출력합니다.
+# (Airflow 태스크 프로세스는 os._exit로 종료되어 atexit가 실행되지 않음)
+def start_log_listener(config, logger):
+    if not config.getboolean("DEFAULT", "async_logging", fallback=False):
+        return None
+    return kosis_logging.attach_queue_listener(logger)
+
 # ✅ 공통 컬럼 세팅 함수
 # 수집 데이터에 공통 등록/수정 컬럼(Z_*)을 추가하고 현재 시점 기준으로 값을 채웁니다.
 # Oracle 테이블의 감사 로그 목적
@@ -184,41 +277,465 @@ def get_connection_with_retry(pool, max_retries=3):
 # ✅ KOSIS API URL 생성
 # 실행 파라미터를 기반으로 수집 URL을 생성합니다.
 # KOSIS API의 사용자 통계 ID(userStatsId) 기반 구성입니다.
-def build_kosis_url(license_key, kosis_id, org_id, tbl_id, url_code, prd_se, prd_de):
+# end_prd_de를 지정하면 prd_de ~ end_prd_de 범위 요청 URL을 생성합니다.
+# base_url을 지정하면 kosis.kr 대신 해당 주소로 요청합니다. (벤치마크용 로컬 서버 등)
+def build_kosis_url(license_key, kosis_id, org_id, tbl_id, url_code, prd_se, prd_de, end_prd_de=None,
+                    base_url=None):
     return (
-        f"https://kosis.kr/openapi/statisticsData.do?method=getList"
+        f"{base_url or kosis_http.KOSIS_BASE_URL}/openapi/statisticsData.do?method=getList"
         f"&apiKey={license_key}&format=json&jsonVD=Y&userStatsId={kosis_id}/{org_id}/{tbl_id}/2/2/{url_code}"
-        f"&prdSe={prd_se}&startPrdDe={prd_de}&endPrdDe={prd_de}"
+        f"&prdSe={prd_se}&startPrdDe={prd_de}&endPrdDe={end_prd_de or prd_de}"
     ).replace(' ', '')
 
+# ✅ KOSIS 통계자료(파라미터) API URL 생성
+# 대용량 통계표 분할 조각 요청용 URL을 생성합니다. (Param/statisticsParameterData.do)
+# - dims는 userStatsId 선택 범위(fetch_selection_dims 결과)이며, 항목/모든 분류의 분류값을 명시 (KOSIS 형식: 값+값+)
+#   → 조각 요청 결과는 선택 범위를 넘지 않음 (ALL 미사용)
+# - itm_ids / c1_codes가 지정되면 항목 / C1 분류값은 해당 묶음만 요청
+def build_kosis_param_url(license_key, org_id, tbl_id, prd_se, prd_de, end_prd_de, dims, itm_ids=None, c1_codes=None,
+                          base_url=None):
+    params = [f"orgId={org_id}", f"tblId={tbl_id}", f"itmId={'+'.join(itm_ids or dims.items)}+"]
+    for level, (_, codes) in enumerate(dims.objs, 1):
+        codes = c1_codes if level == 1 and c1_codes else codes
+        params.append(f"objL{level}={'+'.join(codes)}+")
+    return (
+        f"{base_url or kosis_http.KOSIS_BASE_URL}/openapi/Param/statisticsParameterData.do?method=getList"
+        f"&apiKey={license_key}&format=json&jsonVD=Y&{'&'.join(params)}"
+        f"&prdSe={prd_se}&startPrdDe={prd_de}&endPrdDe={end_prd_de or prd_de}"
+    ).replace(' ', '')
+
+# ✅ 수집 DataFrame 컬럼 (fetch_url() 반환 형식, 13개)
+FETCH_COLUMNS = ['KOSTAT_TBL_ID', 'TIME_PERIOD', 'FREQ', 'ITM_ID',
+                 'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'OBS_VALUE']
+
+# ✅ FETCH_COLUMNS 순서에 대응하는 KOSIS 응답 키
+FETCH_SOURCE_KEYS = ['TBL_ID', 'PRD_DE', 'PRD_SE', 'ITM_ID',
+                     'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'DT']
+
+# ✅ 수치값 없음을 나타내는 OBS_VALUE 표기 (파싱/정규화 시 해당 행 제거)
+KOSIS_OBS_SENTINELS = ('-', '...')
+
+# ✅ KOSIS 응답 파싱 함수 (컬럼 직접 구성)
+# 응답 행(dict)마다 필요한 13개 키만 튜플로 꺼내 DataFrame을 한 번에 만듭니다.
+# - json_normalize(중첩 평탄화) → rename → reindex를 거치지 않음
+# - 없는 키(C2~C8 등)는 None, 모든 컬럼은 object 타입 (정제는 normalize_kosis_frame에서 수행)
+def parse_kosis_response(res_json):
+    if isinstance(res_json, dict):
+        res_json = [res_json]
+    return pd.DataFrame.from_records(
+        [tuple(map(row.get, FETCH_SOURCE_KEYS)) for row in res_json], columns=FETCH_COLUMNS)
+
+# ✅ KOSIS 응답 파싱 함수 (응답 단위 저메모리 표현)
+# 통계표/시점/주기/항목/분류 코드(12개 컬럼)는 값 종류가 적으므로 범주형(category: 정수 코드 + 고유값 목록)으로,
+# OBS_VALUE는 float64로 만들어 응답 1건당 메모리를 줄입니다.
+# - OBS_VALUE가 None/NaN, '-', '...'인 행은 파싱 시점에 제거 (normalize_kosis_frame과 같은 기준)
+# - 그 외 값은 수치 변환 (변환 불가 값은 NaN)
+# - 파이프라인은 요청 스레드의 파싱 시간을 줄이기 위해 parse_kosis_response() 결과를 배치 단위로 범주형 변환하며
+#   (concat_kosis_frames(categorize=True)), 이 함수는 결과 비교/벤치마크 기준으로 유지
+COMPACT_CATEGORY_COLUMNS = FETCH_COLUMNS[:12]
+
+def parse_kosis_compact(res_json):
+    if isinstance(res_json, dict):
+        res_json = [res_json]
+    columns = list(zip(*[tuple(map(row.get, FETCH_SOURCE_KEYS)) for row in res_json])) or [()] * len(FETCH_COLUMNS)
+    obs = np.array(columns[-1], dtype=object)
+    mask = ~pd.isna(obs) & ~np.isin(obs, KOSIS_OBS_SENTINELS)
+    keep = mask.all()
+
+    data = {}
+    for col, values in zip(COMPACT_CATEGORY_COLUMNS, columns):
+        values = np.array(values, dtype=object)
+        data[col] = pd.Categorical(values if keep else values[mask])
+    data['OBS_VALUE'] = pd.to_numeric(obs if keep else obs[mask], errors='coerce').astype(np.float64)
+    return pd.DataFrame(data, copy=False)
+
+# ✅ 수집 DataFrame 병합 함수
+# 범주형 컬럼은 고유값 목록을 합쳐(union_categoricals) 범주형 그대로 병합합니다.
+# (pd.concat은 고유값 목록이 다른 범주형을 object 문자열로 되돌림)
+# - categorize=True이면 object 코드 컬럼(통계표/시점/주기/항목/분류)을 배치 전체에 대해 한 번에 범주형으로 변환
+#   (저장 스레드의 배치 병합에서 사용, 범주형은 정제/변경 감지까지 유지되고 DB 바인딩 직전(bind_rows)에 문자열로 변환)
+def concat_kosis_frames(frames, categorize=False):
+    frames = [df for df in frames if len(df)] or frames[:1]
+    if len(frames) == 1 and not categorize:
+        return frames[0].reset_index(drop=True)
+    data = {}
+    for col in frames[0].columns:
+        if all(isinstance(df[col].dtype, pd.CategoricalDtype) for df in frames):
+            data[col] = union_categoricals([df[col] for df in frames])
+        elif categorize and col in COMPACT_CATEGORY_COLUMNS:
+            data[col] = pd.Categorical(np.concatenate([df[col].to_numpy(dtype=object) for df in frames]))
+        else:
+            data[col] = pd.concat([df[col] for df in frames], ignore_index=True)
+    return pd.DataFrame(data, copy=False)
+
+# ✅ 응답 bytes 파싱 함수 (파싱 프로세스 풀 작업 단위)
+# 디코딩 → errMsg 확인 → 컬럼 파싱을 한 번에 수행합니다.
+# - compact=True이면 범주형 저메모리 표현(parse_kosis_compact)으로 반환 (파싱 프로세스 → 부모 프로세스 전송량 축소)
+# - 반환값: (DataFrame, None), errMsg 응답이면 (None, (err, errMsg))
+#   (KosisApiError는 생성 인자가 달라 pickle로 되돌릴 수 없으므로 오류 코드/메시지만 반환)
+def parse_kosis_body(body, compact=False):
+    res_json = kosis_http.decode_json(body)
+    if isinstance(res_json, dict) and res_json.get("errMsg"):
+        return None, (res_json.get("err"), res_json.get("errMsg"))
+    return (parse_kosis_compact if compact else parse_kosis_response)(res_json), None
+
+# ✅ 응답 bytes → DataFrame 변환 함수 (호출 스레드에서 파싱)
+# errMsg 응답은 KosisApiError로 다시 발생시켜 fetch_url의 재시도/분할 처리를 그대로 사용합니다.
+def decode_kosis_body(body):
+    df, error = parse_kosis_body(body)
+    if error is not None:
+        raise kosis_http.KosisApiError(*error)
+    return df
+
+# ✅ 파싱 프로세스로 넘길 응답인지 확인하는 함수
+# min_bytes 이상이고 배열('[')로 시작하는 응답만 대상 (errMsg 응답은 JSON 객체이므로 항상 제외)
+def is_deferred_body(body, min_bytes):
+    return bool(min_bytes) and len(body) >= min_bytes and body[:64].lstrip()[:1] == b"["
+
+# ✅ 파싱 프로세스 결과 수거 함수 (생산자 루프에서 호출)
+# 파싱에 성공하면 urls_succeeded를 기록하고, 실패하면 오류 로그를 남기고 None(실패 URL) 반환
+def collect_parsed_body(future, url, logger, metrics=None):
+    try:
+        df, error = future.result()
+    except Exception as e:
+        df, error = None, (None, f"파싱 프로세스 오류: {e}")
+    if error is not None:
+        logger.error(f"❌ 응답 파싱 실패: {url} - {error[1]}")
+        metrics and metrics.inc("urls_failed")
+        return None
+    metrics and metrics.inc("urls_succeeded")
+    return df
+
 # ✅ KOSIS API 요청 함수
 # URL에 대해 요청을 보내고 JSON 응답을 정규화하여 DataFrame으로 반환합니다.
 # - 최대 10회 재시도
-# - 실패시 백오프(2, 4, ..., 20초) 적용
-def fetch_url(url, logger, max_retries=10):
+# - 실패시 지터 지수 백오프(약 2, 4, 8, ... 최대 60초) 적용
+# - limiter가 지정되면 동시 요청 수 제어기(AdaptiveLimiter)의 슬롯 안에서 요청
+# - KOSIS errMsg 응답: 조회결과 없음(30)은 빈 DataFrame, 이용 제한/서버 오류는 재시도, 그 외는 실패 처리
+# - 셀 제한 초과(31) 시 수록시점 범위를 반으로 나누어 현재 작업 스레드에서 차례로 재요청 (추가 스레드 없음)
+#   (요청 슬롯(limiter)은 응답을 받은 시점에 반환되므로 분할 요청을 기다리는 동안 슬롯을 잡고 있지 않음)
+# - archive가 지정되면 성공한 원본 응답(JSON bytes)을 gzip으로 보관 (RawArchive)
+# - 응답 bytes를 kosis_http.decode_json(orjson 우선)으로 디코딩 후 13개 컬럼 DataFrame으로 구성 (parse_kosis_response)
+#   (범주형 변환은 요청 스레드가 아닌 저장 스레드에서 배치 단위로 1회 수행 - concat_kosis_frames)
+# - 디코딩과 errMsg 확인은 limiter 슬롯 안에서 수행 (KOSIS 이용 제한 응답이면 동시 요청 수 축소)
+# - defer_parse_bytes가 지정되면 그 크기 이상의 배열 응답('['로 시작)은 파싱하지 않고 bytes 그대로 반환
+#   (파싱 프로세스 풀 사용 시 stream_fetch_and_insert의 생산자 루프가 파싱 작업 제출, urls_succeeded는 파싱 성공 후 기록)
+#   errMsg 응답은 JSON 객체('{')이므로 크기와 무관하게 요청 스레드에서 바로 디코딩하여 재시도/분할/조회결과 없음 처리
+# - metrics가 지정되면 요청/파싱 시간, URL별 지연시간(재시도 포함), 다운로드 bytes, 재시도 수를 기록
+def fetch_url(url, logger, max_retries=10, limiter=None, archive=None, metrics=None, defer_parse_bytes=None):
+    started = time.perf_counter()
     for attempt in range(1, max_retries + 1):
         try:
             logger.info(f"🌐 요청 시도 {attempt}: {url}")
-            response = requests.get(url, timeout=(120, 300), verify=False)
-            response.raise_for_status()
+            with kosis_http.limiter_slot(limiter):
+                with kosis_metrics.stage(metrics, "http_fetch"):
+                    response = kosis_http.get_session().get(url, timeout=(120, 300), verify=False)
+                    response.raise_for_status()
+                deferred = is_deferred_body(response.content, defer_parse_bytes)
+                if not deferred:
+                    with kosis_metrics.stage(metrics, "json_normalize"):
+                        res_json = kosis_http.decode_json(response.content)
+                        kosis_http.check_kosis_error(res_json)
             logger.info(f"✅ 요청 성공: {url}")  # ✅ 성공 로그 추가
-            df = pd.json_normalize(response.json())
-            df.rename(columns={
-                'PRD_DE': 'TIME_PERIOD',
-                'PRD_SE': 'FREQ',
-                'TBL_ID': 'KOSTAT_TBL_ID',
-                'DT': 'OBS_VALUE'
-            }, inplace=True)
-            return df.reindex(columns=[
-                'KOSTAT_TBL_ID', 'TIME_PERIOD', 'FREQ', 'ITM_ID',
-                'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'OBS_VALUE'
-            ])
+            metrics and metrics.inc("bytes_downloaded", len(response.content))
+            if archive is not None:
+                archive.put(url, response.content)
+            if metrics:
+                metrics.observe("url_latency_seconds", time.perf_counter() - started)
+            if deferred:
+                # 큰 배열 응답은 파싱하지 않고 bytes 그대로 반환 (생산자 루프가 파싱 프로세스 풀에 전달)
+                return response.content
+            metrics and metrics.inc("urls_succeeded")
+            with kosis_metrics.stage(metrics, "json_normalize"):
+                return parse_kosis_response(res_json)
+        except kosis_http.KosisApiError as e:
+            if e.code in kosis_http.KOSIS_NO_DATA_CODES:
+                logger.info(f"ℹ️ 조회결과 없음: {url}")
+                metrics and metrics.inc("urls_no_data")
+                return parse_kosis_response([])
+            if e.code in kosis_http.KOSIS_CELL_LIMIT_CODES:
+                # ✅ 범위 요청이 셀 제한을 넘으면 수록시점 범위를 반으로 나누어 다시 요청
+                halves = kosis_planner.split_range_url(url)
+                if halves:
+                    logger.info(f"✂️ 셀 제한 초과로 범위 분할 요청: {url}")
+                    metrics and metrics.inc("range_splits")
+                    parts = []
+                    for half in halves:
+                        part = fetch_url(half, logger, max_retries, limiter, archive, metrics, defer_parse_bytes)
+                        if part is None:
+                            return None
+                        parts.append(part)
+                    return merge_split_parts(parts, metrics)
+            if not e.throttled:
+                logger.error(f"❌ KOSIS 오류 응답: {url} - {e}")
+                metrics and metrics.inc("urls_failed")
+                return None
+            logger.warning(f"⚠️ KOSIS 이용 제한 ({attempt}): {url} - {e}")
+            metrics and metrics.inc("http_retries")
+            time.sleep(kosis_http.backoff_delay(attempt))
         except Exception as e:
             logger.warning(f"⚠️ 요청 실패 ({attempt}): {url} - {e}")
-            time.sleep(attempt * 2)
+            metrics and metrics.inc("http_retries")
+            time.sleep(kosis_http.backoff_delay(attempt))
     logger.error(f"❌ 모든 재시도 실패: {url}")
+    if metrics:
+        metrics.observe("url_latency_seconds", time.perf_counter() - started)
+        metrics.inc("urls_failed")
+    return None
+
+# ✅ 분할 요청 결과 병합 함수
+# 모두 파싱 전 bytes(JSON 배열)이면 하나의 배열로 이어 붙여 그대로 파싱 프로세스에 넘기고,
+# 일부만 bytes이면 해당 응답을 요청 스레드에서 파싱하여 DataFrame으로 병합
+def merge_split_parts(parts, metrics=None):
+    if all(isinstance(part, bytes) for part in parts):
+        return b"[" + b",".join(part.strip()[1:-1] for part in parts) + b"]"
+    frames = []
+    for part in parts:
+        if isinstance(part, bytes):
+            with kosis_metrics.stage(metrics, "json_normalize"):
+                part = decode_kosis_body(part)
+            metrics and metrics.inc("urls_succeeded")
+        frames.append(part)
+    return concat_kosis_frames(frames)
+
+# ✅ 보관 응답 재적재 함수 (replay 모드)
+# 네트워크 요청 없이 RawArchive에 보관된 원본 응답을 읽어 fetch_url과 같은 형식의 DataFrame으로 반환합니다.
+def replay_archived_url(url, logger, archive, replay_date, defer_parse_bytes=None):
+    body = archive.get(url, replay_date)
+    if body is None:
+        logger.error(f"❌ 보관 응답 없음: {url}")
+        return None
+    if is_deferred_body(body, defer_parse_bytes):
+        return body
+    try:
+        return decode_kosis_body(body)
+    except Exception as e:
+        logger.error(f"❌ 보관 응답 파싱 실패: {url} - {e}")
+        return None
+
+# ✅ 원본 응답 보관소 생성 함수
+# kosis_config.ini의 archive_raw가 true이면 output_dir 아래에 수집일자별로 원본 응답을 보관합니다.
+# - 생성 시 보관 기간(archive_retention_days)이 지난 수집일자 디렉토리 삭제
+def build_archive(config, today, logger=None):
+    if not config.getboolean("DEFAULT", "archive_raw", fallback=False):
+        return None
+    retention_str = config.get("DEFAULT", "archive_retention_days", fallback="14").strip()
+    archive = kosis_archive.RawArchive(
+        root_dir=config.get("DEFAULT", "output_dir"),
+        fetch_date=today,
+        retention_days=int(retention_str) if retention_str else 14,
+    )
+    removed = archive.purge()
+    logger and logger.info(f"🗄️ 원본 응답 보관: {archive.date_dir()} (보관 기간 만료 삭제: {removed})")
+    return archive
+
+# ✅ URL 체크포인트 생성 함수
+# [DEFAULT] checkpoint = true일 때만 CD_COLLECT_KOSIS_URL_LOG에 URL별 상태를 기록합니다.
+# - resume = true이면 같은 수집일자에 이미 완료된 URL은 다시 수집하지 않음
+def build_ledger(config, today, logger=None):
+    if not config.getboolean("DEFAULT", "checkpoint", fallback=False):
+        return None
+    logger and logger.info("📒 URL 체크포인트 기록 사용 (CD_COLLECT_KOSIS_URL_LOG)")
+    return kosis_ledger.UrlLedger(today, logger)
+
+# ✅ 관측값 변경 감지 생성 함수 ([DB] skip_unchanged = true일 때만 사용, 아니면 None)
+# 저장된 지문과 같은 관측값 / 같은 실행에서 중복 수신된 관측값은 저장하지 않습니다. (CD_KOSTAT_OPENAPI_FP)
+def build_fingerprints(config, logger=None):
+    if not config.getboolean("DB", "skip_unchanged", fallback=False):
+        return None
+    logger and logger.info("🧬 관측값 변경 감지 사용: 변경 없는 행/중복 행 저장 생략")
+    return kosis_fingerprint.FingerprintStore(logger)
+
+# ✅ 완료 URL 건너뛰기 함수 (resume 모드)
+# 반환값: (수집할 URL 목록, 이미 완료된 URL 집합)
+def skip_done_urls(ledger, connection, url_list, config, logger, metrics=None):
+    if ledger is None or not config.getboolean("DEFAULT", "resume", fallback=True):
+        return url_list, set()
+    pending_urls, done_urls = ledger.split_done(connection, url_list)
+    if done_urls:
+        logger.info(f"⏭️ 이어받기: 완료 URL {len(done_urls)}건 건너뜀, 남은 URL {len(pending_urls)}건")
+    metrics and metrics.inc("urls_skipped_done", len(done_urls))
+    return pending_urls, done_urls
+
+# ✅ 동시 요청 수 제어기 생성 함수
+# kosis_config.ini의 adaptive_concurrency가 true이면 AdaptiveLimiter를 생성합니다.
+# - min_workers ~ max_workers 범위에서 응답 지연(latency_target)과 오류율에 따라 자동 조절
+# - fetch_url과 메타정보 요청(Kosis)이 같은 제어기를 공유
+def build_limiter(config, max_workers, logger=None):
+    if not config.getboolean("DEFAULT", "adaptive_concurrency", fallback=False):
+        return None
+    min_workers_str = config.get("DEFAULT", "min_workers", fallback="").strip()
+    min_workers = int(min_workers_str) if min_workers_str else max(max_workers // 3, 1)
+    latency_target_str = config.get("DEFAULT", "latency_target", fallback="").strip()
+    latency_target = float(latency_target_str) if latency_target_str else 10.0
+    limiter = kosis_http.AdaptiveLimiter(
+        min_limit=min_workers, max_limit=max_workers, latency_target=latency_target, logger=logger)
+    logger and logger.info(
+        f"🎚️ 적응형 동시성 제어 사용: {limiter.min_limit} ~ {limiter.max_limit} (시작 {limiter.limit})")
+    return limiter
+
+# ✅ 응답 파싱 프로세스 풀 생성 함수 (parse_workers = 0이면 None → 요청 스레드에서 파싱)
+# 요청 스레드는 응답 bytes만 받고 디코딩/파싱은 자식 프로세스에서 수행하여 GIL 경합 없이 파싱을 병렬화합니다.
+# - 요청/저장 스레드와 DB 연결을 가진 프로세스를 fork하지 않도록 spawn 방식으로 시작
+def build_parse_pool(parse_workers, logger=None):
+    if parse_workers <= 0:
+        return None
+    logger and logger.info(f"🧮 파싱 프로세스 풀 사용: {parse_workers}개 프로세스")
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn"))
+
+# ✅ KOSIS 메타 API 객체 생성 함수
+# kosis_config.ini의 [CACHE] 섹션이 활성화된 경우 디스크 캐시(KosisCache)를 연결합니다.
+# - ttl_<서비스명> 또는 ttl_<서비스명>/<상세 서비스명> 형태로 서비스별 TTL(초) 지정
+def build_kosis_api(config, license_key, logger=None, limiter=None):
+    base_url = config.get("KOSIS", "base_url", fallback="").strip() or None
+    cache = build_kosis_cache(config, logger)
+    return k_r.Kosis(license_key, cache=cache, limiter=limiter, base_url=base_url)
+
+# ✅ KOSIS 메타 응답 캐시 생성 함수 ([CACHE] enabled = false이면 None)
+def build_kosis_cache(config, logger=None):
+    if not config.getboolean("CACHE", "enabled", fallback=False):
+        return None
+
+    ttl = {
+        key[len("ttl_"):]: int(value)
+        for key, value in config.items("CACHE")
+        if key.startswith("ttl_") and value.strip()
+    }
+    cache = k_r.KosisCache(
+        cache_dir=config.get("CACHE", "cache_dir"),
+        ttl=ttl,
+        default_ttl=config.getint("CACHE", "default_ttl", fallback=86400),
+        max_bytes=config.getint("CACHE", "max_mb", fallback=256) * 1024 * 1024,
+    )
+    logger and logger.info(f"🗃️ 메타 응답 캐시 사용: {cache.cache_dir} (TTL: {ttl})")
+    return cache
+
+# ✅ 자료갱신일 메타정보 요청 함수 (단일 통계표)
+# 통계표 1건에 대해 '자료갱신일' 메타를 레코드 모드(get_records)로 요청하고
+# 각 레코드 끝에 org_id/tbl_id/col_url 값을 붙여 튜플 목록으로 반환합니다. (DataFrame 생성 없음)
+# - 최대 5회 재시도
+# - 실패시 지터 지수 백오프(약 2, 4, 8, 16, 32초) 적용
+META_EXTRA_COLUMNS = ['org_id', 'tbl_id', 'col_url']
+
+def fetch_meta(api, row, idx, total, logger, max_retries=5, metrics=None):
+    logger.debug(f"🔍 메타정보 요청 [{idx + 1}/{total}]: ORG_ID={row['ORG_ID']} / TBL_ID={row['TBL_ID']}")
+    extra = (row['ORG_ID'], row['TBL_ID'], row['URL'])
+    for attempt in range(1, max_retries + 1):
+        try:
+            records = api.get_records(
+                service_name='통계표설명',
+                detail_service_name='자료갱신일',
+                orgId=row['ORG_ID'],
+                tblId=row['TBL_ID']
+            )
+            if records is None:
+                raise ValueError("메타 응답 없음")
+            logger.debug(f"✅ 메타정보 요청 성공 [{idx + 1}/{total}]")
+            return [record + extra for record in records]
+        except Exception as e:
+            logger.warning(f"⚠️ 메타 요청 실패 (시도 {attempt}) [{idx + 1}/{total}]: {e}")
+            metrics and metrics.inc("meta_retries")
+            time.sleep(kosis_http.backoff_delay(attempt))
+    logger.error(f"❌ 메타정보 모든 재시도 실패 [{idx + 1}/{total}]: TBL_ID={row['TBL_ID']}")
     return None
 
+# ✅ 자료갱신일 메타정보 병렬 요청 함수
+# 수집 대상 통계표 목록 전체에 대해 fetch_meta()를 제한된 동시성으로 실행합니다.
+# - 동시 요청 수는 kosis_config.ini의 meta_max_workers로 제한
+# - executor.map을 사용하므로 결과는 입력(df_org_tbl) 순서를 그대로 유지
+# - 재시도/백오프는 통계표별로 fetch_meta() 내부에서 독립적으로 수행
+# - 통계표별 레코드를 모두 모은 뒤 DataFrame은 마지막에 1번만 생성 (반환값: 메타 DataFrame)
+def fetch_meta_parallel(api, df_org_tbl, logger, meta_max_workers, metrics=None):
+    rows = df_org_tbl.to_dict("records")
+    total = len(rows)
+    received, records = 0, []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=meta_max_workers) as executor:
+        metas = executor.map(
+            lambda args: fetch_meta(api, args[1], args[0], total, logger, metrics=metrics),
+            enumerate(rows)
+        )
+        for meta in metas:
+            if meta is not None:
+                received += 1
+                records.extend(meta)
+    logger.info(f"🧾 메타정보 수신: {received}/{total} (동시 요청 수: {meta_max_workers})")
+    columns = api.get_schema('통계표설명', '자료갱신일') + META_EXTRA_COLUMNS
+    return k_r.records_to_frame(records, columns)
+
+# ✅ 자료갱신일 메타정보 비동기 요청 함수 (meta_async = true)
+# AsyncKosis.get_many()로 스레드 1개에서 meta_max_workers개씩 동시에 요청합니다.
+# - 요청별 timeout, 재시도(지터 지수 백오프)는 AsyncKosis 내부에서 수행
+# - api(kosis_reader.Kosis)의 응답 캐시와 동시 요청 수 제어기(limiter)를 동기 경로와 함께 사용
+#   (같은 통계표가 여러 번 있으면 1번만 요청)
+# - 반환 형식은 fetch_meta_parallel()과 같은 메타 DataFrame (입력 순서 유지)
+def fetch_meta_async(api, config, df_org_tbl, logger, meta_max_workers, metrics=None):
+    rows = df_org_tbl.to_dict("records")
+    requests_ = [
+        {"service_name": '통계표설명', "detail_service_name": '자료갱신일', "orgId": row['ORG_ID'], "tblId": row['TBL_ID']}
+        for row in rows
+    ]
+    results = kosis_async.run_many(
+        api.service_key, requests_, concurrency=meta_max_workers,
+        cache=api.cache, limiter=api.limiter, base_url=api.base_url,
+        timeout=config.getfloat("DEFAULT", "meta_timeout", fallback=60),
+        max_connections=meta_max_workers, retries=4)
+
+    records = []
+    for row, result in zip(rows, results):
+        if result is None:
+            logger.error(f"❌ 메타정보 요청 실패: TBL_ID={row['TBL_ID']}")
+            metrics and metrics.inc("meta_failed")
+            continue
+        extra = (row['ORG_ID'], row['TBL_ID'], row['URL'])
+        records.extend(record + extra for record in result)
+    received = sum(result is not None for result in results)
+    logger.info(f"🧾 메타정보 수신(async): {received}/{len(rows)} (동시 요청 수: {meta_max_workers})")
+    columns = k_r.get_schema('통계표설명', '자료갱신일') + META_EXTRA_COLUMNS
+    return k_r.records_to_frame(records, columns)
+
+# ✅ 통계표 분류 구성 병렬 요청 함수 (split_large_tables = true)
+# 통계표설명/분류항목으로 통계표별 항목/분류값 목록을 조회하여 kosis_planner.TableDims로 반환합니다.
+# - 반환값: {(ORG_ID, TBL_ID): TableDims} (응답이 없는 통계표는 제외 → 분할하지 않고 기존 URL로 수집)
+def fetch_table_dims(api, df_org_tbl, logger, meta_max_workers, metrics=None):
+    tables = list(dict.fromkeys(zip(df_org_tbl['ORG_ID'], df_org_tbl['TBL_ID'])))
+
+    def fetch(table):
+        records = api.get_records('통계표설명', '분류항목', as_dict=True, orgId=table[0], tblId=table[1])
+        if records is None:
+            metrics and metrics.inc("dims_failed")
+            return None
+        return kosis_planner.table_dims((r['분류ID'], r['분류값ID'], r['분류값순번']) for r in records)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=meta_max_workers) as executor:
+        dims = dict(zip(tables, executor.map(fetch, tables)))
+    dims = {table: d for table, d in dims.items() if d is not None and (d.items or d.objs)}
+    logger.info(f"📐 분류항목 수신: {len(dims)}/{len(tables)}")
+    return dims
+
+# ✅ userStatsId 선택 범위 확인 요청 함수 (split_large_tables = true)
+# 분할 후보 요청의 userStatsId URL을 수록시점 1개로 요청하여, 저장된 선택 범위의 항목/분류값 목록을
+# kosis_planner.selection_dims로 구성합니다. (분할 조각이 선택 범위 밖의 행을 수집하지 않도록 제한하는 기준)
+# - 반환값: {URL: TableDims} (요청 실패/빈 응답 URL은 제외 → 해당 요청은 분할하지 않음)
+def fetch_selection_dims(urls, logger, meta_max_workers, metrics=None):
+    def fetch(url):
+        try:
+            response = kosis_http.get_session().get(url, timeout=(120, 300), verify=False)
+            response.raise_for_status()
+            res_json = kosis_http.decode_json(response.content)
+            kosis_http.check_kosis_error(res_json)
+        except Exception as e:
+            logger.warning(f"⚠️ 선택 범위 확인 요청 실패 (분할하지 않음): {url} - {e}")
+            metrics and metrics.inc("dims_failed")
+            return None
+        return kosis_planner.selection_dims(res_json if isinstance(res_json, list) else [res_json])
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=meta_max_workers) as executor:
+        dims = dict(zip(urls, executor.map(fetch, urls)))
+    dims = {url: d for url, d in dims.items() if d is not None and d.items}
+    logger.info(f"📐 선택 범위 확인: {len(dims)}/{len(urls)}")
+    return dims
+
 # ✅ 수집 상태 플래그 삽입/갱신 함수
 # 상태 테이블(CD_COLLECT_KOSIS_OPENAPI_YN)에 수집 여부를 표시합니다.
 # - is_init=True일 경우: DELETE 후 INSERT (초기화)
@@ -283,143 +800,488 @@ def upsert_complete_flag(connection, today, complete_yn, is_init=False, logger=N
             logger and logger.error(f"❌ 상태 플래그 업데이트 실패: {e}", exc_info=True)
             raise
 
+# ✅ CD_KOSTAT_OPENAPI_VAL 저장 SQL
+# - insert : 단순 INSERT (기존 방식)
+# - upsert : 자연키(KOSTAT_TBL_ID, TIME_PERIOD, ITM_ID, C1~C8) 기준 MERGE
+#   - 기존 행은 값(FREQ, OBS_VALUE)이 달라진 경우에만 UPDATE하여 재실행 시 불필요한 redo를 줄임
+#   - C1~C8, ITM_ID는 NULL 허용이므로 DECODE로 NULL끼리 같은 값으로 비교
+#   - DECODE 비교는 인덱스 접근 조건이 될 수 없어 (KOSTAT_TBL_ID, TIME_PERIOD) 등호 조건으로만 인덱스를 탐색하므로
+#     아래 인덱스가 없으면 행마다 테이블 전체를 읽음 (ITM_ID, C1~C8을 뒤에 포함하면 DECODE 비교도 인덱스 안에서 처리)
+#       CREATE INDEX IX_KOSTAT_OPENAPI_VAL_NK ON CD_KOSTAT_OPENAPI_VAL (
+#           KOSTAT_TBL_ID, TIME_PERIOD, ITM_ID, C1, C2, C3, C4, C5, C6, C7, C8
+#       );
+KOSIS_VAL_COLUMNS = ['KOSTAT_TBL_ID', 'TIME_PERIOD', 'FREQ', 'ITM_ID',
+                     'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'OBS_VALUE',
+                     'Z_REG_DTM', 'Z_REGR_ID', 'Z_REG_SCR_ID', 'Z_REG_SVC_ID',
+                     'Z_MOD_DTM', 'Z_MODR_ID', 'Z_MOD_SCR_ID', 'Z_MOD_SVC_ID']
+
+KOSIS_VAL_INSERT_SQL = """
+    INSERT INTO CD_KOSTAT_OPENAPI_VAL (
+        KOSTAT_TBL_ID, TIME_PERIOD, FREQ, ITM_ID,
+        C1, C2, C3, C4, C5, C6, C7, C8, OBS_VALUE,
+        Z_REG_DTM, Z_REGR_ID, Z_REG_SCR_ID, Z_REG_SVC_ID,
+        Z_MOD_DTM, Z_MODR_ID, Z_MOD_SCR_ID, Z_MOD_SVC_ID
+    ) VALUES (
+        :1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12,
+        :13, :14, :15, :16, :17, :18, :19, :20, :21
+    )
+"""
+
+KOSIS_VAL_MERGE_SQL = """
+    MERGE INTO CD_KOSTAT_OPENAPI_VAL t
+    USING (
+        SELECT :1 AS KOSTAT_TBL_ID, :2 AS TIME_PERIOD, :3 AS FREQ, :4 AS ITM_ID,
+               :5 AS C1, :6 AS C2, :7 AS C3, :8 AS C4, :9 AS C5, :10 AS C6, :11 AS C7, :12 AS C8,
+               :13 AS OBS_VALUE,
+               :14 AS Z_REG_DTM, :15 AS Z_REGR_ID, :16 AS Z_REG_SCR_ID, :17 AS Z_REG_SVC_ID,
+               :18 AS Z_MOD_DTM, :19 AS Z_MODR_ID, :20 AS Z_MOD_SCR_ID, :21 AS Z_MOD_SVC_ID
+        FROM dual
+    ) s
+    ON (
+        t.KOSTAT_TBL_ID = s.KOSTAT_TBL_ID AND t.TIME_PERIOD = s.TIME_PERIOD
+        AND DECODE(t.ITM_ID, s.ITM_ID, 1, 0) = 1
+        AND DECODE(t.C1, s.C1, 1, 0) = 1 AND DECODE(t.C2, s.C2, 1, 0) = 1
+        AND DECODE(t.C3, s.C3, 1, 0) = 1 AND DECODE(t.C4, s.C4, 1, 0) = 1
+        AND DECODE(t.C5, s.C5, 1, 0) = 1 AND DECODE(t.C6, s.C6, 1, 0) = 1
+        AND DECODE(t.C7, s.C7, 1, 0) = 1 AND DECODE(t.C8, s.C8, 1, 0) = 1
+    )
+    WHEN MATCHED THEN UPDATE SET
+        t.FREQ = s.FREQ, t.OBS_VALUE = s.OBS_VALUE,
+        t.Z_MOD_DTM = s.Z_MOD_DTM, t.Z_MODR_ID = s.Z_MODR_ID,
+        t.Z_MOD_SCR_ID = s.Z_MOD_SCR_ID, t.Z_MOD_SVC_ID = s.Z_MOD_SVC_ID
+        WHERE DECODE(t.OBS_VALUE, s.OBS_VALUE, 1, 0) = 0 OR DECODE(t.FREQ, s.FREQ, 1, 0) = 0
+    WHEN NOT MATCHED THEN INSERT (
+        KOSTAT_TBL_ID, TIME_PERIOD, FREQ, ITM_ID,
+        C1, C2, C3, C4, C5, C6, C7, C8, OBS_VALUE,
+        Z_REG_DTM, Z_REGR_ID, Z_REG_SCR_ID, Z_REG_SVC_ID,
+        Z_MOD_DTM, Z_MODR_ID, Z_MOD_SCR_ID, Z_MOD_SVC_ID
+    ) VALUES (
+        s.KOSTAT_TBL_ID, s.TIME_PERIOD, s.FREQ, s.ITM_ID,
+        s.C1, s.C2, s.C3, s.C4, s.C5, s.C6, s.C7, s.C8, s.OBS_VALUE,
+        s.Z_REG_DTM, s.Z_REGR_ID, s.Z_REG_SCR_ID, s.Z_REG_SVC_ID,
+        s.Z_MOD_DTM, s.Z_MODR_ID, s.Z_MOD_SCR_ID, s.Z_MOD_SVC_ID
+    )
+"""
+
+# ✅ URL 로그 표본 추출기 생성 함수
+# url_log_sample_rate < 1이면 해당 비율의 URL만 요청 시도/성공 INFO 로그를 남기고 (WARNING 이상은 항상 출력),
+# url_log_summary_interval > 0이면 생략한 로그 건수를 주기마다 1줄로 요약합니다.
+def build_url_log_sampler(config, logger):
+    sample_rate = config.getfloat("DEFAULT", "url_log_sample_rate", fallback=1.0)
+    summary_interval = config.getfloat("DEFAULT", "url_log_summary_interval", fallback=0)
+    sampler = kosis_logging.UrlLogSampler(logger, sample_rate, summary_interval)
+    if sampler.enabled:
+        logger.info(f"🔇 URL 로그 표본 추출: {sampler.sample_rate:.0%} (요약 주기 {summary_interval:g}초)")
+    return sampler
+
+# ✅ 파싱 프로세스 수 조회 함수 ([DEFAULT] parse_workers, 0이면 파싱 프로세스 풀 미사용)
+def get_parse_workers(config):
+    return max(0, get_int_option(config, "parse_workers", 0))
+
+# ✅ 파싱 프로세스로 넘길 최소 응답 크기 조회 함수 ([DEFAULT] parse_min_bytes, 이보다 작은 응답은 요청 스레드에서 파싱)
+def get_parse_min_bytes(config):
+    return max(1, get_int_option(config, "parse_min_bytes", 262144))
+
+# ✅ 병렬 저장 스레드 수 조회 함수 ([DB] writers, 세션 풀 최대 연결 수를 넘으면 경고)
+def get_db_writers(config, logger=None):
+    writers = max(1, config.getint("DB", "writers", fallback=1))
+    pool_max = config.getint("DB", "max", fallback=writers)
+    if writers > pool_max and logger:
+        logger.warning(f"⚠️ 저장 스레드 수({writers})가 세션 풀 최대 연결 수({pool_max})보다 많아 연결 대기가 발생할 수 있습니다.")
+    return writers
+
+# ✅ DB 저장 옵션 조회 함수
+# kosis_config.ini [DB] 섹션의 write_mode / chunk_size / commit_interval 값을 읽습니다.
+def get_write_options(config):
+    write_mode = config.get("DB", "write_mode", fallback="insert").strip().lower() or "insert"
+    if write_mode not in ("insert", "upsert"):
+        raise ValueError(f"지원하지 않는 write_mode: {write_mode} (insert/upsert)")
+    return {
+        "mode": write_mode,
+        "chunk_size": config.getint("DB", "chunk_size", fallback=1000),
+        "commit_interval": config.getint("DB", "commit_interval", fallback=1),
+    }
+
 # ✅ KOSIS 데이터 Oracle DB Insert 함수
-# 데이터프레임을 1000건 단위로 나누어 CD_KOSTAT_OPENAPI_VAL 테이블에 저장합니다.
+# 데이터프레임을 chunk_size건 단위로 나누어 CD_KOSTAT_OPENAPI_VAL 테이블에 저장합니다.
 # - 포지셔널 바인딩 방식 (:1 ~ :21)
 # - setinputsizes()는 제거되어야 함 (혼용 시 오류 발생)
-def insert_kosis_data(df_final: pd.DataFrame, connection, logger):
+# - batcherrors=True로 실행하여 오류 행만 제외하고 나머지 행은 저장
+# - arraydmlrowcounts=True로 행별 처리 건수를 받아 실제로 INSERT/UPDATE된 행만 저장 건수로 집계
+#   (upsert에서 값이 같아 UPDATE되지 않은 행은 unchanged_count로 따로 집계)
+# - commit_interval개 청크마다 커밋 (청크 자체가 실패하면 커밋되지 않은 청크 전체 롤백)
+# - report(dict)를 넘기면 제외 건수(rejected_count), 롤백 건수(failed_count), 변경 없는 건수(unchanged_count),
+#   제외된 행 위치(rejected_rows)와 롤백된 행 위치(failed_rows)를 기록 (df_final 기준 0부터 시작하는 위치)
+def insert_kosis_data(df_final: pd.DataFrame, connection, logger, mode="insert", chunk_size=1000, commit_interval=1,
+                      report=None):
     """
-    Oracle DB에 KOSIS 데이터를 bulk insert (최적화된 array binding 사용)
+    Oracle DB에 KOSIS 데이터를 bulk insert/upsert (array DML + batch error 사용)
     """
 
-    insert_sql = """
-        INSERT INTO CD_KOSTAT_OPENAPI_VAL (
-            KOSTAT_TBL_ID, TIME_PERIOD, FREQ, ITM_ID,
-            C1, C2, C3, C4, C5, C6, C7, C8, OBS_VALUE,
-            Z_REG_DTM, Z_REGR_ID, Z_REG_SCR_ID, Z_REG_SVC_ID,
-            Z_MOD_DTM, Z_MODR_ID, Z_MOD_SCR_ID, Z_MOD_SVC_ID
-        ) VALUES (
-            :1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12,
-            :13, :14, :15, :16, :17, :18, :19, :20, :21
-        )
-    """
-
-    chunk_size = 1000
-    cols = ['KOSTAT_TBL_ID', 'TIME_PERIOD', 'FREQ', 'ITM_ID',
-            'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'OBS_VALUE',
-            'Z_REG_DTM', 'Z_REGR_ID', 'Z_REG_SCR_ID', 'Z_REG_SVC_ID',
-            'Z_MOD_DTM', 'Z_MODR_ID', 'Z_MOD_SCR_ID', 'Z_MOD_SVC_ID']
+    sql = KOSIS_VAL_MERGE_SQL if mode == "upsert" else KOSIS_VAL_INSERT_SQL
+    cols = KOSIS_VAL_COLUMNS
 
     saved_count = 0  # ✅ 총 저장 건수 누적 변수
+    rejected_count = 0  # ✅ batch error로 제외된 건수
+    pending_count = 0  # ✅ 커밋 대기 중인 건수
+    pending_chunks = 0
+    failed_count = 0  # ✅ 청크 실패로 롤백된 건수
+    unchanged_count = 0  # ✅ upsert에서 값이 같아 UPDATE하지 않은 건수
+    rejected_rows, failed_rows = [], []  # ✅ 제외/롤백된 행 위치
+    pending_start = 0  # ✅ 커밋 대기 중인 첫 행 위치
     with connection.cursor() as cursor:
         for start in range(0, len(df_final), chunk_size):
-            chunk_df = df_final.iloc[start:start + chunk_size][cols]
-            rows = [tuple(row) for row in chunk_df.itertuples(index=False, name=None)]
+            rows = bind_rows(df_final.iloc[start:start + chunk_size][cols])
+            end = start + len(rows) - 1
             try:
-                cursor.executemany(insert_sql, rows)
-                connection.commit()
-                saved_count += len(chunk_df)  # ✅ 저장 건수 누적
-                logger.info(f"💾 저장 완료: rows {start} ~ {start + len(chunk_df) - 1}")
+                cursor.executemany(sql, rows, batcherrors=True, arraydmlrowcounts=True)
+                batch_errors = cursor.getbatcherrors()
+                written = sum(cursor.getarraydmlrowcounts())
+                for error in batch_errors[:5]:
+                    logger.error(f"❌ 행 저장 실패 (row {start + error.offset}): {error.message} | {rows[error.offset]}")
+                if batch_errors:
+                    logger.warning(f"⚠️ batch error {len(batch_errors)}건 제외 (rows {start} ~ {end})")
+                rejected_count += len(batch_errors)
+                rejected_rows.extend(start + error.offset for error in batch_errors)
+                unchanged_count += len(rows) - len(batch_errors) - written
+                pending_count += written
+                pending_chunks += 1
+                if pending_chunks >= commit_interval:
+                    connection.commit()
+                    saved_count += pending_count  # ✅ 저장 건수 누적
+                    pending_count, pending_chunks = 0, 0
+                    pending_start = start + len(rows)
+                logger.info(f"💾 저장 완료: rows {start} ~ {end}")
             except Exception as e:
-                logger.error(f"❌ Insert 실패 (rows {start} ~ {start + len(chunk_df) - 1}): {e}", exc_info=True)
+                logger.error(f"❌ {mode} 실패 (rows {start} ~ {end}, 미커밋 {pending_count}건 롤백): {e}", exc_info=True)
                 connection.rollback()
-        logger.info(f"✅ 총 저장 건수: {saved_count:,} rows")
-
-# ✅ 메인 수집 실행 함수
-# 1. 수집 대상 통계표 목록 조회
-# 2. 각 통계표에 대해 자료갱신일 메타 요청
-# 3. 갱신일 기준 필터링 (execute_date - days_back ~ execute_date)
-# 4. 수집 URL 생성 및 병렬 요청
-# 5. 수집된 결과 정제 후 Oracle 저장
-# 6. 성공률 통계 및 COMPLETE_YN 상태 갱신
-def run_kosis_process_logging(execute_dates, config, today, days_back, pool, logger, max_workers):
-    start_time = time.time()
-    all_data = []
-    date_stats = []  # ✅ 날짜별 수집 통계 저장 리스트 추가
-    failed_dates = []  # 💥 DB 저장 실패 일자 저장용
-    logger.info(f"✅ KOSIS 수집 프로세스 시작 | 대상일자: {execute_dates}")
-
-    connection = get_connection_with_retry(pool)
-    logger.info("🔗 Oracle DB 연결 성공")
-
-    license_key = config.get("KOSIS", "license_key")
-    kosis_id = config.get("KOSIS", "kosis_id")
-
-    for execute_date in execute_dates:
-        logger.info(f"🟡 수집 시작: {execute_date}")
-
-        cursor = connection.cursor()
-
-        # kosis_config.ini에서 필터용 TBL_ID 목록 불러오기
-        tbl_id_raw = config.get("DEFAULT", "tbl_id", fallback="").strip()
-        tbl_id = [tbl.strip() for tbl in tbl_id_raw.split(',') if tbl.strip()]
-
-        # SQL 조건절 조립
-        if tbl_id:
-            # 바인딩 가능한 IN 조건 생성 (:1, :2, ...)
-            placeholders = ','.join([f':{i + 1}' for i in range(len(tbl_id))])
-            sql = f"""
-                SELECT ORG_ID, TBL_ID, URL
-                FROM CD_KOSIS_REQ_MPP_P
-                WHERE URL IS NOT NULL AND TBL_ID IN ({placeholders})
-            """
-            cursor.execute(sql, tbl_id)
-            logger.info(f"🔎 TBL_ID 필터 적용됨: {tbl_id}")
-        else:
-            sql = "SELECT ORG_ID, TBL_ID, URL FROM CD_KOSIS_REQ_MPP_P WHERE URL IS NOT NULL"
-            cursor.execute(sql)
-
-        # 결과 → DataFrame
-        df_org_tbl = pd.DataFrame(cursor.fetchall(), columns=[col[0] for col in cursor.description])
-
-        dup_check = df_org_tbl.duplicated(subset=['TBL_ID'], keep=False)
-        if dup_check.any():
-            dup_list = df_org_tbl[dup_check]['TBL_ID'].drop_duplicates().tolist()
-            logger.warning(f"⚠️ 중복된 TBL_ID 존재 ({len(dup_list)}개): {dup_list}")
-
-        # ✅ 이후 실제 처리용으로는 완전 중복 제거
-        df_org_tbl = df_org_tbl.drop_duplicates(subset=['TBL_ID', 'ORG_ID', 'URL'])
-
-        cursor.close()
-
-        logger.info(f"📋 수집 대상 통계표 수: {len(df_org_tbl)}개")
-        tbl_ids = df_org_tbl['TBL_ID'].tolist()
-        logger.info("📄 수집 대상 목록:")
-        for i, tbl_id in enumerate(tbl_ids, 1):
-            logger.info(f"{i}. {tbl_id}")
-
-        api = k_r.Kosis(license_key)
-        results = []
-
-        for idx, row in df_org_tbl.iterrows():
-            logger.debug(f"🔍 메타정보 요청 [{idx + 1}/{len(df_org_tbl)}]: ORG_ID={row['ORG_ID']} / TBL_ID={row['TBL_ID']}")
-            for attempt in range(1, 6):
-                try:
-                    meta = api.get_data(
-                        service_name='통계표설명',
-                        detail_service_name='자료갱신일',
-                        orgId=row['ORG_ID'],
-                        tblId=row['TBL_ID']
-                    )
-                    meta['org_id'], meta['tbl_id'], meta['col_url'] = row['ORG_ID'], row['TBL_ID'], row['URL']
-                    results.append(meta)
-                    logger.debug(f"✅ 메타정보 요청 성공 [{idx + 1}/{len(df_org_tbl)}]")
-                    break
-                except Exception as e:
-                    logger.warning(f"⚠️ 메타 요청 실패 (시도 {attempt}) [{idx + 1}/{len(df_org_tbl)}]: {e}")
-                    time.sleep(attempt * 2)
-
-        if not results:
-            logger.warning(f"❌ 메타 정보 없음: {execute_date}")
-            continue
-
-
-        df_meta = pd.concat(results, ignore_index=True)
-
-        if df_meta.empty:
-            logger.warning(f"⚠️ 필터링 후 데이터 없음: {execute_date}")
+                failed_count += pending_count + len(rows)
+                failed_rows.extend(range(pending_start, start + len(rows)))
+                pending_count, pending_chunks = 0, 0
+                pending_start = start + len(rows)
+        if pending_chunks:
+            connection.commit()
+            saved_count += pending_count
+        logger.info(f"✅ 총 저장 건수: {saved_count:,} rows (mode={mode}, 제외: {rejected_count:,} rows"
+                    f"{f', 변경 없음: {unchanged_count:,} rows' if mode == 'upsert' else ''})")
+    if report is not None:
+        report.update({"rejected_count": rejected_count, "failed_count": failed_count, "unchanged_count": unchanged_count,
+                       "rejected_rows": rejected_rows, "failed_rows": failed_rows})
+    return saved_count
+
+# ✅ DB 바인딩 행 변환 함수
+# 청크 DataFrame을 executemany용 튜플 목록으로 변환합니다.
+# - 범주형 컬럼은 이 시점에만 Python 문자열로 변환하고 결측값은 None(DB NULL)으로 바인딩
+def bind_rows(chunk_df):
+    columns = []
+    for col in chunk_df.columns:
+        series = chunk_df[col]
+        values = series.to_numpy(dtype=object)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            null_mask = series.isna().to_numpy()
+            if null_mask.any():
+                values[null_mask] = None
+        columns.append(values)
+    return list(zip(*columns))
+
+# ✅ 수집 데이터 정규화 함수 (단일 패스)
+# 기존 정제 경로(replace → notna → isin → to_numeric → dropna → set_common_cols)와 같은 결과를
+# 컬럼별 numpy 배열 연산 한 번으로 만듭니다. (기존 경로는 benchmarks/baselines.py에 비교 기준으로 보관)
+# - OBS_VALUE가 NaN/None, '-', '...'이거나 KOSTAT_TBL_ID가 없는 행을 하나의 마스크로 제거
+# - OBS_VALUE 수치 변환(변환 불가 값은 NaN), 문자열 컬럼의 NaN은 None(DB NULL)으로 변환
+# - 공통 컬럼(Z_*)은 상수로 한 번에 채움 (빈 프레임 concat / fillna / infer_objects 없음)
+# - 범주형 컬럼은 그대로 유지하고, 저메모리 표현(parse_kosis_compact) 입력은 OBS_VALUE 필터를 생략
+# - 남은 행은 입력 프레임의 인덱스를 그대로 유지 (저장 스레드가 배치 행 → URL 추적에 사용)
+def normalize_kosis_frame(df, now=None):
+    now = now or datetime.now(ZoneInfo("Asia/Seoul"))
+    n_rows = len(df)
+
+    compact = pd.api.types.is_float_dtype(df['OBS_VALUE'].dtype)
+    if compact:
+        # 저메모리 표현(parse_kosis_compact)은 파싱 시 OBS_VALUE 비정상값 제거/수치 변환 완료
+        obs = df['OBS_VALUE'].to_numpy()
+        mask = np.ones(n_rows, dtype=bool)
+    else:
+        obs = df['OBS_VALUE'].to_numpy(dtype=object)
+        mask = ~pd.isna(obs) & ~np.isin(obs, KOSIS_OBS_SENTINELS)
+    mask &= df['KOSTAT_TBL_ID'].notna().to_numpy()
+    keep = mask.all()
+    categorical = isinstance(df['KOSTAT_TBL_ID'].dtype, pd.CategoricalDtype)
+
+    data = {}
+    for col in KOSIS_VAL_COLUMNS[:12]:
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+            # 범주형은 그대로 유지 (결측값은 bind_rows에서 None으로 바인딩)
+            data[col] = df[col].array if keep else df[col].array[mask]
             continue
-
+        values = df[col].to_numpy(dtype=object) if col in df.columns else np.full(n_rows, None, dtype=object)
+        values = values if keep else values[mask]
+        null_mask = pd.isna(values)
+        if null_mask.any():
+            values = values.copy() if keep else values
+            values[null_mask] = None
+        data[col] = values
+    data['OBS_VALUE'] = pd.to_numeric(obs if keep else obs[mask], errors='coerce')
+
+    common = {'Z_REGR_ID': 'bok', 'Z_REG_SCR_ID': 'python', 'Z_REG_SVC_ID': 'python',
+              'Z_MODR_ID': 'bok', 'Z_MOD_SCR_ID': 'python', 'Z_MOD_SVC_ID': 'python'}
+    if categorical:
+        # 범주형 입력은 공통 문자열 컬럼도 고유값 1개짜리 범주형(행당 1 byte 코드)으로 채움
+        n_kept = len(data['OBS_VALUE'])
+        common = {col: pd.Categorical.from_codes(np.zeros(n_kept, dtype=np.int8), [value])
+                  for col, value in common.items()}
+    data.update({'Z_REG_DTM': now, 'Z_MOD_DTM': now, **common})
+    index = df.index if keep else df.index[mask]
+    return pd.DataFrame(data, index=index, copy=False)[KOSIS_VAL_COLUMNS]
+
+# ✅ DB 저장 소비자 스레드 함수
+# 큐에서 수집 결과((url, DataFrame))를 꺼내 batch_rows 이상 쌓이면 정제 후 즉시 저장합니다.
+# - None(종료 신호)을 받으면 남은 데이터를 저장하고 종료
+# - DataFrame이 None이면 요청 실패 URL (ledger에 'N'으로 기록)
+# - ledger가 지정되면 배치 커밋 후 배치에 포함된 URL을 'Y'로 기록
+#   (롤백된 청크에 행이 포함된 URL만 'N' - 배치 행 인덱스로 행이 온 URL을 추적)
+# - fingerprints(kosis_fingerprint.FingerprintStore)가 지정되면 변경 없는 행/중복 행을 저장 전에 제외하고,
+#   batch error로 제외된 행과 롤백된 청크의 행을 뺀 나머지 행의 지문을 갱신
+# - 결과(저장 건수, 예외)는 stats dict에 기록
+def _insert_worker(data_queue, connection, logger, batch_rows, stats, write_opts, metrics=None, ledger=None,
+                   fingerprints=None):
+    buffer, buffered_rows = [], 0
+    entries = []  # ✅ (url, 응답 행 수) - 배치 커밋 후 ledger 기록 대상
+    failed_urls = []
+
+    def flush():
+        nonlocal buffer, buffered_rows, entries, failed_urls
+        failed_entries = set()  # ✅ 롤백된 행이 있는 entries 위치
+        if buffer:
+            # 병합 후 배치 행 위치 → entries 위치 (정제/변경 감지 후에도 행 인덱스로 유지)
+            row_entries = np.repeat(np.arange(len(entries)), [rows for _, rows in entries])
+            with kosis_metrics.stage(metrics, "cleaning"):
+                df_batch = normalize_kosis_frame(concat_kosis_frames(buffer, categorize=True))
+            buffer, buffered_rows = [], 0
+            logger.info(f"📦 마이크로 배치 정제된 데이터 수: {len(df_batch)}")
+            batch_fingerprints = None
+            if fingerprints is not None:
+                with kosis_metrics.stage(metrics, "change_detect"):
+                    df_batch, batch_fingerprints, fp_stats = fingerprints.filter_changed(connection, df_batch)
+                metrics and metrics.inc("rows_unchanged", fp_stats["unchanged"])
+                metrics and metrics.inc("rows_duplicate", fp_stats["duplicate"])
+                logger.info(f"🧬 변경 감지: 저장 {len(df_batch)}건 (변경 없음 {fp_stats['unchanged']}건, "
+                            f"중복 {fp_stats['duplicate']}건 제외)")
+            report = {}
+            if len(df_batch):
+                with kosis_metrics.stage(metrics, "db_insert"):
+                    saved_count = insert_kosis_data(df_batch, connection, logger, report=report, **write_opts)
+                stats["saved_count"] += saved_count
+                metrics and metrics.inc("rows_written", saved_count)
+            stats["batch_count"] += 1
+            stats["rejected_count"] += report.get("rejected_count", 0)
+            stats["failed_count"] += report.get("failed_count", 0)
+            if report.get("failed_rows"):
+                failed_index = df_batch.index.to_numpy()[np.asarray(report["failed_rows"], dtype=np.intp)]
+                failed_entries = set(row_entries[failed_index].tolist())
+            if fingerprints is not None:
+                fingerprints.commit(connection, batch_fingerprints,
+                                    skip_rows=report.get("rejected_rows", []) + report.get("failed_rows", []))
+        if ledger is not None:
+            ledger.record(connection, [(url, 'N' if i in failed_entries else 'Y', rows)
+                                       for i, (url, rows) in enumerate(entries)]
+                          + [(url, 'N', 0) for url in failed_urls])
+        entries, failed_urls = [], []
+
+    try:
+        while True:
+            item = data_queue.get()
+            if item is None:
+                flush()
+                break
+            url, df = item
+            if df is None:
+                failed_urls.append(url)
+                continue
+            buffer.append(df)
+            entries.append((url, len(df)))
+            buffered_rows += len(df)
+            if buffered_rows >= batch_rows:
+                flush()
+    except Exception as e:
+        stats["error"] = e
+        logger.error(f"❌ DB 저장 스레드 오류: {e}", exc_info=True)
+        # 생산자가 큐에서 막히지 않도록 남은 데이터를 비움
+        while data_queue.get() is not None:
+            pass
+
+# ✅ 수집 → 정제 → 저장 스트리밍 파이프라인 함수
+# 요청(생산자)과 DB 저장(소비자)을 동시에 진행하여 전체 응답을 메모리에 쌓지 않습니다.
+# - 동시에 진행 중인 요청 수는 max_workers * 2로 제한
+# - 저장 대기 큐(queue_size)가 가득 차면 새 요청 제출을 멈춤 (backpressure)
+# - writers > 1이고 pool이 지정되면 저장 스레드 writers개가 각자 풀 연결로 동시에 저장
+#   (TBL_ID 해시로 저장 스레드를 고정하여 같은 통계표는 항상 같은 연결에서 저장, 큐 용량은 queue_size를 나눠 사용)
+# - fetch_func(기본값: fetch_url)에 fetch_kwargs를 전달 (replay 모드는 replay_archived_url 사용)
+# - ledger(kosis_ledger.UrlLedger)가 지정되면 URL별 처리 상태를 저장 스레드에서 기록
+# - fingerprints(kosis_fingerprint.FingerprintStore)가 지정되면 변경 없는 행/중복 행은 저장하지 않음
+# - parse_workers > 0이면 파싱 프로세스 풀 사용 (수집 종료 시 정리)
+#   fetch_func는 parse_min_bytes 이상인 응답을 bytes 그대로 반환하고, 생산자 루프가 파싱 작업을 제출/수거
+#   (요청 스레드는 파싱을 기다리지 않음, 파싱 대기 중인 응답도 max_workers * 2 제한에 포함)
+# - url_logs(kosis_logging.UrlLogSampler)가 지정되면 fetch_func에는 URL별 표본 추출 로거를 전달
+# - 반환값: (성공 URL 집합, 총 저장 건수)
+def stream_fetch_and_insert(url_list, connection, logger, max_workers, queue_size, batch_rows, write_opts=None,
+                            fetch_kwargs=None, fetch_func=None, metrics=None, ledger=None, fingerprints=None,
+                            pool=None, writers=1, parse_workers=0, url_logs=None, parse_min_bytes=262144):
+    fetch_func = fetch_func or fetch_url
+    fetch_kwargs = fetch_kwargs or {}
+    writers = max(1, writers) if pool is not None else 1
+    parse_pool = build_parse_pool(parse_workers, logger) if url_list else None
+    if parse_pool is not None:
+        fetch_kwargs = {**fetch_kwargs, "defer_parse_bytes": parse_min_bytes}
+
+    # ✅ 저장 스레드별 연결/큐/통계 (첫 번째 저장 스레드는 호출자의 연결 사용)
+    connections = [connection] + [get_connection_with_retry(pool) for _ in range(writers - 1)]
+    queues = [queue.Queue(maxsize=max(1, queue_size // writers)) for _ in range(writers)]
+    writer_stats = [{"saved_count": 0, "batch_count": 0, "rejected_count": 0, "failed_count": 0, "error": None}
+                    for _ in range(writers)]
+    threads = [
+        threading.Thread(
+            target=_insert_worker,
+            args=(queues[i], connections[i], logger, batch_rows, writer_stats[i], write_opts or {}, metrics, ledger,
+                  fingerprints),
+            name=f"kosis-db-writer-{i}", daemon=True)
+        for i in range(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    if writers > 1:
+        logger.info(f"🗄️ 병렬 저장 스레드 {writers}개 시작 (TBL_ID 기준 분할)")
+
+    succeeded_urls = set()
+    max_pending = max_workers * 2
+    url_iter = iter(url_list)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+            parsing = {}  # ✅ 파싱 프로세스 작업 → URL
+            while True:
+                while len(pending) + len(parsing) < max_pending:
+                    url = next(url_iter, None)
+                    if url is None:
+                        break
+                    url_logger = url_logs.for_url(url) if url_logs is not None else logger
+                    pending[executor.submit(fetch_func, url, url_logger, **fetch_kwargs)] = url
+                if not pending and not parsing:
+                    break
+                done, _ = concurrent.futures.wait([*pending, *parsing], return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if future in parsing:
+                        url = parsing.pop(future)
+                        df = collect_parsed_body(future, url, logger, metrics)
+                    else:
+                        url = pending.pop(future)
+                        df = future.result()
+                        if isinstance(df, bytes):
+                            parsing[parse_pool.submit(parse_kosis_body, df, True)] = url
+                            continue
+                    if df is not None:
+                        succeeded_urls.add(url)
+                    # 큐가 가득 차면 대기 (backpressure)
+                    queues[writer_index(url, writers)].put((url, df))
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown(cancel_futures=True)
+        if url_logs is not None:
+            url_logs.flush()
+        for data_queue in queues:
+            data_queue.put(None)
+        for thread in threads:
+            thread.join()
+        for extra_connection in connections[1:]:
+            extra_connection.close()
+
+    stats = {key: sum(ws[key] for ws in writer_stats)
+             for key in ("saved_count", "batch_count", "rejected_count", "failed_count")}
+    if writers > 1:
+        for i, ws in enumerate(writer_stats):
+            logger.info(f"🗄️ 저장 스레드 {i}: {ws['saved_count']:,} rows ({ws['batch_count']}개 배치, "
+                        f"제외 {ws['rejected_count']:,} rows, 롤백 {ws['failed_count']:,} rows)")
+    errors = [ws["error"] for ws in writer_stats if ws["error"] is not None]
+    if errors:
+        raise errors[0]
+    logger.info(f"✅ 스트리밍 저장 완료: {stats['saved_count']:,} rows ({stats['batch_count']}개 배치)")
+    return succeeded_urls, stats["saved_count"]
+
+# ✅ 저장 스레드 선택 함수 (URL의 TBL_ID 해시, 통계표별로 항상 같은 저장 스레드)
+def writer_index(url, writers):
+    if writers == 1:
+        return 0
+    _, tbl_id, _ = kosis_planner.url_table_key(url)
+    # 샤드 분할(crc32(TBL_ID) % num_shards)과 겹치지 않도록 접두어를 붙여 해시
+    return zlib.crc32(f"writer:{tbl_id or url}".encode("utf-8")) % writers
+
+# ✅ 수집 대상 통계표 목록 조회 함수
+# CD_KOSIS_REQ_MPP_P에서 수집 대상 통계표(ORG_ID, TBL_ID, URL)를 조회합니다.
+# - kosis_config.ini의 tbl_id가 지정된 경우 해당 TBL_ID만 조회
+# - 중복 TBL_ID 경고 후 (TBL_ID, ORG_ID, URL) 완전 중복 제거
+def load_target_tables(connection, config, logger):
+    cursor = connection.cursor()
+
+    # kosis_config.ini에서 필터용 TBL_ID 목록 불러오기
+    tbl_id_raw = config.get("DEFAULT", "tbl_id", fallback="").strip()
+    tbl_id = [tbl.strip() for tbl in tbl_id_raw.split(',') if tbl.strip()]
+
+    # SQL 조건절 조립
+    if tbl_id:
+        # 바인딩 가능한 IN 조건 생성 (:1, :2, ...)
+        placeholders = ','.join([f':{i + 1}' for i in range(len(tbl_id))])
+        sql = f"""
+            SELECT ORG_ID, TBL_ID, URL
+            FROM CD_KOSIS_REQ_MPP_P
+            WHERE URL IS NOT NULL AND TBL_ID IN ({placeholders})
+        """
+        cursor.execute(sql, tbl_id)
+        logger.info(f"🔎 TBL_ID 필터 적용됨: {tbl_id}")
+    else:
+        sql = "SELECT ORG_ID, TBL_ID, URL FROM CD_KOSIS_REQ_MPP_P WHERE URL IS NOT NULL"
+        cursor.execute(sql)
+
+    # 결과 → DataFrame
+    df_org_tbl = pd.DataFrame(cursor.fetchall(), columns=[col[0] for col in cursor.description])
+
+    dup_check = df_org_tbl.duplicated(subset=['TBL_ID'], keep=False)
+    if dup_check.any():
+        dup_list = df_org_tbl[dup_check]['TBL_ID'].drop_duplicates().tolist()
+        logger.warning(f"⚠️ 중복된 TBL_ID 존재 ({len(dup_list)}개): {dup_list}")
+
+    # ✅ 이후 실제 처리용으로는 완전 중복 제거
+    df_org_tbl = df_org_tbl.drop_duplicates(subset=['TBL_ID', 'ORG_ID', 'URL'])
+
+    cursor.close()
+
+    logger.info(f"📋 수집 대상 통계표 수: {len(df_org_tbl)}개")
+    tbl_ids = df_org_tbl['TBL_ID'].tolist()
+    # 통계표 수가 많으므로 50개씩 묶어 한 줄로 출력
+    for i in range(0, len(tbl_ids), 50):
+        logger.info(f"📄 수집 대상 목록 ({i + 1}~{min(i + 50, len(tbl_ids))}): {', '.join(tbl_ids[i:i + 50])}")
+
+    return df_org_tbl
+
+# ✅ 실행일자별 수집 URL 계획 함수
+# 한 번 조회한 메타정보(df_meta)를 실행일자별 갱신일 범위로 필터링하여 URL 목록을 만듭니다.
+# - 실행일 기준 days_back일 전 ~ 실행일까지를 각 실행일자의 범위로 사용
+# - 여러 실행일자에 걸쳐 반복되는 요청은 한 번만 요청하도록 합집합(순서 유지)으로 병합
+# - (ORG_ID, TBL_ID, URL 코드, 수록주기)별 연속 수록시점은 startPrdDe ~ endPrdDe 범위 요청으로 병합
+#   (max_periods개 시점 / 셀 제한 이내, kosis_planner.coalesce_periods)
+# - 대용량 요청 분할 (table_dims, split_max_cells, probe_selection 모두 지정 시)
+#   1. 통계표 전체 분류 기준(table_dims)으로도 split_max_cells를 넘을 수 없는 요청은 그대로 사용 (확인 요청 없음)
+#   2. 나머지는 probe_selection(URL 목록 → {URL: TableDims})으로 userStatsId 선택 범위를 확인
+#   3. 선택 범위 기준 시점당 셀 수로 범위 병합을 제한하고, 예상 셀 수가 split_max_cells를 넘는 요청은
+#      C1(또는 ITM_ID) 묶음별 통계자료(파라미터) URL로 분할 (조각은 선택 범위의 분류값만 요청)
+# - 반환값: (실행일자별 URL 목록 dict, 중복 제거된 전체 URL 목록)
+def plan_kosis_urls(df_meta, execute_dates, days_back, license_key, kosis_id, logger, max_periods=12,
+                    cells_per_period=None, base_url=None, table_dims=None, split_max_cells=None,
+                    probe_selection=None):
+    freq_map = {"월": "M", "반기": "S", "년": "Y", "분기": "Q"}
+    df_meta = df_meta.assign(수록주기=df_meta["수록주기"].map(freq_map))
+
+    date_keys = {}
+    for execute_date in execute_dates:
         # 날짜 형식 변환
         exec_date_obj = datetime.strptime(execute_date, "%Y-%m-%d")
 
@@ -427,61 +1289,162 @@ def run_kosis_process_logging(execute_dates, config, today, days_back, pool, log
         start_date = (exec_date_obj - timedelta(days=days_back)).strftime("%Y-%m-%d")  # 일주일 전
         end_date = execute_date  # 실행일자까지 포함
 
-        # 필터링 조건 변경 (자료갱신일이 문자열로 되어 있다고 가정)
         # ✅ 자료갱신일이 지정된 범위 내인 통계표만 필터링
-        df_meta = df_meta[
+        df_date = df_meta[
             (df_meta['자료갱신일'] >= start_date) &
             (df_meta['자료갱신일'] <= end_date)
             ]
+        logger.info(f"📌 [{execute_date}] 갱신일자 일치 통계표 수: {len(df_date)}")
+
+        date_keys[execute_date] = list(dict.fromkeys(
+            (row['org_id'], row['tbl_id'], row['col_url'], row['수록주기'], row['수록시점'])
+            for _, row in df_date.iterrows()
+        ))
+
+    all_keys = list(dict.fromkeys(key for keys in date_keys.values() for key in keys))
+    cells_per_period = dict(cells_per_period or {})
+    selections = {}
+    if table_dims and split_max_cells and probe_selection:
+        groups = {}
+        for org_id, tbl_id, url_code, prd_se, prd_de in all_keys:
+            groups.setdefault((org_id, tbl_id, url_code, prd_se), []).append(prd_de)
+        probe_urls = {}
+        for (org_id, tbl_id, url_code, prd_se), periods in groups.items():
+            dims = table_dims.get((org_id, tbl_id))
+            if dims and min(len(periods), max_periods) * kosis_planner.dims_cells(dims) > split_max_cells:
+                probe_urls.setdefault((org_id, tbl_id, url_code), build_kosis_url(
+                    license_key, kosis_id, org_id, tbl_id, url_code, prd_se, max(periods), base_url=base_url))
+        probed = probe_selection(list(probe_urls.values())) if probe_urls else {}
+        selections = {key: probed[url] for key, url in probe_urls.items() if url in probed}
+        cells_per_period.update((key, kosis_planner.dims_cells(dims)) for key, dims in selections.items())
+    specs, key_to_spec = kosis_planner.coalesce_periods(all_keys, max_periods=max_periods,
+                                                        cells_per_period=cells_per_period)
+    spec_urls, split_count = {}, 0
+    for spec in specs:
+        dims = selections.get((spec.org_id, spec.tbl_id, spec.url_code))
+        pieces = kosis_planner.split_by_dims(dims, spec.n_periods, split_max_cells) if dims else None
+        if pieces:
+            split_count += 1
+            spec_urls[spec] = [
+                build_kosis_param_url(license_key, spec.org_id, spec.tbl_id, spec.prd_se, spec.start_prd_de,
+                                      spec.end_prd_de, dims, itm_ids, c1_codes, base_url)
+                for itm_ids, c1_codes in pieces
+            ]
+        else:
+            spec_urls[spec] = [build_kosis_url(license_key, kosis_id, spec.org_id, spec.tbl_id, spec.url_code,
+                                               spec.prd_se, spec.start_prd_de, spec.end_prd_de, base_url)]
+
+    date_urls = {}
+    for execute_date, keys in date_keys.items():
+        date_urls[execute_date] = list(dict.fromkeys(url for key in keys for url in spec_urls[key_to_spec[key]]))
+        logger.info(f"🌐 [{execute_date}] 데이터 수집 URL 수: {len(date_urls[execute_date])}")
+
+    all_urls = list(dict.fromkeys(url for spec in specs for url in spec_urls[spec]))
+    if split_count:
+        logger.info(f"✂️ 대용량 요청 분할: {split_count}개 요청 → "
+                    f"{sum(len(spec_urls[spec]) for spec in specs if len(spec_urls[spec]) > 1)}개 조각 요청")
+    total_planned = sum(len(keys) for keys in date_keys.values())
+    if total_planned != len(all_keys):
+        logger.info(f"♻️ 실행일자 간 중복 요청 제거: {total_planned} → {len(all_keys)}")
+    if len(all_keys) != len(specs):
+        logger.info(f"🧩 연속 수록시점 범위 병합: {len(all_keys)}개 시점 → {len(specs)}개 요청")
+    return date_urls, all_urls
+
+# ✅ 수집 URL 계획 함수
+# 수집 대상 통계표 조회 → 자료갱신일 메타정보 병렬 요청 → 실행일자별 URL 계획 (단계별 지표 기록)
+# - split_large_tables = true이면 분류항목/선택 범위를 함께 조회하여 대용량 요청을 분할 (plan_kosis_urls)
+# 반환값: (실행일자별 URL 목록 dict, 전체 URL 목록, 샤드 크기 추정용 시점당 셀 수 dict)
+def build_url_plan(connection, api, config, execute_dates, days_back, logger, meta_max_workers, metrics):
+    license_key = config.get("KOSIS", "license_key")
+    kosis_id = config.get("KOSIS", "kosis_id")
+    base_url = config.get("KOSIS", "base_url", fallback="").strip() or None
+
+    with metrics.stage("target_query"):
+        df_org_tbl = load_target_tables(connection, config, logger)
+    metrics.inc("target_tables", len(df_org_tbl))
+    with metrics.stage("meta_fetch"):
+        if config.getboolean("DEFAULT", "meta_async", fallback=False):
+            df_meta = fetch_meta_async(api, config, df_org_tbl, logger, meta_max_workers, metrics)
+        else:
+            df_meta = fetch_meta_parallel(api, df_org_tbl, logger, meta_max_workers, metrics)
+
+    table_dims, split_max_cells, cells_per_period = {}, None, {}
+    if config.getboolean("DEFAULT", "split_large_tables", fallback=False) and not df_meta.empty:
+        split_max_cells = get_int_option(config, "split_max_cells", 20000)
+        with metrics.stage("meta_fetch"):
+            table_dims = fetch_table_dims(api, df_meta[['org_id', 'tbl_id']].set_axis(['ORG_ID', 'TBL_ID'], axis=1),
+                                          logger, meta_max_workers, metrics)
+
+    # ✅ 선택 범위 확인 결과는 샤드 크기 추정(userStatsId URL의 시점당 셀 수)에도 사용
+    def probe_selection(urls):
+        with metrics.stage("meta_fetch"):
+            selections = fetch_selection_dims(urls, logger, meta_max_workers, metrics)
+        for url, dims in selections.items():
+            cells_per_period[kosis_planner.url_table_key(url)] = kosis_planner.dims_cells(dims)
+        return selections
+
+    if df_meta.empty:
+        logger.warning(f"❌ 메타 정보 없음: {execute_dates}")
+        date_urls, url_list = {}, []
+    else:
+        max_periods = config.getint("DEFAULT", "max_periods_per_request", fallback=12)
+        with metrics.stage("url_build"):
+            date_urls, url_list = plan_kosis_urls(df_meta, execute_dates, days_back, license_key, kosis_id, logger,
+                                                  max_periods, base_url=base_url, table_dims=table_dims,
+                                                  split_max_cells=split_max_cells, probe_selection=probe_selection)
+    logger.info(f"🌐 전체 데이터 수집 URL 수: {len(url_list)}")
+    metrics.inc("urls_planned", len(url_list))
+    return date_urls, url_list, cells_per_period
 
-        logger.info(f"📌 갱신일자 일치 통계표 수: {len(df_meta)}")
-        # print(df_meta)
-
-        freq_map = {"월": "M", "반기": "S", "년": "Y", "분기": "Q"}
-        df_meta["수록주기"] = df_meta["수록주기"].map(freq_map)
-
-        url_list = [
-            build_kosis_url(license_key, kosis_id, row['org_id'], row['tbl_id'],
-                            row['col_url'], row['수록주기'], row['수록시점'])
-            for _, row in df_meta.iterrows()
-        ]
-        url_list = list(set(filter(None, url_list)))
-        logger.info(f"🌐 데이터 수집 URL 수: {len(url_list)}")
+# ✅ 메인 수집 실행 함수
+# 1. 수집 대상 통계표 목록 조회 (전체 실행일자에 대해 1회)
+# 2. 각 통계표에 대해 자료갱신일 메타 요청 (전체 실행일자에 대해 1회)
+# 3. 실행일자별 갱신일 기준 필터링 (execute_date - days_back ~ execute_date) 후 URL 합집합 생성
+# 4. 하나의 ThreadPoolExecutor로 전체 URL 병렬 요청
+# 5. 응답이 도착하는 대로 마이크로 배치 단위로 정제 후 Oracle 저장 (stream_fetch_and_insert)
+# 6. 성공률 통계 및 COMPLETE_YN 상태 갱신
+def run_kosis_process_logging(execute_dates, config, today, days_back, pool, logger, max_workers, meta_max_workers=5,
+                              queue_size=50, batch_rows=5000):
+    start_time = time.time()
+    date_stats = []  # ✅ 날짜별 수집 통계 저장 리스트 추가
+    metrics = kosis_metrics.RunMetrics(today, labels={"job": "kosis_collect"})
+    logger.info(f"✅ KOSIS 수집 프로세스 시작 | 대상일자: {execute_dates}")
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_url = {executor.submit(fetch_url, url, logger): url for url in url_list}
-            # execute_date 단위로 처리 & DB 즉시 저장
-            day_data = []
-            for future in concurrent.futures.as_completed(future_to_url):
-                df = future.result()
-                if df is not None:
-                    day_data.append(df)
-
-            if day_data:
-                df_final = pd.concat(day_data, ignore_index=True)
-                df_final = df_final.replace({np.nan: None})
-                df_final = df_final[df_final['OBS_VALUE'].notna()]
-                df_final = df_final[~df_final['OBS_VALUE'].isin(['-', '...'])]
-                df_final['OBS_VALUE'] = pd.to_numeric(df_final['OBS_VALUE'], errors='coerce')
-                df_final = df_final.dropna(subset=['KOSTAT_TBL_ID'])
-
-                df_final = set_common_cols(df_final)
-                logger.info(f"📦 [{execute_date}] 정제된 데이터 수: {len(df_final)}")
-
-                insert_kosis_data(df_final, connection, logger)
-            else:
-                logger.warning(f"⚠️ 수집 데이터 없음: {execute_date}")
-
-        # ✅ 날짜별 통계 저장
-        date_stats.append({
-            "date": execute_date,
-            "url_count": len(url_list),
-            "success_count": len(day_data)
-        })
+    connection = get_connection_with_retry(pool)
+    logger.info("🔗 Oracle DB 연결 성공")
 
-        # ✅ 대체: 수집이 전혀 없을 때 경고만 남김
-        if not date_stats:
-            logger.warning("⚠️ 전체 기간 동안 수집된 데이터가 없습니다. DB 저장 및 상태 플래그 스킵됩니다.")
+    license_key = config.get("KOSIS", "license_key")
+    limiter = build_limiter(config, max_workers, logger)
+    api = build_kosis_api(config, license_key, logger, limiter)
+    # ✅ 공유 HTTP 세션 커넥션 풀을 병렬 요청 수에 맞춤 (keep-alive 연결 재사용)
+    kosis_http.configure_session(max(max_workers, meta_max_workers))
+
+    date_urls, url_list, cells_per_period = build_url_plan(connection, api, config, execute_dates, days_back, logger,
+                                                           meta_max_workers, metrics)
+
+    write_opts = get_write_options(config)
+    logger.info(f"🗄️ DB 저장 옵션: {write_opts}")
+    archive = build_archive(config, today, logger)
+    ledger = build_ledger(config, today, logger)
+    fingerprints = build_fingerprints(config, logger)
+    fetch_urls, done_urls = skip_done_urls(ledger, connection, url_list, config, logger, metrics)
+    with metrics.stage("fetch_pipeline_wall"):
+        succeeded_urls, _ = stream_fetch_and_insert(
+            fetch_urls, connection, logger, max_workers, queue_size, batch_rows, write_opts,
+            fetch_kwargs={"limiter": limiter, "archive": archive, "metrics": metrics}, metrics=metrics,
+            ledger=ledger, fingerprints=fingerprints, pool=pool, writers=get_db_writers(config, logger),
+            parse_workers=get_parse_workers(config), url_logs=build_url_log_sampler(config, logger),
+            parse_min_bytes=get_parse_min_bytes(config))
+    succeeded_urls |= done_urls
+    if not succeeded_urls:
+        logger.warning(f"⚠️ 수집 데이터 없음: {execute_dates}")
+
+    # ✅ 날짜별 통계 저장 (실행일자 간 공유된 URL은 각 일자에 모두 반영)
+    date_stats.extend(build_date_stats(date_urls, succeeded_urls))
+
+    # ✅ 대체: 수집이 전혀 없을 때 경고만 남김
+    if not date_stats:
+        logger.warning("⚠️ 전체 기간 동안 수집된 데이터가 없습니다. DB 저장 및 상태 플래그 스킵됩니다.")
 
     elapsed = round(time.time() - start_time, 2)
     minutes = int(elapsed // 60)
@@ -490,72 +1453,321 @@ def run_kosis_process_logging(execute_dates, config, today, days_back, pool, log
     logger.info(f"🏁 전체 수집 완료 | 총 소요시간: {minutes}분 {seconds}초")
 
     # ✅ 날짜별 수집 통계 요약 출력
-    if date_stats:
-        logger.info("📊 날짜별 수집 성공률 통계")
-        for stat in date_stats:
-            rate = round(stat['success_count'] / stat['url_count'] * 100, 2) if stat['url_count'] else 0.0
-            logger.info(
-                f"📅 {stat['date']} | URL 수: {stat['url_count']} | 성공 수: {stat['success_count']} | 성공률: {rate:.2f}%")
+    log_date_stats(date_stats, logger)
+
+    upsert_complete_flag(connection, today, 'Y', is_init=False, logger=logger)
+    logger.info("📍 상태 플래그 (Y) 저장 완료")
+    connection.close()
+    logger.info("🔌 Oracle DB 연결 종료")
+
+    return export_run_metrics(metrics, config, logger)
+
+# ✅ 날짜별 수집 통계 생성 함수
+# 실행일자별 URL 수와 성공 URL 수를 집계합니다. (실행일자 간 공유된 URL은 각 일자에 모두 반영)
+def build_date_stats(date_urls, succeeded_urls):
+    return [
+        {
+            "date": execute_date,
+            "url_count": len(urls),
+            "success_count": sum(1 for url in urls if url in succeeded_urls)
+        }
+        for execute_date, urls in date_urls.items()
+    ]
+
+# ✅ 날짜별 수집 성공률 로그 출력 함수
+def log_date_stats(date_stats, logger):
+    if not date_stats:
+        return
+    logger.info("📊 날짜별 수집 성공률 통계")
+    for stat in date_stats:
+        rate = round(stat['success_count'] / stat['url_count'] * 100, 2) if stat['url_count'] else 0.0
+        logger.info(
+            f"📅 {stat['date']} | URL 수: {stat['url_count']} | 성공 수: {stat['success_count']} | 성공률: {rate:.2f}%")
+
+# ✅ 실행 지표 저장 함수
+# 단계별 소요시간/처리량 요약을 로그로 출력하고 JSON, Prometheus textfile로 저장합니다.
+# - 저장 경로: kosis_config.ini의 metrics_dir (비워두면 output_dir/metrics)
+# - 반환값(요약 dict)은 DAG 태스크에서 XCom으로 전달
+def export_run_metrics(metrics, config, logger, prefix="kosis_metrics"):
+    metrics.finish()
+    summary = metrics.summary()
+    logger.info("⏱️ 단계별 소요시간 (병렬 단계는 스레드 합산)")
+    for stage_name, seconds in summary["stage_seconds"].items():
+        logger.info(f"  - {stage_name}: {seconds:.2f}초")
+    logger.info(f"📈 URL 지연시간 p50={summary['url_latency_p50']:.3f}초 / p99={summary['url_latency_p99']:.3f}초 | "
+                f"저장 {summary['rows_written_per_second']:,.1f} rows/s | 카운터: {summary['counters']}")
+
+    metrics_dir = (config.get("DEFAULT", "metrics_dir", fallback="").strip()
+                   or os.path.join(config.get("DEFAULT", "output_dir"), "metrics"))
+    try:
+        summary["artifacts"] = metrics.write(metrics_dir, prefix)
+        logger.info(f"📝 실행 지표 저장: {summary['artifacts']}")
+    except OSError as e:
+        logger.warning(f"⚠️ 실행 지표 저장 실패: {e}")
+    return summary
+
+# ✅ 보관 응답 재적재 실행 함수 (replay 모드)
+# replay_date(YYYYMMDD)에 보관된 원본 응답 전체를 네트워크 없이 다시 파싱하여 Oracle에 저장합니다.
+# - DB 측 장애 후 복구 시 전체 재수집 없이 사용
+# - 저장 방식(write_mode)은 일반 실행과 동일하게 적용 (upsert 권장)
+def run_kosis_replay(replay_date, config, today, pool, logger, max_workers, queue_size=50, batch_rows=5000):
+    start_time = time.time()
+    logger.info(f"⏪ KOSIS 보관 응답 재적재 시작 | 수집일자: {replay_date}")
+
+    archive = kosis_archive.RawArchive(config.get("DEFAULT", "output_dir"), replay_date)
+    url_list = archive.list_urls()
+    logger.info(f"🗂️ 보관 응답 수: {len(url_list)} ({archive.date_dir()})")
+
+    connection = get_connection_with_retry(pool)
+    logger.info("🔗 Oracle DB 연결 성공")
+
+    write_opts = get_write_options(config)
+    logger.info(f"🗄️ DB 저장 옵션: {write_opts}")
+    metrics = kosis_metrics.RunMetrics(today, labels={"job": "kosis_replay", "replay_date": replay_date})
+    with metrics.stage("fetch_pipeline_wall"):
+        succeeded_urls, saved_count = stream_fetch_and_insert(
+            url_list, connection, logger, max_workers, queue_size, batch_rows, write_opts,
+            fetch_kwargs={"archive": archive, "replay_date": replay_date}, fetch_func=replay_archived_url,
+            metrics=metrics, pool=pool, writers=get_db_writers(config, logger),
+            parse_workers=get_parse_workers(config), url_logs=build_url_log_sampler(config, logger),
+            parse_min_bytes=get_parse_min_bytes(config))
+
+    elapsed = round(time.time() - start_time, 2)
+    logger.info(f"🏁 재적재 완료 | 응답 {len(succeeded_urls)}/{len(url_list)} | "
+                f"저장 {saved_count:,} rows | 소요시간: {elapsed}초")
 
     upsert_complete_flag(connection, today, 'Y', is_init=False, logger=logger)
     logger.info("📍 상태 플래그 (Y) 저장 완료")
     connection.close()
     logger.info("🔌 Oracle DB 연결 종료")
 
-# ✅ main 함수
-# kosis_config.ini 설정 불러오기, 날짜 계산, 로거 설정, DB pool 생성
-# 초기 COMPLETE_YN = 'N' 설정 후 수집 프로세스 실행
-# def main():
-#
-#     config = configparser.ConfigParser()
-#     config.read("/Users/dongbin/airflow/dags/scripts/kosis_config/config.ini", encoding="utf-8")
-#
-#     execute_raw = config.get("DEFAULT", "execute_date", fallback="")
-#     base_date = datetime.strptime(execute_raw.strip(), "%Y-%m-%d") if execute_raw else datetime.now()
-#
-#     today = datetime.now().strftime("%Y%m%d")  # YYYYMMDD 형식
-#     log_dir = config.get("DEFAULT", "log_dir")
-#
-#     max_workers_str = config.get("DEFAULT", "max_workers", fallback="10").strip()
-#     max_workers = int(max_workers_str) if max_workers_str else 15
-#
-#     # ✅ 로거 먼저 세팅해야 이후 logging 가능
-#     logger = setup_logger(today, log_dir)
-#
-#     execute_dates = [
-#         (base_date - timedelta(days=offset)).strftime("%Y-%m-%d")
-#         for offset in reversed(range(1))
-#     ]
-#
-#     # 💡 실행일 기준으로 days_back일 전부터 포함 (예: 2025-05-20 기준 6일 전 → 2025-05-14 포함)
-#     days_back_str = config.get("DEFAULT", "days_back", fallback="6").strip()
-#     days_back = int(days_back_str) if days_back_str else 6
-#
-#     # ✅ Oracle DB 연결 (최초 1회)
-#     pool = oracledb.SessionPool(
-#         user=config.get("DB", "user"),
-#         password=config.get("DB", "password"),
-#         dsn=config.get("DB", "dsn"),
-#         min=config.getint("DB", "min"),
-#         max=config.getint("DB", "max"),
-#         increment=config.getint("DB", "increment"),
-#         encoding=config.get("DB", "encoding")
-#     )
-#     connection = get_connection_with_retry(pool)
-#
-#     # ✅ 최초 1회 상태 초기화 (COMPLETE_YN = 'N', Z_REG_DTM 포함)
-#     upsert_complete_flag(connection, today, 'N', is_init=True, logger=logger)
-#     logger.info("📍 상태 초기화 완료 (COMPLETE_YN = 'N', Z_REG_DTM 최신화)")
-#     connection.close()
-#
-#     run_kosis_process_logging(execute_dates, config, today, days_back, pool, logger, max_workers)
-
-def main(execute_date=None, days_back=None):
+    return export_run_metrics(metrics, config, logger)
+
+# ✅ 분산 실행 1단계: 수집 계획 함수 (Airflow 동적 태스크 매핑용)
+# 1. COMPLETE_YN = 'N' 초기화
+# 2. 수집 대상 조회 → 메타정보 병렬 요청 → URL 계획 (build_url_plan, 단일 프로세스 실행과 동일)
+# 3. URL을 num_shards개 샤드로 분할 (shard_by = hash: TBL_ID 해시 / size: 예상 셀 수 균등)
+# 4. 계획 파일(plan_dir/kosis_plan_YYYYMMDD_<run_id>.json) 저장 - URL의 apiKey는 저장하지 않음
+#    - run_id는 Airflow DAG 실행의 run_id (지정하지 않으면 uuid) → 같은 날 여러 실행(정기 실행, param DAG 백필,
+#      수동 실행)이 서로의 계획/샤드 결과 파일을 덮어쓰지 않음
+#    - 같은 run_id로 다시 계획하면(DAG 실행 재시작) 이전 샤드 결과 파일은 삭제
+# 반환값: {"plan_path": 계획 파일 경로, "shards": [{"plan_path", "shard_index"}, ...]}
+#  - shards는 PythonOperator.partial(...).expand(op_kwargs=...)에 그대로 전달
+def plan_kosis_run(execute_date=None, days_back=None, start_date=None, end_date=None, run_id=None):
+    config = load_config()
+    today = datetime.now().strftime("%Y%m%d")
+    logger = setup_logger(today, config.get("DEFAULT", "log_dir"))
+    listener = start_log_listener(config, logger)
+    try:
+        meta_max_workers = get_int_option(config, "meta_max_workers", 5)
+        num_shards = get_int_option(config, "num_shards", 4)
+        shard_by = config.get("DEFAULT", "shard_by", fallback="hash").strip() or "hash"
+
+        execute_dates, days_back = resolve_run_dates(config, execute_date, days_back, start_date, end_date, logger)
+        logger.info(f"✅ KOSIS 수집 계획 시작 | 대상일자: {execute_dates}")
+
+        pool = create_pool(config)
+        connection = get_connection_with_retry(pool)
+        upsert_complete_flag(connection, today, 'N', is_init=True, logger=logger)
+        logger.info("📍 상태 초기화 완료 (COMPLETE_YN = 'N', Z_REG_DTM 최신화)")
+
+        metrics = kosis_metrics.RunMetrics(today, labels={"job": "kosis_plan"})
+        api = build_kosis_api(config, config.get("KOSIS", "license_key"), logger)
+        kosis_http.configure_session(meta_max_workers)
+        date_urls, url_list, cells_per_period = build_url_plan(connection, api, config, execute_dates, days_back,
+                                                               logger, meta_max_workers, metrics)
+        connection.close()
+        logger.info("🔌 Oracle DB 연결 종료")
+
+        shards = [shard for shard in kosis_planner.shard_urls(url_list, num_shards, shard_by, cells_per_period)
+                  if shard]
+        logger.info(f"🧩 샤드 분할 ({shard_by}): {len(url_list)}개 URL → {len(shards)}개 샤드 "
+                    f"{[len(shard) for shard in shards]}")
+
+        run_id = run_id or uuid.uuid4().hex[:12]
+        plan = {
+            "today": today,
+            "run_id": run_id,
+            "execute_dates": execute_dates,
+            "days_back": days_back,
+            "shard_by": shard_by,
+            "date_urls": {date: [kosis_archive.redact_url(url) for url in urls] for date, urls in date_urls.items()},
+            "shards": [[kosis_archive.redact_url(url) for url in shard] for shard in shards],
+        }
+        plan_path = get_plan_path(config, today, run_id)
+        for stale_path in glob.glob(shard_result_path(glob.escape(plan_path), "*")):
+            os.remove(stale_path)
+        write_json_atomic(plan_path, plan)
+        logger.info(f"📝 수집 계획 저장: {plan_path}")
+
+        export_run_metrics(metrics, config, logger, prefix="kosis_metrics_plan")
+        return {
+            "plan_path": plan_path,
+            "shards": [{"plan_path": plan_path, "shard_index": index} for index in range(len(shards))],
+        }
+    finally:
+        listener and listener.stop()
+
+# ✅ 분산 실행 2단계: 샤드 수집 함수 (매핑된 태스크 1개 = 샤드 1개)
+# 계획 파일에서 자신의 샤드 URL만 읽어 apiKey를 채운 뒤 stream_fetch_and_insert로 수집/저장합니다.
+# - 결과(성공 URL, 저장 건수)는 계획 파일 옆 kosis_plan_YYYYMMDD_<run_id>_shardN.result.json에 저장
+# - 태스크 재시도 시 해당 샤드만 다시 수집 (checkpoint = true이면 완료 URL은 건너뜀)
+def run_kosis_shard(plan_path, shard_index):
+    config = load_config()
+    plan = read_json(plan_path)
+    today = plan["today"]
+    logger = setup_logger(today, config.get("DEFAULT", "log_dir"))
+    listener = start_log_listener(config, logger)
+    try:
+        max_workers = get_int_option(config, "max_workers", 15)
+        queue_size = get_int_option(config, "queue_size", 50)
+        batch_rows = get_int_option(config, "batch_rows", 5000)
+
+        license_key = config.get("KOSIS", "license_key")
+        url_list = [kosis_planner.replace_api_key(url, license_key) for url in plan["shards"][shard_index]]
+        logger.info(f"🧩 샤드 수집 시작 [{shard_index + 1}/{len(plan['shards'])}] | URL 수: {len(url_list)}")
+
+        pool = create_pool(config)
+        connection = get_connection_with_retry(pool)
+        logger.info("🔗 Oracle DB 연결 성공")
+
+        limiter = build_limiter(config, max_workers, logger)
+        kosis_http.configure_session(max_workers)
+        write_opts = get_write_options(config)
+        archive = build_archive(config, today, logger)
+        metrics = kosis_metrics.RunMetrics(today, labels={"job": "kosis_shard", "shard": shard_index})
+        metrics.inc("urls_planned", len(url_list))
+        ledger = build_ledger(config, today, logger)
+        fingerprints = build_fingerprints(config, logger)
+        fetch_urls, done_urls = skip_done_urls(ledger, connection, url_list, config, logger, metrics)
+        with metrics.stage("fetch_pipeline_wall"):
+            succeeded_urls, saved_count = stream_fetch_and_insert(
+                fetch_urls, connection, logger, max_workers, queue_size, batch_rows, write_opts,
+                fetch_kwargs={"limiter": limiter, "archive": archive, "metrics": metrics}, metrics=metrics,
+                ledger=ledger, fingerprints=fingerprints, pool=pool, writers=get_db_writers(config, logger),
+                parse_workers=get_parse_workers(config), url_logs=build_url_log_sampler(config, logger),
+                parse_min_bytes=get_parse_min_bytes(config))
+        succeeded_urls |= done_urls
+        connection.close()
+        logger.info("🔌 Oracle DB 연결 종료")
+
+        write_json_atomic(shard_result_path(plan_path, shard_index), {
+            "shard_index": shard_index,
+            "url_count": len(url_list),
+            "saved_count": saved_count,
+            "succeeded_urls": [kosis_archive.redact_url(url) for url in succeeded_urls],
+        })
+        logger.info(f"🏁 샤드 수집 완료 [{shard_index + 1}/{len(plan['shards'])}] | "
+                    f"성공 URL: {len(succeeded_urls)}/{len(url_list)} | 저장 건수: {saved_count}")
+
+        summary = export_run_metrics(metrics, config, logger, prefix=f"kosis_metrics_shard{shard_index}")
+        summary.update({"shard_index": shard_index, "url_count": len(url_list), "success_count": len(succeeded_urls)})
+        return summary
+    finally:
+        listener and listener.stop()
+
+# ✅ 분산 실행 3단계: 마무리 함수
+# 샤드별 결과 파일을 모아 날짜별 성공률을 출력하고 COMPLETE_YN = 'Y'로 갱신합니다.
+# - 결과 파일이 없는 샤드가 있으면 'Y'로 갱신하지 않고 예외 발생
+def finalize_kosis_run(plan_path):
+    config = load_config()
+    plan = read_json(plan_path)
+    today = plan["today"]
+    logger = setup_logger(today, config.get("DEFAULT", "log_dir"))
+    listener = start_log_listener(config, logger)
+    try:
+        succeeded_urls, saved_count, missing = set(), 0, []
+        for shard_index in range(len(plan["shards"])):
+            result_path = shard_result_path(plan_path, shard_index)
+            if not os.path.exists(result_path):
+                missing.append(shard_index)
+                continue
+            result = read_json(result_path)
+            succeeded_urls.update(result["succeeded_urls"])
+            saved_count += result["saved_count"]
+        if missing:
+            raise RuntimeError(f"샤드 결과 파일 없음: {missing} ({plan_path})")
+
+        date_stats = build_date_stats(plan["date_urls"], succeeded_urls)
+        log_date_stats(date_stats, logger)
+        url_count = sum(len(shard) for shard in plan["shards"])
+        logger.info(f"🏁 전체 샤드 수집 완료 | 샤드 수: {len(plan['shards'])} | 성공 URL: {len(succeeded_urls)}/{url_count} | "
+                    f"저장 건수: {saved_count}")
+
+        pool = create_pool(config)
+        connection = get_connection_with_retry(pool)
+        upsert_complete_flag(connection, today, 'Y', is_init=False, logger=logger)
+        logger.info("📍 상태 플래그 (Y) 저장 완료")
+        connection.close()
+        logger.info("🔌 Oracle DB 연결 종료")
+
+        return {
+            "run_id": plan.get("run_id", today),
+            "shard_count": len(plan["shards"]),
+            "url_count": url_count,
+            "success_count": len(succeeded_urls),
+            "saved_count": saved_count,
+            "date_stats": date_stats,
+        }
+    finally:
+        listener and listener.stop()
+
+# ✅ 수집 계획 파일 디렉토리 조회 함수 (비워두면 output_dir/plans)
+# 샤드 태스크가 다른 워커에서 실행되므로 모든 Celery 워커가 공유하는 경로여야 합니다.
+def get_plan_dir(config):
+    return (config.get("DEFAULT", "plan_dir", fallback="").strip()
+            or os.path.join(config.get("DEFAULT", "output_dir"), "plans"))
+
+# ✅ 수집 계획 파일 경로 함수 (수집일자 + 실행 ID, 파일명에 쓸 수 없는 문자는 '_'로 치환)
+# Airflow run_id 예시: scheduled__2025-05-25T04:50:00+00:00 → scheduled__2025-05-25T04_50_00_00_00
+def get_plan_path(config, today, run_id):
+    safe_run_id = re.sub(r"[^0-9A-Za-z_.-]", "_", str(run_id))
+    return os.path.join(get_plan_dir(config), f"kosis_plan_{today}_{safe_run_id}.json")
+
+# ✅ 샤드 결과 파일 경로 함수
+def shard_result_path(plan_path, shard_index):
+    return f"{os.path.splitext(plan_path)[0]}_shard{shard_index}.result.json"
+
+# ✅ JSON 파일 저장/조회 함수 (임시 파일 작성 후 교체)
+def write_json_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+# ✅ 설정 파일 로드 함수
+CONFIG_PATH = "/Users/dongbin/airflow/dags/scripts/kosis_config/config.ini"
+
+def load_config():
     config = configparser.ConfigParser()
-    config.read("/Users/dongbin/airflow/dags/scripts/kosis_config/config.ini", encoding="utf-8")
+    config.read(CONFIG_PATH, encoding="utf-8")
+    return config
 
-    log_dir = config.get("DEFAULT", "log_dir")
+# ✅ [DEFAULT] 정수 설정값 조회 함수 (비어 있으면 기본값)
+def get_int_option(config, key, default):
+    value = config.get("DEFAULT", key, fallback=str(default)).strip()
+    return int(value) if value else default
+
+# ✅ Oracle 세션 풀 생성 함수
+def create_pool(config):
+    return oracledb.SessionPool(
+        user=config.get("DB", "user"),
+        password=config.get("DB", "password"),
+        dsn=config.get("DB", "dsn"),
+        min=config.getint("DB", "min"),
+        max=config.getint("DB", "max"),
+        increment=config.getint("DB", "increment"),
+        encoding=config.get("DB", "encoding")
+    )
 
+# ✅ 실행일자 목록 / days_back 계산 함수
+# start_date ~ end_date가 모두 지정되면 범위 내 모든 일자, 아니면 execute_date(없으면 설정값/오늘) 1일
+def resolve_run_dates(config, execute_date, days_back, start_date, end_date, logger):
     # ✅ 기본값 fallback 구조
     if not execute_date:
         execute_raw = config.get("DEFAULT", "execute_date", fallback="")
@@ -569,31 +1781,54 @@ def main(execute_date=None, days_back=None):
     else:
         days_back = int(days_back)
 
-    today = datetime.now().strftime("%Y%m%d")
-    max_workers_str = config.get("DEFAULT", "max_workers", fallback="10").strip()
-    max_workers = int(max_workers_str) if max_workers_str else 15
-    logger = setup_logger(today, log_dir)
-
-    execute_dates = [
-        (base_date - timedelta(days=offset)).strftime("%Y-%m-%d")
-        for offset in reversed(range(1))
-    ]
+    if start_date and end_date:
+        range_start = datetime.strptime(start_date, "%Y-%m-%d")
+        range_end = datetime.strptime(end_date, "%Y-%m-%d")
+        if range_start > range_end:
+            raise ValueError(f"start_date({start_date})가 end_date({end_date})보다 늦습니다.")
+        execute_dates = [
+            (range_start + timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range((range_end - range_start).days + 1)
+        ]
+        logger.info(f"🔁 백필 모드: {start_date} ~ {end_date} ({len(execute_dates)}일)")
+    else:
+        execute_dates = [
+            (base_date - timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in reversed(range(1))
+        ]
+    return execute_dates, days_back
 
-    pool = oracledb.SessionPool(
-        user=config.get("DB", "user"),
-        password=config.get("DB", "password"),
-        dsn=config.get("DB", "dsn"),
-        min=config.getint("DB", "min"),
-        max=config.getint("DB", "max"),
-        increment=config.getint("DB", "increment"),
-        encoding=config.get("DB", "encoding")
-    )
-    connection = get_connection_with_retry(pool)
-    upsert_complete_flag(connection, today, 'N', is_init=True, logger=logger)
-    logger.info("📍 상태 초기화 완료 (COMPLETE_YN = 'N', Z_REG_DTM 최신화)")
-    connection.close()
+# ✅ main 함수 (백필 모드)
+# start_date ~ end_date가 지정되면 해당 범위의 모든 일자를 실행일자로 사용합니다.
+# - 대상 목록/메타정보 조회와 URL 요청은 전체 범위에 대해 1회만 수행
+# replay_date(YYYYMMDD)가 지정되면 보관된 원본 응답만으로 재적재합니다. (네트워크 요청 없음)
+def main(execute_date=None, days_back=None, start_date=None, end_date=None, replay_date=None):
+    config = load_config()
 
-    run_kosis_process_logging(execute_dates, config, today, days_back, pool, logger, max_workers)
+    log_dir = config.get("DEFAULT", "log_dir")
+    today = datetime.now().strftime("%Y%m%d")
+    max_workers = get_int_option(config, "max_workers", 15)
+    meta_max_workers = get_int_option(config, "meta_max_workers", 5)
+    queue_size = get_int_option(config, "queue_size", 50)
+    batch_rows = get_int_option(config, "batch_rows", 5000)
+    logger = setup_logger(today, log_dir)
+    listener = start_log_listener(config, logger)
+    try:
+        execute_dates, days_back = resolve_run_dates(config, execute_date, days_back, start_date, end_date, logger)
+
+        pool = create_pool(config)
+        connection = get_connection_with_retry(pool)
+        upsert_complete_flag(connection, today, 'N', is_init=True, logger=logger)
+        logger.info("📍 상태 초기화 완료 (COMPLETE_YN = 'N', Z_REG_DTM 최신화)")
+        connection.close()
+
+        if replay_date:
+            return run_kosis_replay(replay_date, config, today, pool, logger, max_workers, queue_size, batch_rows)
+
+        return run_kosis_process_logging(execute_dates, config, today, days_back, pool, logger, max_workers, meta_max_workers,
+                                  queue_size, batch_rows)
+    finally:
+        listener and listener.stop()
 
 
 if __name__ == "__main__":
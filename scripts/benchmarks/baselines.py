@@ -0,0 +1,39 @@
+"""
+KOSIS 벤치마크 비교 기준(기존 경로) 모듈
+
+파이프라인이 더 이상 사용하지 않는 기존 파싱/정제 함수를 결과 비교와 벤치마크 기준으로 보관합니다.
+- parse_kosis_json_normalize() : json_normalize → rename → reindex (bench_parse 기준)
+- clean_kosis_frame() : replace → notna → isin → to_numeric → dropna → set_common_cols (bench_normalize 기준)
+"""
+import numpy as np
+import pandas as pd
+
+from scripts.auto_collect_kosis_statstics import FETCH_COLUMNS, set_common_cols
+
+
+def parse_kosis_json_normalize(res_json):
+    """
+    KOSIS 응답 파싱 (기존 경로, parse_kosis_response()와 같은 13개 컬럼 DataFrame)
+    """
+    df = pd.json_normalize(res_json)
+    df.rename(columns={
+        'PRD_DE': 'TIME_PERIOD',
+        'PRD_SE': 'FREQ',
+        'TBL_ID': 'KOSTAT_TBL_ID',
+        'DT': 'OBS_VALUE'
+    }, inplace=True)
+    return df.reindex(columns=FETCH_COLUMNS)
+
+
+def clean_kosis_frame(df):
+    """
+    수집 데이터 정제 (기존 경로, normalize_kosis_frame()과 같은 결과)
+
+    OBS_VALUE가 NaN, '-', '...'인 행 제거, 수치 변환, KOSTAT_TBL_ID 누락 행 제거 후 공통 컬럼을 세팅합니다.
+    """
+    df = df.replace({np.nan: None})
+    df = df[df['OBS_VALUE'].notna()]
+    df = df[~df['OBS_VALUE'].isin(['-', '...'])]
+    df['OBS_VALUE'] = pd.to_numeric(df['OBS_VALUE'], errors='coerce')
+    df = df.dropna(subset=['KOSTAT_TBL_ID'])
+    return set_common_cols(df)
@@ -0,0 +1,116 @@
+"""
+DAG 파일 import 시간 벤치마크 (스케줄러 DagBag 파싱 비용 확인)
+
+DAG 파일을 새 Python 프로세스에서 import하여 다음 값을 출력합니다.
+- import(s) : DAG 파일 import 시간 중앙값
+- overhead(s) : import 시간 - 기준 시간 (airflow/pendulum import만 한 프로세스, 미설치 시 빈 프로세스)
+- heavy : import 후 sys.modules에 올라온 무거운 모듈 (pandas, numpy, requests, oracledb, 수집 모듈 등)
+
+airflow가 설치되지 않은 환경에서는 DAG 파일의 모듈 최상단 import 중 airflow/pendulum을 제외한 나머지만 import하여
+같은 항목을 측정합니다. (mode = top-level)
+
+무거운 모듈이 로드되었거나 overhead가 --max-overhead를 넘으면 종료 코드 1로 끝나므로 CI 검사로 사용할 수 있습니다.
+
+실행 예시
+    python -m scripts.benchmarks.bench_dag_import --repeat 5 --max-overhead 0.2
+"""
+import os
+import ast
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DAG_FILES = ["my_dags.py", "auto_collect_kosis_statistics_param_dag.py"]
+
+# ✅ DAG 파싱 시 로드되면 안 되는 모듈
+HEAVY_MODULES = ["pandas", "numpy", "requests", "urllib3", "oracledb", "orjson", "aiohttp",
+                 "scripts.kosis_reader", "scripts.auto_collect_kosis_statstics"]
+
+# ✅ 스케줄러가 이미 불러와 둔 모듈 (기준 시간에 포함)
+AIRFLOW_MODULES = ("airflow", "pendulum")
+
+CHILD_CODE = """
+import sys, json, time, importlib, runpy
+started = time.perf_counter()
+for module in {modules!r}:
+    importlib.import_module(module)
+{run}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def airflow_installed():
+    code = "import importlib.util, sys; sys.exit(0 if importlib.util.find_spec('airflow') else 1)"
+    return subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def top_level_imports(path):
+    """
+    DAG 파일의 모듈 최상단 import 목록 (함수 안 import 제외)
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def run_child(modules, dag_path=None):
+    run = f"runpy.run_path({dag_path!r}, run_name='dag_import_bench')" if dag_path else ""
+    code = CHILD_CODE.format(modules=modules, run=run, heavy=HEAVY_MODULES)
+    env = dict(os.environ, PYTHONPATH=REPO_DIR + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_DIR, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(modules, dag_path, repeat):
+    runs = [run_child(modules, dag_path) for _ in range(repeat)]
+    return statistics.median(r["seconds"] for r in runs), runs[-1]["heavy"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dags", nargs="+", default=DAG_FILES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-overhead", type=float, default=0.2)
+    args = parser.parse_args()
+
+    full = airflow_installed()
+    mode = "full" if full else "top-level"
+    baseline_modules = ["airflow", "airflow.operators.python", "pendulum"] if full else []
+    baseline, _ = measure(baseline_modules, None, args.repeat)
+    print(f"mode: {mode}{'' if full else ' (airflow 미설치)'} | 기준 시간: {baseline:.3f}s")
+    print(f"{'dag':<45} | {'import(s)':>9} | {'overhead(s)':>11} | heavy")
+    print("-" * 90)
+
+    failed = False
+    for dag in args.dags:
+        path = os.path.join(REPO_DIR, dag)
+        if full:
+            seconds, heavy = measure(baseline_modules, path, args.repeat)
+        else:
+            modules = [m for m in top_level_imports(path) if m.split(".")[0] not in AIRFLOW_MODULES]
+            seconds, heavy = measure(modules, None, args.repeat)
+        overhead = max(seconds - baseline, 0.0)
+        ok = not heavy and overhead <= args.max_overhead
+        failed |= not ok
+        print(f"{dag:<45} | {seconds:>9.3f} | {overhead:>11.3f} | {', '.join(heavy) or '-'} {'✅' if ok else '❌'}")
+
+    if failed:
+        print(f"❌ DAG 파싱 시 무거운 모듈이 로드되었거나 overhead가 {args.max_overhead}s를 넘었습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+수집 DataFrame 메모리 벤치마크
+
+응답 N건을 파싱 → 배치 병합 → 정제하는 동안 DataFrame이 차지하는 메모리를 세 표현으로 비교합니다.
+- object : parse_kosis_response + pd.concat (모든 컬럼 Python 문자열 object)
+- compact : parse_kosis_compact + concat_kosis_frames (응답 단위 범주형, OBS_VALUE float64)
+- batch : parse_kosis_response + concat_kosis_frames(categorize=True) (배치 단위 범주형, 파이프라인 사용 경로)
+  (응답 프레임은 object와 같고, 병합 후 배치부터 범주형 - 요청 스레드 파싱 시간과 큐 메모리의 교환)
+
+측정 항목
+- 응답 프레임 : 큐/배치 버퍼에 쌓이는 응답별 DataFrame 합계 (memory_usage(deep=True))
+- 병합 배치 / 정제 배치 : 배치 1개의 DataFrame 크기
+- peak : 파싱 ~ 정제 전체 구간의 tracemalloc 최대 사용량
+
+실행 예시
+    python -m scripts.benchmarks.bench_memory --responses 50 --rows 2000 10000
+"""
+import argparse
+import tracemalloc
+
+import pandas as pd
+
+from scripts.auto_collect_kosis_statstics import (
+    parse_kosis_response, parse_kosis_compact, concat_kosis_frames, normalize_kosis_frame)
+from scripts.benchmarks.synthetic import make_kosis_rows
+
+PATHS = {
+    "object": (parse_kosis_response, lambda frames: pd.concat(frames, ignore_index=True)),
+    "compact": (parse_kosis_compact, concat_kosis_frames),
+    "batch": (parse_kosis_response, lambda frames: concat_kosis_frames(frames, categorize=True)),
+}
+
+
+def frame_mb(df):
+    return df.memory_usage(index=True, deep=True).sum() / 1024 ** 2
+
+
+def measure(parse, concat, responses):
+    tracemalloc.start()
+    frames = [parse(rows) for rows in responses]
+    batch = concat(frames)
+    normalized = normalize_kosis_frame(batch)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "frames": sum(frame_mb(df) for df in frames),
+        "batch": frame_mb(batch),
+        "normalized": frame_mb(normalized),
+        "peak": peak / 1024 ** 2,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--responses", type=int, default=50)
+    parser.add_argument("--rows", type=int, nargs="+", default=[2_000, 10_000])
+    parser.add_argument("--dims", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows/resp':>9} {'total':>10} | {'path':<8} | {'frames MB':>9} | {'batch MB':>8} | "
+          f"{'clean MB':>8} | {'peak MB':>8} | {'ratio':>6}")
+    print("-" * 86)
+    for n_rows in args.rows:
+        responses = [make_kosis_rows(n_rows, tbl_id=f"DT_BENCH{i:03d}", n_dims=args.dims, seed=i)
+                     for i in range(args.responses)]
+        baseline = None
+        for name, (parse, concat) in PATHS.items():
+            r = measure(parse, concat, responses)
+            baseline = baseline or r["frames"]
+            print(f"{n_rows:>9,} {n_rows * args.responses:>10,} | {name:<8} | {r['frames']:>9.1f} | "
+                  f"{r['batch']:>8.1f} | {r['normalized']:>8.1f} | {r['peak']:>8.1f} | "
+                  f"{r['frames'] / baseline:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+메타 응답 처리 벤치마크 (Kosis.get_data vs Kosis.get_records)
+
+수집 1회에 통계표 수만큼 요청하는 1~수 행짜리 '자료갱신일' 응답을 네트워크 없이(_request 대체)
+처리하여 호출당 오버헤드를 비교합니다.
+- DataFrame 경로 : get_data() (빈 DataFrame + concat + dropna + translate_columns) 후 통계표별 컬럼 추가,
+  마지막에 pd.concat
+- 레코드 경로 : get_records() (미리 만든 스키마 순서 튜플) 후 records_to_frame()으로 DataFrame 1회 생성
+
+실행 예시
+    python -m scripts.benchmarks.bench_meta_records --tables 1000 5000 --periods 3
+"""
+import time
+import argparse
+
+import pandas as pd
+
+from scripts import kosis_reader as k_r
+from scripts.auto_collect_kosis_statstics import META_EXTRA_COLUMNS
+
+
+def make_meta_response(tbl_id, n_periods):
+    return [{"ORG_NM": "통계청", "TBL_NM": f"벤치마크 통계표 {tbl_id}", "PRD_SE": "월",
+             "PRD_DE": f"2025{month:02d}", "SEND_DE": "2025-05-25"} for month in range(1, n_periods + 1)]
+
+
+def run_frames(api, tables):
+    frames = []
+    for org_id, tbl_id, url in tables:
+        meta = api.get_data(service_name='통계표설명', detail_service_name='자료갱신일', orgId=org_id, tblId=tbl_id)
+        meta['org_id'], meta['tbl_id'], meta['col_url'] = org_id, tbl_id, url
+        frames.append(meta)
+    return pd.concat(frames, ignore_index=True)
+
+
+def run_records(api, tables):
+    records = []
+    for org_id, tbl_id, url in tables:
+        rows = api.get_records(service_name='통계표설명', detail_service_name='자료갱신일', orgId=org_id, tblId=tbl_id)
+        records.extend(row + (org_id, tbl_id, url) for row in rows)
+    return k_r.records_to_frame(records, api.get_schema('통계표설명', '자료갱신일') + META_EXTRA_COLUMNS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, nargs="+", default=[1_000, 5_000])
+    parser.add_argument("--periods", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'tables':>8} | {'path':<12} | {'total(s)':>9} | {'us/call':>9} | {'speedup':>7}")
+    print("-" * 58)
+    for n_tables in args.tables:
+        tables = [("101", f"DT_BENCH{i:05d}", f"2025{i:05d}") for i in range(n_tables)]
+        responses = {tbl_id: make_meta_response(tbl_id, args.periods) for _, tbl_id, _ in tables}
+        api = k_r.Kosis("bench-key")
+        api._request = lambda url, params: responses[params["tblId"]]
+
+        results = {}
+        for name, func in (("DataFrame", run_frames), ("records", run_records)):
+            start = time.perf_counter()
+            df = func(api, tables)
+            results[name] = (time.perf_counter() - start, df)
+
+        base_seconds, base_df = results["DataFrame"]
+        rec_seconds, rec_df = results["records"]
+        assert base_df[rec_df.columns].equals(rec_df), "두 경로의 결과가 다릅니다."
+        for name, (seconds, _) in results.items():
+            print(f"{n_tables:>8,} | {name:<12} | {seconds:>9.3f} | {seconds / n_tables * 1e6:>9.1f} | "
+                  f"{base_seconds / seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+정제 단계 벤치마크
+
+기존 정제 경로(clean_kosis_frame: replace → notna → isin → to_numeric → dropna → set_common_cols)와
+단일 패스 정제 함수(normalize_kosis_frame)의 처리 속도(rows/s)와 최대 메모리(tracemalloc)를 비교합니다.
+
+실행 예시
+    python -m scripts.benchmarks.bench_normalize --rows 100000 500000 --repeat 3
+"""
+import argparse
+import time
+import tracemalloc
+
+from scripts.auto_collect_kosis_statstics import normalize_kosis_frame
+from scripts.benchmarks.baselines import clean_kosis_frame
+from scripts.benchmarks.synthetic import make_fetched_frame
+
+
+def measure(func, df, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        frame = df.copy()
+        start = time.perf_counter()
+        func(frame)
+        best = min(best, time.perf_counter() - start)
+
+    frame = df.copy()
+    tracemalloc.start()
+    func(frame)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 500_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} | {'path':<22} | {'rows/s':>12} | {'peak MB':>8}")
+    print("-" * 62)
+    for n_rows in args.rows:
+        df = make_fetched_frame(n_rows)
+        for name, func in (("clean_kosis_frame", clean_kosis_frame),
+                           ("normalize_kosis_frame", normalize_kosis_frame)):
+            elapsed, peak = measure(func, df, args.repeat)
+            print(f"{len(df):>10,} | {name:<22} | {len(df) / elapsed:>12,.0f} | {peak / 1024 ** 2:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+응답 파싱 단계 벤치마크
+
+fetch_url()의 응답 bytes → 13개 컬럼 DataFrame 변환 경로를 응답 크기별로 비교합니다.
+- 기존 경로 : json.loads(response.json()과 동일) + json_normalize → rename → reindex
+- 컬럼 직접 구성 : json.loads + parse_kosis_response
+- 빠른 경로 : kosis_http.decode_json(orjson 설치 시 orjson) + parse_kosis_response (파이프라인 사용 경로)
+- 저메모리 경로 : kosis_http.decode_json + parse_kosis_compact (응답 단위 범주형 컬럼)
+  (파이프라인은 범주형 변환을 저장 스레드에서 배치 단위로 수행하므로 요청 스레드는 빠른 경로만 수행)
+
+응답 크기는 KOSIS 요청 1건 기준 (셀 제한 40,000건 이하)으로 잡습니다.
+
+실행 예시
+    python -m scripts.benchmarks.bench_parse --rows 1000 10000 40000 --repeat 5
+"""
+import json
+import time
+import argparse
+import tracemalloc
+
+from scripts import kosis_http
+from scripts.auto_collect_kosis_statstics import parse_kosis_response, parse_kosis_compact
+from scripts.benchmarks.baselines import parse_kosis_json_normalize
+from scripts.benchmarks.synthetic import make_kosis_rows
+
+PATHS = {
+    "json + json_normalize": lambda body: parse_kosis_json_normalize(json.loads(body)),
+    "json + columns": lambda body: parse_kosis_response(json.loads(body)),
+    "decode_json + columns": lambda body: parse_kosis_response(kosis_http.decode_json(body)),
+    "decode_json + compact": lambda body: parse_kosis_compact(kosis_http.decode_json(body)),
+}
+
+
+def measure(func, body, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(body)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 40_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    decoder = "orjson" if kosis_http.orjson is not None else "json (orjson 미설치)"
+    print(f"decode_json 디코더: {decoder}")
+    print(f"{'rows':>8} {'MB':>6} | {'path':<22} | {'rows/s':>12} | {'MB/s':>7} | {'peak MB':>8} | {'speedup':>7}")
+    print("-" * 84)
+    for n_rows in args.rows:
+        body = json.dumps(make_kosis_rows(n_rows), ensure_ascii=False).encode("utf-8")
+        size_mb = len(body) / 1024 ** 2
+        baseline = None
+        for name, func in PATHS.items():
+            seconds, peak = measure(func, body, args.repeat)
+            baseline = baseline or seconds
+            print(f"{n_rows:>8,} {size_mb:>6.1f} | {name:<22} | {n_rows / seconds:>12,.0f} | "
+                  f"{size_mb / seconds:>7.1f} | {peak / 1024 ** 2:>8.1f} | {baseline / seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Oracle 대체 DB 싱크 (벤치마크용)
+
+oracledb SessionPool / Connection / Cursor 중 수집 프로그램이 사용하는 인터페이스만 구현하여
+run_kosis_process_logging()과 insert_kosis_data()를 Oracle 없이 실행할 수 있게 합니다.
+- CD_KOSIS_REQ_MPP_P 조회 시 합성 통계표 목록 반환
+- executemany()는 행 수만 집계 (write_latency_per_1k로 DB 쓰기 지연 흉내, 행별 처리 건수는 모두 1)
+- keep_rows=True이면 저장된 행을 메모리에 보관 (결과 검증용)
+- CD_COLLECT_KOSIS_URL_LOG(URL 체크포인트)는 메모리 dict로 기록/조회 (저장 행 수에서 제외)
+- CD_KOSTAT_OPENAPI_FP(관측값 지문)도 메모리 dict로 기록/조회 (저장 행 수에서 제외)
+"""
+import time
+import threading
+
+
+class MemorySinkCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = 0
+        self._rows = []
+        self._batch_errors = []
+        self._row_counts = []
+
+    def execute(self, sql, params=None):
+        statement = " ".join(sql.split()).upper()
+        if "FROM CD_KOSIS_REQ_MPP_P" in statement:
+            self.description = [("ORG_ID",), ("TBL_ID",), ("URL",)]
+            tables = self.connection.pool.tables
+            if params:
+                tables = [t for t in tables if t[1] in set(params)]
+            self._rows = list(tables)
+        elif "FROM CD_COLLECT_KOSIS_URL_LOG" in statement:
+            ledger = self.connection.pool.ledger
+            self._rows = [(url_hash,) for (date, url_hash), row in ledger.items()
+                          if date == params[0] and row["status"] == "Y"]
+        elif "FROM CD_KOSTAT_OPENAPI_FP" in statement:
+            tbl_id, start, end = params
+            self._rows = [(period, key_hash, val_hash)
+                          for (tbl, period, key_hash), val_hash in self.connection.pool.fingerprints.items()
+                          if tbl == tbl_id and start <= period <= end]
+        else:
+            self._rows = []
+            self.connection.pool.record_statement(statement.split(" ", 1)[0], params)
+        self.rowcount = 1
+
+    def executemany(self, sql, rows, batcherrors=False, **kwargs):
+        pool = self.connection.pool
+        if "CD_COLLECT_KOSIS_URL_LOG" in sql:
+            pool.record_ledger(rows)
+            return
+        if "CD_KOSTAT_OPENAPI_FP" in sql:
+            pool.record_fingerprints(rows)
+            return
+        if pool.write_latency_per_1k:
+            time.sleep(pool.write_latency_per_1k * len(rows) / 1000)
+        self._batch_errors = []
+        self._row_counts = [1] * len(rows)
+        self.rowcount = len(rows)
+        pool.record_rows(rows)
+
+    def getbatcherrors(self):
+        return self._batch_errors
+
+    def getarraydmlrowcounts(self):
+        return self._row_counts
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MemorySinkConnection:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def cursor(self):
+        return MemorySinkCursor(self)
+
+    def commit(self):
+        self.pool.commit_count += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.pool.release(self)
+
+
+class MemorySinkPool:
+    """oracledb.SessionPool 대체 클래스
+
+    Parameters
+    ----------
+    tables : list of tuple
+        CD_KOSIS_REQ_MPP_P 조회 결과로 돌려줄 (ORG_ID, TBL_ID, URL) 목록
+    write_latency_per_1k : float
+        1,000행 저장당 지연시간(초)
+    keep_rows : bool
+        저장된 행 보관 여부
+    """
+
+    def __init__(self, tables, write_latency_per_1k=0.0, keep_rows=False):
+        self.tables = tables
+        self.write_latency_per_1k = write_latency_per_1k
+        self.keep_rows = keep_rows
+        self.rows_written = 0
+        self.commit_count = 0
+        self.statements = []
+        self.rows = []
+        self.ledger = {}
+        self.fingerprints = {}
+        self.busy = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            self.busy += 1
+        return MemorySinkConnection(self)
+
+    def release(self, connection):
+        with self._lock:
+            self.busy -= 1
+
+    def record_rows(self, rows):
+        with self._lock:
+            self.rows_written += len(rows)
+            if self.keep_rows:
+                self.rows.extend(rows)
+
+    def record_ledger(self, rows):
+        with self._lock:
+            for collect_date, url_hash, url, status, row_count, _ in rows:
+                entry = self.ledger.setdefault((collect_date, url_hash), {"url": url, "attempts": 0})
+                entry.update({"status": status, "rows": row_count, "attempts": entry["attempts"] + 1})
+
+    def record_fingerprints(self, rows):
+        with self._lock:
+            for tbl_id, period, key_hash, val_hash, _ in rows:
+                self.fingerprints[(tbl_id, period, key_hash)] = val_hash
+
+    def record_statement(self, kind, params):
+        with self._lock:
+            self.statements.append((kind, params))
+
+
+def make_tables(n_tables, org_id="101"):
+    """
+    합성 수집 대상 통계표 목록 생성
+    """
+    return [(org_id, f"DT_BENCH{i:04d}", f"2025{i:04d}") for i in range(n_tables)]
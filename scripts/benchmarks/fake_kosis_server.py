@@ -0,0 +1,238 @@
+"""
+KOSIS 가짜 OpenAPI 서버 (벤치마크용)
+
+로컬에서 statisticsData.do의 getMeta(자료갱신일, 분류항목) / getList 요청,
+Param/statisticsParameterData.do(통계자료 파라미터) 요청과 statisticsList.do(통계목록) 요청에 합성 응답을 돌려줍니다.
+- latency : 요청당 평균 지연시간(초), 0.5 ~ 1.5배 범위에서 무작위
+- error_rate : 오류 응답 비율 (절반은 HTTP 500, 절반은 KOSIS errMsg 41 이용 제한)
+- rows_per_period : getList 응답의 수록시점당 행 수 (응답 크기)
+- catalog_depth / catalog_fanout / catalog_tables : 통계목록 트리 깊이, 목록당 하위 목록 수, 말단 목록당 통계표 수
+  (catalog_added에 LIST_ID를 넣으면 해당 목록에 통계표 1개가 추가된 것처럼 응답 - 증분 갱신 확인용)
+- selected_items / selected_c1 : userStatsId 요청이 돌려줄 선택 범위 (앞에서부터 항목 / C1 분류값 수, None이면 전체)
+- HTTP/1.1 keep-alive 지원 (공유 세션의 연결 재사용 효과 측정 가능)
+
+실행 예시
+    python -m scripts.benchmarks.fake_kosis_server --port 8765 --latency 0.05 --rows-per-period 500
+"""
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from scripts import kosis_planner
+from scripts.benchmarks.synthetic import make_kosis_rows
+
+FREQ_NAMES = {"M": "월", "Q": "분기", "S": "반기", "Y": "년"}
+
+
+class FakeKosisServer:
+    """KOSIS 가짜 서버
+
+    Parameters
+    ----------
+    host, port : str, int
+        바인딩 주소 (port=0이면 빈 포트 자동 할당)
+    latency : float
+        요청당 평균 지연시간(초)
+    error_rate : float
+        오류 응답 비율 (0 ~ 1)
+    rows_per_period : int
+        getList 응답의 수록시점당 행 수
+    periods_per_table : int
+        자료갱신일 응답에 포함할 갱신 수록시점 수 (최근 월부터)
+    send_de : str
+        자료갱신일 응답의 SEND_DE 값 (YYYY-MM-DD)
+    seed : int
+        난수 시드
+    catalog_depth, catalog_fanout, catalog_tables : int
+        통계목록 트리 깊이 / 목록당 하위 목록 수 / 말단 목록당 통계표 수
+    selected_items, selected_c1 : int
+        userStatsId 요청의 선택 범위 (앞에서부터 항목 수 / C1 분류값 수, None이면 통계표 전체)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.05, error_rate=0.0, rows_per_period=100,
+                 periods_per_table=1, send_de="2025-05-25", seed=0, catalog_depth=3, catalog_fanout=5,
+                 catalog_tables=4, selected_items=None, selected_c1=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rows_per_period = rows_per_period
+        self.periods_per_table = periods_per_table
+        self.send_de = send_de
+        self.catalog_depth = catalog_depth
+        self.catalog_fanout = catalog_fanout
+        self.catalog_tables = catalog_tables
+        self.catalog_added = set()
+        self.selected_items = selected_items
+        self.selected_c1 = selected_c1
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._row_cache = {}
+        self.request_count = 0
+        self.bytes_sent = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-kosis", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _random(self):
+        with self._rng_lock:
+            return self._rng.random()
+
+    def _meta_rows(self, query):
+        periods = []
+        year, month = int(self.send_de[:4]), int(self.send_de[5:7])
+        for i in range(self.periods_per_table):
+            y, m = divmod(year * 12 + month - 2 - i, 12)
+            periods.append(f"{y:04d}{m + 1:02d}")
+        tbl_id = query.get("tblId", ["DT_BENCH"])[0]
+        return [{"ORG_NM": "벤치마크기관", "TBL_NM": f"벤치마크 통계표 {tbl_id}", "PRD_SE": FREQ_NAMES["M"],
+                 "PRD_DE": prd_de, "SEND_DE": self.send_de} for prd_de in reversed(periods)]
+
+    def _dims_rows(self, query):
+        # 수록시점 1개 분량의 합성 행에서 항목(ITEM) / 분류(C1~C8)별 분류값 목록 구성
+        tbl_id = query.get("tblId", ["DT_BENCH"])[0]
+        rows = make_kosis_rows(self.rows_per_period, tbl_id=tbl_id)
+        result = [{"OBJ_ID": "ITEM", "OBJ_NM": "항목", "ITM_ID": itm_id, "OBJ_ID_SN": "0"}
+                  for itm_id in dict.fromkeys(row["ITM_ID"] for row in rows)]
+        for level in range(1, 9):
+            codes = dict.fromkeys(row[f"C{level}"] for row in rows if row.get(f"C{level}"))
+            result.extend({"OBJ_ID": f"A{level}", "OBJ_NM": f"분류{level}", "ITM_ID": code, "OBJ_ID_SN": str(level)}
+                          for code in codes)
+        return result
+
+    def _list_rows(self, query):
+        vw_cd = query.get("vwCd", ["MT_ZTITLE"])[0]
+        parent = query.get("parentListId", [""])[0]
+        depth = len(parent) // 3
+        base = {"VW_CD": vw_cd, "VW_NM": "국내통계 주제별"}
+        if depth < self.catalog_depth:
+            rows = [{**base, "LIST_ID": f"{parent}L{i:02d}", "LIST_NM": f"목록 {parent}L{i:02d}"}
+                    for i in range(self.catalog_fanout)]
+        else:
+            rows = [{**base, "ORG_ID": "101", "TBL_ID": f"DT_{parent}_{i:02d}", "TBL_NM": f"통계표 {parent}-{i}",
+                     "REC_TBL_SE": "N"} for i in range(self.catalog_tables)]
+        if parent in self.catalog_added:
+            rows.append({**base, "ORG_ID": "101", "TBL_ID": f"DT_{parent}_NEW", "TBL_NM": f"신규 통계표 {parent}",
+                         "REC_TBL_SE": "N"})
+        return rows
+
+    def _data_rows(self, query):
+        prd_se = query.get("prdSe", ["M"])[0]
+        start = query.get("startPrdDe", [""])[0]
+        end = query.get("endPrdDe", [start])[0]
+        tbl_id = query.get("tblId", [None])[0] or query.get("userStatsId", ["x/101/DT_BENCH"])[0].split("/")[2]
+        start_ord = kosis_planner.period_to_ordinal(prd_se, start)
+        end_ord = kosis_planner.period_to_ordinal(prd_se, end)
+        if start_ord is None or end_ord is None:
+            periods = [start]
+        else:
+            periods = [kosis_planner.ordinal_to_period(prd_se, o) for o in range(start_ord, end_ord + 1)]
+
+        rows = []
+        for prd_de in periods:
+            key = (tbl_id, prd_se, prd_de)
+            if key not in self._row_cache:
+                self._row_cache[key] = make_kosis_rows(self.rows_per_period, tbl_id=tbl_id, prd_se=prd_se,
+                                                       prd_de=prd_de, seed=hash(key) & 0xFFFF)
+            rows.extend(self._row_cache[key])
+
+        # 통계자료 파라미터 요청: itmId / objL1~objL8 분류값 목록으로 필터링 (parse_qs가 '+'를 공백으로 변환)
+        filters = {"ITM_ID": query.get("itmId", ["ALL"])[0]}
+        filters.update({f"C{level}": query.get(f"objL{level}", ["ALL"])[0] for level in range(1, 9)})
+        filters = {column: set(value.split()) for column, value in filters.items() if value.strip() != "ALL"}
+        # userStatsId 요청: 저장된 선택 범위(앞에서부터 selected_items개 항목, selected_c1개 C1 분류값)로 필터링
+        if "userStatsId" in query:
+            for column, count in (("ITM_ID", self.selected_items), ("C1", self.selected_c1)):
+                if count is not None:
+                    filters[column] = set(list(dict.fromkeys(row.get(column) for row in rows))[:count])
+        if filters:
+            rows = [row for row in rows if all(row.get(column) in codes for column, codes in filters.items())]
+        return rows
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json;charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                server.bytes_sent += len(body)
+
+            def do_GET(self):
+                server.request_count += 1
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                if server.latency:
+                    time.sleep(server.latency * (0.5 + server._random()))
+
+                r = server._random()
+                if r < server.error_rate / 2:
+                    return self._send(500, {"error": "internal"})
+                if r < server.error_rate:
+                    return self._send(200, {"err": "41", "errMsg": "호출가능 ROW수 제한"})
+
+                method = query.get("method", [""])[0]
+                if parts.path.endswith("statisticsData.do") and method == "getMeta":
+                    if query.get("type", [""])[0] == "ITM":
+                        return self._send(200, server._dims_rows(query))
+                    return self._send(200, server._meta_rows(query))
+                if parts.path.endswith(("statisticsData.do", "statisticsParameterData.do")) and method == "getList":
+                    return self._send(200, server._data_rows(query))
+                if parts.path.endswith("statisticsList.do"):
+                    return self._send(200, server._list_rows(query))
+                return self._send(200, {"err": "21", "errMsg": "잘못된 요청변수"})
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rows-per-period", type=int, default=100)
+    parser.add_argument("--periods-per-table", type=int, default=1)
+    args = parser.parse_args()
+
+    server = FakeKosisServer(port=args.port, latency=args.latency, error_rate=args.error_rate,
+                             rows_per_period=args.rows_per_period, periods_per_table=args.periods_per_table)
+    print(f"가짜 KOSIS 서버 실행: {server.base_url} (Ctrl+C 종료)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+수집 파이프라인 종단간 벤치마크
+
+가짜 KOSIS 서버(FakeKosisServer)와 Oracle 대체 싱크(MemorySinkPool)로 run_kosis_process_logging()을
+실제 코드 그대로 실행하고, 설정 조합별로 다음 값을 출력합니다.
+- URL/s : 데이터 요청 처리량
+- rows/s : DB 저장 처리량
+- p50 / p99 : URL 요청 지연시간(초, 재시도 포함)
+- peak RSS : 최대 메모리 사용량(MB)
+
+설정 조합마다 별도 프로세스에서 실행하므로 peak RSS가 서로 섞이지 않습니다.
+
+실행 예시
+    python -m scripts.benchmarks.run_pipeline_bench --tables 200 --workers 5 15 30 --latency 0.05 0.2
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import itertools
+import resource
+import tempfile
+import subprocess
+import configparser
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "kosis_config", "config.ini")
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(int(round(q / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+
+def build_config(base_url, params, work_dir):
+    config = configparser.ConfigParser()
+    config.read(CONFIG_PATH, encoding="utf-8")
+    config.set("DEFAULT", "log_dir", os.path.join(work_dir, "logs"))
+    config.set("DEFAULT", "output_dir", os.path.join(work_dir, "outputs"))
+    config.set("DEFAULT", "tbl_id", "")
+    config.set("DEFAULT", "archive_raw", "false")
+    config.set("KOSIS", "base_url", base_url)
+    config.set("CACHE", "enabled", "false")
+    for section_key, value in params.get("config", {}).items():
+        section, key = section_key.split(".", 1) if "." in section_key else ("DEFAULT", section_key)
+        config.set(section, key, str(value))
+    return config
+
+
+def run_single(params):
+    """
+    설정 1개 실행 (자식 프로세스에서 호출)
+    """
+    from scripts import auto_collect_kosis_statstics as collector
+    from scripts.benchmarks.db_sink import MemorySinkPool, make_tables
+    from scripts.benchmarks.fake_kosis_server import FakeKosisServer
+
+    send_de = "2025-05-25"
+    latencies = []
+    url_count = [0]
+    original_fetch_url = collector.fetch_url
+
+    def timed_fetch_url(url, logger, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original_fetch_url(url, logger, *args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+            url_count[0] += 1
+
+    collector.fetch_url = timed_fetch_url
+
+    logger = logging.getLogger("kosis_bench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.WARNING)
+
+    server = FakeKosisServer(latency=params["latency"], error_rate=params["error_rate"],
+                             rows_per_period=params["rows_per_period"],
+                             periods_per_table=params["periods_per_table"], send_de=send_de).start()
+    pool = MemorySinkPool(make_tables(params["tables"]), write_latency_per_1k=params["db_latency_per_1k"])
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            config = build_config(server.base_url, params, work_dir)
+            start = time.perf_counter()
+            collector.run_kosis_process_logging(
+                [send_de], config, "20250525", 0, pool, logger,
+                max_workers=params["workers"], meta_max_workers=params["meta_workers"],
+                queue_size=params["queue_size"], batch_rows=params["batch_rows"])
+            elapsed = time.perf_counter() - start
+    finally:
+        server.stop()
+
+    return {
+        "elapsed": elapsed,
+        "http_requests": server.request_count,
+        "mb_sent": server.bytes_sent / 1024 ** 2,
+        "urls": url_count[0],
+        "rows": pool.rows_written,
+        "urls_per_sec": url_count[0] / elapsed if elapsed else 0.0,
+        "rows_per_sec": pool.rows_written / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        # Linux는 KB, macOS는 byte 단위
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 ** 2 if sys.platform == "darwin" else 1024),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, nargs="+", default=[200])
+    parser.add_argument("--workers", type=int, nargs="+", default=[15])
+    parser.add_argument("--meta-workers", type=int, default=5)
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.05])
+    parser.add_argument("--error-rate", type=float, nargs="+", default=[0.0])
+    parser.add_argument("--rows-per-period", type=int, nargs="+", default=[200])
+    parser.add_argument("--periods-per-table", type=int, default=1)
+    parser.add_argument("--db-latency-per-1k", type=float, default=0.0)
+    parser.add_argument("--queue-size", type=int, default=50)
+    parser.add_argument("--batch-rows", type=int, default=5000)
+    parser.add_argument("--set", action="append", default=[], metavar="[SECTION.]KEY=VALUE",
+                        help="config.ini 값 덮어쓰기 (예: --set adaptive_concurrency=true --set DB.write_mode=upsert)")
+    parser.add_argument("--single", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_single(json.loads(args.single))))
+        return
+
+    overrides = dict(item.split("=", 1) for item in args.set)
+    header = (f"{'tables':>6} {'workers':>7} {'latency':>7} {'err%':>5} {'rows/p':>6} | "
+              f"{'URL/s':>8} {'rows/s':>10} {'p50(s)':>7} {'p99(s)':>7} {'RSS(MB)':>8} {'HTTP':>6}")
+    print(header)
+    print("-" * len(header))
+    for tables, workers, latency, error_rate, rows_per_period in itertools.product(
+            args.tables, args.workers, args.latency, args.error_rate, args.rows_per_period):
+        params = {
+            "tables": tables, "workers": workers, "meta_workers": args.meta_workers,
+            "latency": latency, "error_rate": error_rate, "rows_per_period": rows_per_period,
+            "periods_per_table": args.periods_per_table, "db_latency_per_1k": args.db_latency_per_1k,
+            "queue_size": args.queue_size, "batch_rows": args.batch_rows, "config": overrides,
+        }
+        proc = subprocess.run(
+            [sys.executable, "-m", "scripts.benchmarks.run_pipeline_bench", "--single", json.dumps(params)],
+            capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"실행 실패: {params}\n{proc.stderr}")
+            continue
+        r = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(f"{tables:>6} {workers:>7} {latency:>7.3f} {error_rate * 100:>5.1f} {rows_per_period:>6} | "
+              f"{r['urls_per_sec']:>8.1f} {r['rows_per_sec']:>10,.0f} {r['p50']:>7.3f} {r['p99']:>7.3f} "
+              f"{r['peak_rss_mb']:>8.1f} {r['http_requests']:>6}")
+
+
+if __name__ == "__main__":
+    main()
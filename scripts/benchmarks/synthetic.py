@@ -0,0 +1,72 @@
+"""
+KOSIS 벤치마크용 합성 데이터 생성 모듈
+
+statisticsData.do 응답과 같은 형태의 행(dict)과, fetch_url()이 반환하는
+13개 컬럼 DataFrame을 만들어 벤치마크에서 공통으로 사용합니다.
+"""
+import random
+
+
+def make_kosis_rows(n_rows, tbl_id="DT_BENCH001", org_id="101", prd_se="M", prd_de="202504",
+                    n_dims=3, sentinel_ratio=0.05, seed=0):
+    """
+    statisticsData.do 응답 형태의 합성 행 목록 생성
+
+    Parameters
+    ----------
+    n_rows : int
+        생성할 행 수
+    n_dims : int
+        사용할 분류(C1~C8) 개수
+    sentinel_ratio : float
+        DT 값을 '-', '...', 빈 값으로 채울 비율
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_rows):
+        row = {
+            "ORG_ID": org_id,
+            "TBL_ID": tbl_id,
+            "TBL_NM": f"벤치마크 통계표 {tbl_id}",
+            "ITM_ID": f"T{i % 5 + 1:02d}",
+            "ITM_NM": f"항목{i % 5 + 1}",
+            "UNIT_NM": "천명",
+            "PRD_SE": prd_se,
+            "PRD_DE": prd_de,
+            "LST_CHN_DE": "2025-05-20",
+        }
+        for d in range(1, n_dims + 1):
+            code = (i // (5 * 10 ** (d - 1))) % 10
+            row[f"C{d}"] = f"{d}{code:03d}"
+            row[f"C{d}_NM"] = f"분류{d}-{code}"
+            row[f"C{d}_OBJ_NM"] = f"분류{d}"
+        r = rng.random()
+        if r < sentinel_ratio / 3:
+            row["DT"] = "-"
+        elif r < sentinel_ratio * 2 / 3:
+            row["DT"] = "..."
+        elif r < sentinel_ratio:
+            row["DT"] = None
+        else:
+            row["DT"] = f"{rng.uniform(0, 100000):.1f}"
+        rows.append(row)
+    return rows
+
+
+def make_fetched_frame(n_rows, n_tables=20, **kwargs):
+    """
+    fetch_url() 반환 형식(13개 컬럼)의 합성 DataFrame 생성
+    """
+    import pandas as pd
+
+    per_table = max(n_rows // n_tables, 1)
+    rows = []
+    for t in range(n_tables):
+        rows.extend(make_kosis_rows(per_table, tbl_id=f"DT_BENCH{t:03d}", seed=t, **kwargs))
+    df = pd.json_normalize(rows)
+    df.rename(columns={'PRD_DE': 'TIME_PERIOD', 'PRD_SE': 'FREQ', 'TBL_ID': 'KOSTAT_TBL_ID', 'DT': 'OBS_VALUE'},
+              inplace=True)
+    return df.reindex(columns=[
+        'KOSTAT_TBL_ID', 'TIME_PERIOD', 'FREQ', 'ITM_ID',
+        'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'OBS_VALUE'
+    ])
@@ -0,0 +1,124 @@
+"""
+KOSIS Raw Response Archive Module
+
+fetch_url()이 받은 원본 JSON 응답을 gzip으로 압축하여 output_dir에 보관합니다.
+- 파일명은 (수집일자 + URL) 해시값이므로 같은 날 같은 URL은 한 번만 저장 (content-addressed)
+- 수집일자(YYYYMMDD)별 디렉토리와 index.jsonl(해시 → URL)로 구성
+- URL의 apiKey 값은 해시 계산과 인덱스 저장 시 제외 (라이선스 키를 디스크에 남기지 않음)
+- retention_days가 지난 수집일자 디렉토리는 purge()로 삭제
+- replay 모드에서는 네트워크 없이 보관된 응답을 다시 읽어 DB에 적재
+"""
+import os
+import re
+import gzip
+import json
+import shutil
+import hashlib
+import threading
+from datetime import datetime, timedelta
+
+
+def redact_url(url):
+    """
+    URL의 apiKey 값 제거
+    """
+    return re.sub(r"([?&]apiKey=)[^&]*", r"\g<1>", url)
+
+
+class RawArchive:
+    """KOSIS 원본 응답 보관 클래스
+
+    Parameters
+    ----------
+    root_dir : str
+        보관 루트 디렉토리 (kosis_config.ini의 output_dir)
+    fetch_date : str
+        수집일자 (YYYYMMDD)
+    retention_days : int
+        보관 기간(일)
+    """
+
+    INDEX_FILE = "index.jsonl"
+
+    def __init__(self, root_dir, fetch_date, retention_days=14):
+        self.root_dir = root_dir
+        self.fetch_date = fetch_date
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+
+    def date_dir(self, fetch_date=None):
+        return os.path.join(self.root_dir, fetch_date or self.fetch_date)
+
+    def make_key(self, url, fetch_date=None):
+        raw = f"{fetch_date or self.fetch_date}|{redact_url(url)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def put(self, url, body):
+        """
+        원본 응답(bytes) 저장, 이미 저장된 경우 건너뜀
+
+        Returns
+        -------
+        bool
+            새로 저장했으면 True
+        """
+        key = self.make_key(url)
+        date_dir = self.date_dir()
+        path = os.path.join(date_dir, f"{key}.json.gz")
+        if os.path.exists(path):
+            return False
+
+        os.makedirs(date_dir, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+        entry = {"key": key, "url": redact_url(url), "bytes": len(body),
+                 "saved_at": datetime.now().isoformat(timespec="seconds")}
+        with self._lock:
+            with open(os.path.join(date_dir, self.INDEX_FILE), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return True
+
+    def get(self, url, fetch_date=None):
+        """
+        보관된 원본 응답(bytes) 반환, 없으면 None
+        """
+        path = os.path.join(self.date_dir(fetch_date), f"{self.make_key(url, fetch_date)}.json.gz")
+        try:
+            with gzip.open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def list_urls(self, fetch_date=None):
+        """
+        수집일자에 보관된 URL 목록 (apiKey 제외, 저장 순서)
+        """
+        index_path = os.path.join(self.date_dir(fetch_date), self.INDEX_FILE)
+        if not os.path.exists(index_path):
+            return []
+        with open(index_path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        return list(dict.fromkeys(entry["url"] for entry in entries))
+
+    def purge(self, today=None):
+        """
+        보관 기간이 지난 수집일자 디렉토리 삭제
+
+        Returns
+        -------
+        list
+            삭제한 수집일자 목록
+        """
+        if not os.path.isdir(self.root_dir):
+            return []
+        today = today or datetime.now()
+        cutoff = (today - timedelta(days=self.retention_days)).strftime("%Y%m%d")
+        removed = []
+        for name in sorted(os.listdir(self.root_dir)):
+            if len(name) == 8 and name.isdigit() and name < cutoff:
+                shutil.rmtree(os.path.join(self.root_dir, name), ignore_errors=True)
+                removed.append(name)
+        return removed
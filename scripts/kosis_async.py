@@ -0,0 +1,278 @@
+"""
+KOSIS Open API asyncio Module
+
+kosis_reader.Kosis와 같은 5개 서비스(KOSIS통합검색, 통계설명, 통계표설명, 통계목록, 통계자료)를
+asyncio + aiohttp로 호출하는 비동기 클라이언트입니다.
+- get_many(requests, concurrency=...) : 수천 건의 요청을 스레드 1개에서 제한된 동시성으로 실행
+- 요청별 timeout, 재시도(지터 지수 백오프), 외부 취소 시 진행 중인 요청 전체 취소
+- 서비스 URL / 요청 파라미터 / 레코드 스키마 / 디스크 캐시는 Kosis와 공유
+- limiter(kosis_http.AdaptiveLimiter)를 지정하면 스레드 요청과 같은 동시 요청 수 제한 안에서 요청
+- get_many()는 같은 요청(서비스 + 파라미터)을 1번만 보내고 결과를 공유
+- 디스크 캐시 조회/저장은 asyncio.to_thread로 실행하여 이벤트 루프를 막지 않음
+- 캐시 사용 시 같은 키의 진행 중인 요청은 동기 Kosis 요청과 함께 1번으로 병합 (KosisCache.claim/complete)
+- aiohttp는 선택 의존성 (미설치 시 AsyncKosis 생성 시점에 ImportError)
+
+사용 예시
+    async with AsyncKosis(license_key) as api:
+        results = await api.get_many(
+            [{"service_name": "통계표설명", "detail_service_name": "자료갱신일", "orgId": "101", "tblId": "DT_1IN1502"}],
+            concurrency=50)
+"""
+import time
+import asyncio
+import logging
+import contextlib
+
+import pandas as pd
+
+from scripts import kosis_http
+from scripts import kosis_reader as k_r
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp 미설치 시 동기 Kosis만 사용 가능
+    aiohttp = None
+
+# ✅ limiter 슬롯이 없을 때 다시 확인하기까지 대기 시간(초)
+LIMITER_POLL_SECONDS = 0.05
+
+
+class AsyncKosis:
+    """KOSIS 공유서비스 비동기 클래스
+
+    Parameters
+    ----------
+    service_key : str
+        KOSIS 공유서비스에서 발급받은 사용자 인증키
+    cache : kosis_reader.KosisCache
+        응답 캐시 (선택)
+    base_url : str
+        KOSIS OpenAPI 주소 (기본값: https://kosis.kr)
+    timeout : float
+        요청 1건당 전체 timeout(초) (기본값: 60)
+    max_connections : int
+        aiohttp 커넥션 풀 최대 연결 수 (기본값: 100)
+    retries : int
+        요청 실패 / KOSIS 이용 제한 시 재시도 횟수 (기본값: 2)
+    limiter : kosis_http.AdaptiveLimiter
+        동시 요청 수 제어기 (선택, 스레드 요청과 공유)
+    """
+
+    def __init__(self, service_key, cache=None, base_url=None, timeout=60, max_connections=100, retries=2,
+                 limiter=None):
+        if aiohttp is None:
+            raise ImportError("AsyncKosis를 사용하려면 aiohttp를 설치해야 합니다. (pip install aiohttp)")
+        # 서비스 URL, 파라미터 구성, 레코드 스키마, 응답 보정은 동기 클라이언트와 공유
+        self._kosis = k_r.Kosis(service_key, cache=cache, base_url=base_url)
+        self.cache = cache
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.retries = retries
+        self.limiter = limiter
+        self._session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def open(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, ssl=False)
+            self._session = aiohttp.ClientSession(connector=connector, headers=kosis_http.DEFAULT_HEADERS)
+        return self
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_json(self, service_name, detail_service_name=None, timeout=None, **kwargs):
+        """
+        API 호출 후 JSON 응답 반환 (요청 실패 또는 errMsg 응답 시 None)
+        """
+        url, _ = self._kosis._resolve_service(service_name, detail_service_name)
+        params = self._kosis._build_params(service_name, detail_service_name, kwargs)
+
+        if self.cache is None:
+            return await self._request(url, params, timeout or self.timeout)
+
+        key = self.cache.make_key(service_name, detail_service_name, params)
+        ttl = self.cache.get_ttl(service_name, detail_service_name)
+        res_json = await asyncio.to_thread(self.cache.get, key, ttl)
+        if res_json is not None:
+            return res_json
+
+        # 같은 키를 다른 스레드/코루틴이 요청 중이면 그 결과를 기다림 (KosisCache.get_or_fetch와 같은 병합)
+        owner, waiter = self.cache.claim(key)
+        if not owner:
+            await asyncio.to_thread(waiter["event"].wait)
+            return waiter["data"]
+        res_json = None
+        try:
+            res_json = await self._request(url, params, timeout or self.timeout)
+            if res_json is not None:
+                await asyncio.to_thread(self.cache.set, key, res_json)
+            return res_json
+        finally:
+            self.cache.complete(key, waiter, res_json)
+
+    async def get_records(self, service_name, detail_service_name=None, as_dict=False, timeout=None, **kwargs):
+        """
+        API 호출 (레코드 모드, Kosis.get_records()와 같은 형식)
+        """
+        res_json = await self.get_json(service_name, detail_service_name, timeout, **kwargs)
+        if res_json is None or isinstance(res_json, dict):
+            return None
+        keys, names = k_r.record_schema(service_name, detail_service_name)
+        records = [tuple(map(row.get, keys)) for row in res_json]
+        if as_dict:
+            return [dict(zip(names, record)) for record in records]
+        return records
+
+    async def get_data(self, service_name, detail_service_name=None, translate=True, timeout=None, **kwargs):
+        """
+        API 호출 (DataFrame 반환, Kosis.get_data()와 같은 형식)
+        """
+        res_json = await self.get_json(service_name, detail_service_name, timeout, **kwargs)
+        if res_json is None or isinstance(res_json, dict):
+            return None
+        _, columns = self._kosis._resolve_service(service_name, detail_service_name)
+        df = pd.concat([pd.DataFrame(columns=columns), pd.DataFrame(res_json)], axis=0, ignore_index=True).dropna(
+            axis=1, how="all")
+        if translate:
+            df = self._kosis.translate_columns(df, service_name, detail_service_name)
+        return df
+
+    def get_schema(self, service_name, detail_service_name=None, translate=True):
+        return k_r.get_schema(service_name, detail_service_name, translate)
+
+    async def get_many(self, requests, concurrency=20, mode="records", timeout=None):
+        """
+        여러 API 요청을 제한된 동시성으로 실행
+
+        요청 수와 무관하게 concurrency개의 작업 코루틴이 요청 목록을 나누어 처리하므로
+        메모리 사용량은 동시 요청 수에만 비례합니다. 호출한 쪽에서 취소하면 진행 중인 요청도 모두 취소됩니다.
+        같은 요청이 여러 번 있으면 1번만 요청하고 같은 결과 객체를 돌려줍니다.
+
+        Parameters
+        ----------
+        requests : iterable of dict
+            요청 목록. 각 dict는 service_name, detail_service_name(선택)과 API 파라미터를 포함
+        concurrency : int
+            동시 요청 수 (기본값: 20)
+        mode : str
+            records : get_records() 결과 / data : get_data() 결과 / json : 원본 JSON
+        timeout : float
+            요청 1건당 timeout(초), 지정하지 않으면 생성 시 timeout 사용
+
+        Returns
+        -------
+        list
+            입력 순서와 같은 결과 목록 (실패한 요청은 None)
+        """
+        handlers = {"records": self.get_records, "data": self.get_data, "json": self.get_json}
+        handler = handlers[mode]
+        requests = list(requests)
+        keys = [tuple(sorted((name, str(value)) for name, value in request.items())) for request in requests]
+        first_index = {}
+        for index, key in enumerate(keys):
+            first_index.setdefault(key, index)
+        results = [None] * len(requests)
+        next_index = iter(first_index.values())
+
+        async def worker():
+            for index in next_index:
+                request = dict(requests[index])
+                service_name = request.pop("service_name")
+                detail_service_name = request.pop("detail_service_name", None)
+                results[index] = await handler(service_name, detail_service_name, timeout=timeout, **request)
+
+        await self.open()
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, len(first_index))))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return [results[first_index[key]] for key in keys]
+
+    @contextlib.asynccontextmanager
+    async def _limiter_slot(self):
+        """
+        요청 1건 실행 구간 (limiter 슬롯을 이벤트 루프를 막지 않고 기다린 뒤 결과에 따라 축소/정상 기록)
+        """
+        limiter = self.limiter
+        if limiter is None:
+            yield
+            return
+        while not limiter.try_acquire():
+            await asyncio.sleep(LIMITER_POLL_SECONDS)
+        start = time.monotonic()
+        try:
+            yield
+        except kosis_http.KosisApiError as e:
+            limiter.release(time.monotonic() - start, ok=e.code in kosis_http.KOSIS_NO_DATA_CODES,
+                            throttled=e.throttled)
+            raise
+        except asyncio.CancelledError:
+            limiter.release(time.monotonic() - start)
+            raise
+        except Exception as e:
+            limiter.release(time.monotonic() - start, ok=False, throttled=_is_throttle_error(e))
+            raise
+        else:
+            limiter.release(time.monotonic() - start, ok=True)
+
+    async def _request(self, url, params, timeout):
+        """
+        API 요청 후 JSON 응답 반환 (재시도 후에도 실패하거나 errMsg 응답 시 None)
+        """
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        for attempt in range(1, self.retries + 2):
+            try:
+                async with self._limiter_slot():
+                    async with self._session.get(url, params=params, timeout=client_timeout) as res:
+                        res.raise_for_status()
+                        body = await res.read()
+                    res_json = self._kosis._decode(body)
+                    kosis_http.check_kosis_error(res_json)
+                return res_json
+            except kosis_http.KosisApiError as e:
+                if not e.throttled or attempt > self.retries:
+                    logging.warning("KOSIS 오류 응답: %s", e)
+                    return None
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                if attempt > self.retries:
+                    logging.warning("API 요청이 실패했습니다: %r", e)
+                    return None
+            await asyncio.sleep(kosis_http.backoff_delay(attempt))
+        return None
+
+
+def _is_throttle_error(error):
+    """
+    동시성을 줄여야 하는 aiohttp 오류인지 판단 (timeout, 연결 오류, 5xx/429)
+    """
+    if isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+        return True
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500 or error.status == 429
+    return False
+
+
+def run_many(service_key, requests, concurrency=20, mode="records", **kwargs):
+    """
+    동기 코드(Airflow 태스크 등)에서 AsyncKosis.get_many()를 실행하는 헬퍼
+
+    kwargs는 AsyncKosis 생성 인자 (cache, base_url, timeout, max_connections, retries, limiter)
+    """
+    async def _run():
+        async with AsyncKosis(service_key, **kwargs) as api:
+            return await api.get_many(requests, concurrency=concurrency, mode=mode)
+
+    return asyncio.run(_run())
@@ -0,0 +1,320 @@
+"""
+KOSIS 통계목록 Catalog Mirror Module
+
+KOSIS 통계목록(statisticsList.do) 트리를 VW_CD / LIST_ID 기준 너비 우선(BFS)으로 병렬 탐색하여
+로컬 sqlite 파일에 저장하고, 통계표 검색/조회를 API 호출 없이 수행합니다.
+- 같은 깊이의 목록은 한 번에 병렬 요청 (ThreadPoolExecutor 또는 kosis_async.run_many)
+- 목록별 하위 항목 해시(child_hash)와 마지막 탐색 시각(crawled_at)을 저장
+- 재실행 시 최상위부터 top_depth 깊이까지는 매번 요청하고, 그 아래는 새 목록, 상위 목록의 하위 항목이
+  바뀐 목록, refresh_days가 지난 목록만 다시 요청 (변경 없는 목록은 저장된 하위 목록으로 탐색만 이어감)
+  child_hash는 바로 아래 항목만 반영하므로, 변경 없는 상위 목록 아래 깊은 곳의 변경은 refresh_days 주기로 반영됨
+- 삭제된 목록은 하위 목록/통계표까지 함께 삭제
+- find_tables() / get_path() : 인덱스 조회로 통계표 검색 및 목록 경로 확인
+
+실행 예시
+    python -m scripts.kosis_catalog
+"""
+import json
+import time
+import sqlite3
+import hashlib
+import asyncio
+import concurrent.futures
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_list (
+    vw_cd          TEXT NOT NULL,
+    list_id        TEXT NOT NULL,
+    parent_list_id TEXT,
+    list_nm        TEXT,
+    child_hash     TEXT,
+    crawled_at     REAL,
+    PRIMARY KEY (vw_cd, list_id)
+);
+CREATE INDEX IF NOT EXISTS ix_catalog_list_parent ON catalog_list (vw_cd, parent_list_id);
+CREATE TABLE IF NOT EXISTS catalog_table (
+    vw_cd      TEXT NOT NULL,
+    list_id    TEXT NOT NULL,
+    org_id     TEXT NOT NULL,
+    tbl_id     TEXT NOT NULL,
+    tbl_nm     TEXT,
+    rec_tbl_se TEXT,
+    PRIMARY KEY (vw_cd, list_id, org_id, tbl_id)
+);
+CREATE INDEX IF NOT EXISTS ix_catalog_table_tbl ON catalog_table (tbl_id);
+CREATE INDEX IF NOT EXISTS ix_catalog_table_org ON catalog_table (org_id, tbl_id);
+"""
+
+# ✅ 최상위 목록 ID (parentListId 없이 요청)
+ROOT_LIST_ID = ""
+
+# ✅ 하위 목록 ID 조회 (자기 자신 포함, 재귀)
+SUBTREE_SQL = """
+    WITH RECURSIVE subtree(list_id) AS (
+        SELECT :list_id
+        UNION ALL
+        SELECT l.list_id FROM catalog_list l JOIN subtree s ON l.parent_list_id = s.list_id
+        WHERE l.vw_cd = :vw_cd
+    )
+    SELECT list_id FROM subtree
+"""
+
+
+class KosisCatalog:
+    """KOSIS 통계목록 로컬 미러 클래스
+
+    Parameters
+    ----------
+    db_path : str
+        sqlite 파일 경로
+    api : kosis_reader.Kosis
+        통계목록 요청에 사용할 API 객체 (crawl() 호출 시에만 필요)
+    max_workers : int
+        같은 깊이 목록의 동시 요청 수 (기본값: 10)
+    refresh_days : float
+        변경 여부와 무관하게 목록을 다시 요청하는 주기(일) (기본값: 7)
+    top_depth : int
+        매 실행마다 다시 요청할 최상위 목록 깊이 (기본값: 1, 0이면 최상위 목록만)
+    use_async : bool
+        True이면 스레드 풀 대신 kosis_async.run_many()로 요청 (aiohttp 필요)
+    logger : logging.Logger
+        로그 출력용 로거
+    """
+
+    def __init__(self, db_path, api=None, max_workers=10, refresh_days=7, top_depth=1, use_async=False,
+                 logger=None):
+        self.db_path = db_path
+        self.api = api
+        self.max_workers = max_workers
+        self.refresh_days = refresh_days
+        self.top_depth = top_depth
+        self.use_async = use_async
+        self.logger = logger
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(CATALOG_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def crawl(self, vw_cd="MT_ZTITLE"):
+        """
+        통계목록 트리 증분 탐색
+
+        top_depth 깊이까지는 매번 요청하여 child_hash를 비교하고, 하위 항목이 바뀐 목록의 하위 목록은
+        다시 요청합니다. 그 밖의 목록은 새로 생겼거나 refresh_days가 지났을 때만 요청합니다.
+        (KOSIS는 하위 트리 전체의 변경 여부를 알려주지 않으므로, 깊은 곳의 변경은 refresh_days 주기로 반영)
+
+        Returns
+        -------
+        dict
+            fetched(요청 목록 수), skipped(저장본 사용 목록 수), failed, changed(하위 항목이 바뀐 목록 수),
+            tables(전체 통계표 수), elapsed(초)
+        """
+        start = time.time()
+        stale_before = start - self.refresh_days * 86400
+        stats = {"fetched": 0, "skipped": 0, "failed": 0, "changed": 0}
+        self._ensure_list(vw_cd, ROOT_LIST_ID, None, None)
+
+        # (list_id, 강제 재요청 여부) - 하위 항목이 바뀐 목록의 하위 목록은 강제로 다시 요청
+        frontier = [(ROOT_LIST_ID, False)]
+        depth = 0
+        while frontier:
+            to_fetch = [list_id for list_id, force in frontier
+                        if force or depth <= self.top_depth or self._needs_fetch(vw_cd, list_id, stale_before)]
+            results = self._fetch_level(vw_cd, to_fetch)
+            next_frontier = []
+            for list_id, _ in frontier:
+                if list_id not in results:
+                    stats["skipped"] += 1
+                    next_frontier.extend((child, False) for child in self._child_lists(vw_cd, list_id))
+                    continue
+                rows = results[list_id]
+                if rows is None:
+                    # 요청 실패 시 저장본 유지 (crawled_at 미갱신 → 다음 실행에서 다시 요청)
+                    stats["failed"] += 1
+                    next_frontier.extend((child, False) for child in self._child_lists(vw_cd, list_id))
+                    continue
+                stats["fetched"] += 1
+                changed, children = self._apply(vw_cd, list_id, rows)
+                stats["changed"] += changed
+                next_frontier.extend((child, changed) for child in children)
+            self.logger and self.logger.info(
+                f"📚 통계목록 깊이 {depth}: 목록 {len(frontier)}개 중 {len(to_fetch)}개 요청")
+            frontier = next_frontier
+            depth += 1
+
+        stats["tables"] = self.table_count(vw_cd)
+        stats["elapsed"] = round(time.time() - start, 2)
+        self.logger and self.logger.info(f"📚 통계목록 미러 갱신 완료 ({vw_cd}): {stats}")
+        return stats
+
+    def find_tables(self, keyword=None, tbl_id=None, org_id=None, vw_cd=None, limit=None):
+        """
+        통계표 검색 (keyword는 통계표명 부분 일치)
+
+        Returns
+        -------
+        list of dict
+            vw_cd, list_id, org_id, tbl_id, tbl_nm, rec_tbl_se
+        """
+        conditions, params = [], []
+        for column, value in (("tbl_id", tbl_id), ("org_id", org_id), ("vw_cd", vw_cd)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if keyword:
+            conditions.append("tbl_nm LIKE ?")
+            params.append(f"%{keyword}%")
+        sql = "SELECT vw_cd, list_id, org_id, tbl_id, tbl_nm, rec_tbl_se FROM catalog_table"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY vw_cd, list_id, tbl_id"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        cursor = self.conn.execute(sql, params)
+        columns = [desc[0] for desc in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def get_path(self, vw_cd, list_id):
+        """
+        최상위부터 list_id까지의 목록명 경로
+        """
+        path = []
+        while list_id:
+            row = self.conn.execute(
+                "SELECT parent_list_id, list_nm FROM catalog_list WHERE vw_cd = ? AND list_id = ?",
+                (vw_cd, list_id)).fetchone()
+            if row is None:
+                break
+            path.append(row[1])
+            list_id = row[0]
+        return list(reversed(path))
+
+    def table_count(self, vw_cd=None):
+        if vw_cd is None:
+            return self.conn.execute("SELECT COUNT(*) FROM catalog_table").fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM catalog_table WHERE vw_cd = ?", (vw_cd,)).fetchone()[0]
+
+    def _needs_fetch(self, vw_cd, list_id, stale_before):
+        row = self.conn.execute(
+            "SELECT crawled_at FROM catalog_list WHERE vw_cd = ? AND list_id = ?", (vw_cd, list_id)).fetchone()
+        return row is None or row[0] is None or row[0] < stale_before
+
+    def _child_lists(self, vw_cd, list_id):
+        return [row[0] for row in self.conn.execute(
+            "SELECT list_id FROM catalog_list WHERE vw_cd = ? AND parent_list_id = ? ORDER BY list_id",
+            (vw_cd, list_id))]
+
+    def _ensure_list(self, vw_cd, list_id, parent_list_id, list_nm):
+        self.conn.execute(
+            "INSERT OR IGNORE INTO catalog_list (vw_cd, list_id, parent_list_id, list_nm) VALUES (?, ?, ?, ?)",
+            (vw_cd, list_id, parent_list_id, list_nm))
+        self.conn.commit()
+
+    def _fetch_level(self, vw_cd, list_ids):
+        """
+        같은 깊이의 목록을 병렬 요청 (반환값: list_id → 레코드 dict 목록, 실패 시 None)
+        """
+        if not list_ids:
+            return {}
+        requests_ = [
+            {"service_name": "통계목록", "vwCd": vw_cd, **({"parentListId": list_id} if list_id else {})}
+            for list_id in list_ids
+        ]
+        if self.use_async:
+            from scripts import kosis_async
+            results = asyncio.run(self._fetch_async(kosis_async, requests_))
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(
+                    lambda request: self.api.get_records(as_dict=True, **request), requests_))
+        return dict(zip(list_ids, results))
+
+    async def _fetch_async(self, kosis_async, requests_):
+        async with kosis_async.AsyncKosis(self.api.service_key, cache=self.api.cache, base_url=self.api.base_url,
+                                          max_connections=self.max_workers) as api:
+            records = await api.get_many(requests_, concurrency=self.max_workers, mode="records")
+        names = api.get_schema("통계목록")
+        return [None if rows is None else [dict(zip(names, row)) for row in rows] for rows in records]
+
+    def _apply(self, vw_cd, list_id, rows):
+        """
+        목록 1개의 응답 반영 (반환값: (하위 항목 변경 여부, 하위 목록 ID 목록))
+        """
+        lists = sorted({(row["목록ID"], row.get("목록명")) for row in rows if row.get("목록ID") and not row.get("통계표ID")})
+        tables = sorted({(row.get("기관ID") or "", row["통계표ID"], row.get("통계표명"), row.get("추천통계표여부"))
+                         for row in rows if row.get("통계표ID")})
+        child_hash = hashlib.sha256(json.dumps([lists, tables], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+        old = self.conn.execute(
+            "SELECT child_hash FROM catalog_list WHERE vw_cd = ? AND list_id = ?", (vw_cd, list_id)).fetchone()
+        old_hash = old[0] if old else None
+        now = time.time()
+        with self.conn:
+            if old_hash == child_hash:
+                self.conn.execute("UPDATE catalog_list SET crawled_at = ? WHERE vw_cd = ? AND list_id = ?",
+                                  (now, vw_cd, list_id))
+                return False, [child for child, _ in lists]
+
+            new_children = {child for child, _ in lists}
+            for removed in set(self._child_lists(vw_cd, list_id)) - new_children:
+                self._delete_subtree(vw_cd, removed)
+            self.conn.executemany(
+                "INSERT INTO catalog_list (vw_cd, list_id, parent_list_id, list_nm) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (vw_cd, list_id) DO UPDATE SET parent_list_id = excluded.parent_list_id, "
+                "list_nm = excluded.list_nm",
+                [(vw_cd, child, list_id, name) for child, name in lists])
+            self.conn.execute("DELETE FROM catalog_table WHERE vw_cd = ? AND list_id = ?", (vw_cd, list_id))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO catalog_table (vw_cd, list_id, org_id, tbl_id, tbl_nm, rec_tbl_se) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(vw_cd, list_id, *table) for table in tables])
+            self.conn.execute(
+                "UPDATE catalog_list SET child_hash = ?, crawled_at = ? WHERE vw_cd = ? AND list_id = ?",
+                (child_hash, now, vw_cd, list_id))
+        # 처음 탐색한 목록은 변경으로 보지 않음 (하위 목록은 crawled_at이 없어 어차피 요청됨)
+        return old_hash is not None, [child for child, _ in lists]
+
+    def _delete_subtree(self, vw_cd, list_id):
+        list_ids = [row[0] for row in self.conn.execute(SUBTREE_SQL, {"list_id": list_id, "vw_cd": vw_cd})]
+        self.conn.executemany("DELETE FROM catalog_table WHERE vw_cd = ? AND list_id = ?",
+                              [(vw_cd, lid) for lid in list_ids])
+        self.conn.executemany("DELETE FROM catalog_list WHERE vw_cd = ? AND list_id = ?",
+                              [(vw_cd, lid) for lid in list_ids])
+
+
+# ✅ 통계목록 미러 갱신 실행 함수
+# kosis_config.ini의 [CATALOG] 설정으로 vw_cd별 통계목록 트리를 증분 갱신합니다.
+def main():
+    from datetime import datetime
+    from scripts import kosis_reader as k_r
+    from scripts.auto_collect_kosis_statstics import load_config, setup_logger, start_log_listener
+
+    config = load_config()
+    logger = setup_logger(datetime.now().strftime("%Y%m%d"), config.get("DEFAULT", "log_dir"))
+    listener = start_log_listener(config, logger)
+    # 목록 갱신 주기는 refresh_days로 관리하므로 메타 응답 캐시는 사용하지 않음
+    api = k_r.Kosis(config.get("KOSIS", "license_key"),
+                    base_url=config.get("KOSIS", "base_url", fallback="").strip() or None)
+    vw_cds = [v.strip() for v in config.get("CATALOG", "vw_cd", fallback="MT_ZTITLE").split(",") if v.strip()]
+    try:
+        with KosisCatalog(
+                config.get("CATALOG", "db_path"), api,
+                max_workers=config.getint("CATALOG", "max_workers", fallback=10),
+                refresh_days=config.getfloat("CATALOG", "refresh_days", fallback=7),
+                top_depth=config.getint("CATALOG", "top_depth", fallback=1),
+                use_async=config.getboolean("CATALOG", "use_async", fallback=False),
+                logger=logger) as catalog:
+            return {vw_cd: catalog.crawl(vw_cd) for vw_cd in vw_cds}
+    finally:
+        listener and listener.stop()
+
+
+if __name__ == "__main__":
+    main()
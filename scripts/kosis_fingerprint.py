@@ -0,0 +1,161 @@
+"""
+KOSIS Observation Fingerprint Module
+
+관측값 단위(KOSTAT_TBL_ID, TIME_PERIOD, ITM_ID, C1~C8)의 내용 지문(fingerprint)을
+Oracle 테이블(CD_KOSTAT_OPENAPI_FP)에 저장하여, days_back 기간 동안 매일 다시 내려받는
+같은 관측값을 저장 전에 제외합니다.
+- KEY_HASH : 자연키(KOSTAT_TBL_ID, TIME_PERIOD, ITM_ID, C1~C8) 해시, VAL_HASH : 값(FREQ, OBS_VALUE) 해시 (64bit, 16자리 16진수)
+- 저장된 VAL_HASH와 같은 행(변경 없음)과 같은 실행 안에서 겹치는 URL로 중복 수신된 행은 저장 대상에서 제외
+- 통계표별 수록시점 범위를 배치당 1회 조회 후 메모리에 보관 (같은 실행에서 다시 조회하지 않음)
+- 지문은 배치 저장 커밋 후 저장된 행만 갱신 (batch error로 제외된 행, 롤백된 청크의 행은 다음 실행에서 다시 저장)
+
+테이블 DDL
+    CREATE TABLE CD_KOSTAT_OPENAPI_FP (
+        KOSTAT_TBL_ID VARCHAR2(40)  NOT NULL,
+        TIME_PERIOD   VARCHAR2(20)  NOT NULL,
+        KEY_HASH      VARCHAR2(16)  NOT NULL,
+        VAL_HASH      VARCHAR2(16)  NOT NULL,
+        Z_MOD_DTM     TIMESTAMP,
+        CONSTRAINT PK_CD_KOSTAT_OPENAPI_FP PRIMARY KEY (KOSTAT_TBL_ID, TIME_PERIOD, KEY_HASH)
+    );
+"""
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+# ✅ 관측값 자연키 / 값 컬럼
+FINGERPRINT_KEY_COLUMNS = ['KOSTAT_TBL_ID', 'TIME_PERIOD', 'ITM_ID', 'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8']
+FINGERPRINT_VALUE_COLUMNS = ['FREQ', 'OBS_VALUE']
+
+FP_SELECT_SQL = """
+    SELECT TIME_PERIOD, KEY_HASH, VAL_HASH FROM CD_KOSTAT_OPENAPI_FP
+    WHERE KOSTAT_TBL_ID = :1 AND TIME_PERIOD BETWEEN :2 AND :3
+"""
+
+FP_MERGE_SQL = """
+    MERGE INTO CD_KOSTAT_OPENAPI_FP t
+    USING (
+        SELECT :1 AS KOSTAT_TBL_ID, :2 AS TIME_PERIOD, :3 AS KEY_HASH, :4 AS VAL_HASH, :5 AS NOW_DTM FROM DUAL
+    ) s
+    ON (t.KOSTAT_TBL_ID = s.KOSTAT_TBL_ID AND t.TIME_PERIOD = s.TIME_PERIOD AND t.KEY_HASH = s.KEY_HASH)
+    WHEN MATCHED THEN UPDATE SET t.VAL_HASH = s.VAL_HASH, t.Z_MOD_DTM = s.NOW_DTM
+    WHEN NOT MATCHED THEN INSERT (KOSTAT_TBL_ID, TIME_PERIOD, KEY_HASH, VAL_HASH, Z_MOD_DTM)
+        VALUES (s.KOSTAT_TBL_ID, s.TIME_PERIOD, s.KEY_HASH, s.VAL_HASH, s.NOW_DTM)
+"""
+
+
+def frame_fingerprints(df):
+    """
+    행별 (KEY_HASH, VAL_HASH) uint64 배열
+
+    pandas.util.hash_pandas_object(고정 hash_key)를 사용하므로 실행이 바뀌어도 같은 값은 같은 해시가 됩니다.
+    NULL(None/NaN)은 모두 같은 값으로 취급합니다.
+    """
+    key_hash = pd.util.hash_pandas_object(df[FINGERPRINT_KEY_COLUMNS], index=False).to_numpy()
+    val_hash = pd.util.hash_pandas_object(df[FINGERPRINT_VALUE_COLUMNS], index=False).to_numpy()
+    return key_hash, val_hash
+
+
+class FingerprintStore:
+    """관측값 변경 감지 클래스
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        로그 출력용 로거
+    """
+
+    def __init__(self, logger=None):
+        self.logger = logger
+        self._known = {}  # KEY_HASH → VAL_HASH (저장된 지문 + 이번 실행 저장분)
+        self._loaded = set()  # 지문을 조회한 (KOSTAT_TBL_ID, TIME_PERIOD)
+        self._lock = threading.Lock()
+
+    def filter_changed(self, connection, df):
+        """
+        변경된 행만 남긴 DataFrame과 지문 반환
+
+        Returns
+        -------
+        tuple
+            (변경 행 DataFrame(원래 인덱스 유지), 변경 행 지문, {"duplicate": 중복 행 수, "unchanged": 변경 없는 행 수})
+            지문은 저장 성공 후 commit()에 그대로 전달
+        """
+        if df.empty:
+            return df, None, {"duplicate": 0, "unchanged": 0}
+        key_hash, val_hash = frame_fingerprints(df)
+
+        # 같은 배치 안에서 겹치는 URL로 중복 수신된 행은 마지막 행만 유지 (KEY_HASH에 통계표/수록시점 포함)
+        unique_mask = ~pd.Series(key_hash).duplicated(keep="last").to_numpy()
+        tbl_ids = df['KOSTAT_TBL_ID'].to_numpy(dtype=object)
+        periods = df['TIME_PERIOD'].to_numpy(dtype=object)
+        self._load(connection, set(zip(tbl_ids[unique_mask], periods[unique_mask])))
+
+        with self._lock:
+            known = self._known
+            unchanged = np.fromiter((known.get(k) == v for k, v in zip(key_hash.tolist(), val_hash.tolist())),
+                                    dtype=bool, count=len(df))
+        keep = unique_mask & ~unchanged
+        stats = {"duplicate": int((~unique_mask).sum()), "unchanged": int((unique_mask & unchanged).sum())}
+        fingerprints = (tbl_ids[keep], periods[keep], key_hash[keep], val_hash[keep])
+        if keep.all():
+            return df, fingerprints, stats
+        return df[keep], fingerprints, stats
+
+    def commit(self, connection, fingerprints, skip_rows=None):
+        """
+        저장이 끝난 행의 지문 기록 후 커밋 (실패 시 롤백 후 경고만 남김)
+
+        skip_rows : 저장되지 않은 행 위치 목록 (batch error 제외 행, 롤백된 청크의 행), 지문 기록에서 제외
+        """
+        if fingerprints is None or not len(fingerprints[0]):
+            return
+        if skip_rows:
+            keep = np.ones(len(fingerprints[0]), dtype=bool)
+            keep[np.asarray(skip_rows, dtype=np.intp)] = False
+            fingerprints = tuple(values[keep] for values in fingerprints)
+            if not keep.any():
+                return
+        tbl_ids, periods, key_hash, val_hash = fingerprints
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        rows = [(tbl_id, period, f"{k:016x}", f"{v:016x}", now)
+                for tbl_id, period, k, v in zip(tbl_ids, periods, key_hash.tolist(), val_hash.tolist())]
+        try:
+            with connection.cursor() as cursor:
+                cursor.executemany(FP_MERGE_SQL, rows)
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            self.logger and self.logger.warning(f"⚠️ 관측값 지문 기록 실패 ({len(rows)}건): {e}")
+            return
+        with self._lock:
+            self._known.update(zip(key_hash.tolist(), val_hash.tolist()))
+
+    def _load(self, connection, slices):
+        """
+        아직 조회하지 않은 (통계표, 수록시점)의 저장된 지문 조회 (통계표별 수록시점 범위 1회 조회)
+        """
+        with self._lock:
+            missing = slices - self._loaded
+        periods_by_tbl = {}
+        for tbl_id, period in missing:
+            if period is not None:
+                periods_by_tbl.setdefault(tbl_id, []).append(period)
+        if not periods_by_tbl:
+            return
+
+        loaded = {}
+        with connection.cursor() as cursor:
+            for tbl_id, periods in periods_by_tbl.items():
+                wanted = set(periods)
+                cursor.execute(FP_SELECT_SQL, [tbl_id, min(periods), max(periods)])
+                for period, key_hex, val_hex in cursor.fetchall():
+                    if period in wanted:
+                        loaded[int(key_hex, 16)] = int(val_hex, 16)
+        with self._lock:
+            for key, value in loaded.items():
+                self._known.setdefault(key, value)
+            self._loaded |= missing
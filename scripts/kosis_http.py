@@ -0,0 +1,273 @@
+"""
+KOSIS HTTP Session Module
+
+수집 프로그램(fetch_url)과 kosis_reader.Kosis가 함께 사용하는 공유 HTTP 세션입니다.
+- 하나의 requests.Session을 모든 워커 스레드가 공유 (urllib3 커넥션 풀은 thread-safe)
+- 커넥션 풀 크기를 병렬 요청 수(max_workers)에 맞춰 keep-alive 연결 재사용
+- gzip/deflate 압축 응답 요청 (Accept-Encoding)
+- 응답 지연/오류율에 따라 동시 요청 수를 조절하는 AdaptiveLimiter 및 지터 지수 백오프
+- 응답 bytes JSON 디코딩 (orjson 설치 시 orjson, 없으면 표준 json)
+"""
+import json
+import time
+import random
+import threading
+from contextlib import contextmanager, nullcontext
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+requests.packages.urllib3.disable_warnings()
+
+# ✅ KOSIS OpenAPI 기본 주소 (벤치마크 등에서 로컬 서버로 교체 가능)
+KOSIS_BASE_URL = "https://kosis.kr"
+
+DEFAULT_POOL_SIZE = 15
+
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+_session = None
+_pool_size = None
+_lock = threading.Lock()
+
+
+def _build_session(pool_size):
+    session = requests.Session()
+    # 재시도는 호출부(fetch_url, fetch_meta)에서 백오프와 함께 처리하므로 어댑터 재시도는 사용하지 않음
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    session.verify = False
+    return session
+
+
+def configure_session(pool_size):
+    """
+    공유 세션 커넥션 풀 크기 설정
+
+    현재 풀보다 큰 크기가 요청된 경우에만 세션을 새로 만듭니다.
+    (기존 세션은 진행 중인 요청이 끝나도록 닫지 않고 교체)
+
+    Parameters
+    ----------
+    pool_size : int
+        호스트당 최대 유지 연결 수 (일반적으로 max_workers)
+    """
+    global _session, _pool_size
+    pool_size = max(int(pool_size), 1)
+    with _lock:
+        if _session is None or pool_size > _pool_size:
+            _session = _build_session(pool_size)
+            _pool_size = pool_size
+        return _session
+
+
+def get_session():
+    """
+    공유 세션 반환 (미설정 시 DEFAULT_POOL_SIZE로 생성)
+    """
+    session = _session
+    if session is None:
+        session = configure_session(DEFAULT_POOL_SIZE)
+    return session
+
+
+# ✅ KOSIS 오류 코드
+# - 30: 조회결과 없음 (정상 응답으로 취급)
+# - 31: 조회결과 셀 수 제한(4만 셀) 초과 → 요청 범위 분할 대상
+# - 40, 41, 42: 호출 건수/ROW 수/사용자별 이용 제한, 50: 서버 오류 → 동시성 축소 대상
+KOSIS_NO_DATA_CODES = {"30"}
+KOSIS_CELL_LIMIT_CODES = {"31"}
+KOSIS_THROTTLE_CODES = {"40", "41", "42", "50"}
+
+
+class KosisApiError(Exception):
+    """KOSIS errMsg 응답 오류
+
+    Parameters
+    ----------
+    code : str
+        KOSIS 오류 코드 (err)
+    message : str
+        KOSIS 오류 메시지 (errMsg)
+    """
+
+    def __init__(self, code, message):
+        super().__init__(f"[{code}] {message}")
+        self.code = str(code) if code is not None else None
+        self.message = message
+
+    @property
+    def throttled(self):
+        return self.code in KOSIS_THROTTLE_CODES
+
+
+def decode_json(body):
+    """
+    응답 bytes를 JSON으로 디코딩 (response.json()의 문자셋 추정/str 변환을 거치지 않음)
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def check_kosis_error(res_json):
+    """
+    errMsg 응답이면 KosisApiError 발생
+    """
+    if isinstance(res_json, dict) and res_json.get("errMsg"):
+        raise KosisApiError(res_json.get("err"), res_json.get("errMsg"))
+
+
+def is_throttle_error(error):
+    """
+    동시성을 줄여야 하는 오류인지 판단 (timeout, 5xx, 연결 오류, KOSIS 이용 제한/서버 오류)
+    """
+    if isinstance(error, KosisApiError):
+        return error.throttled
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return False
+
+
+def backoff_delay(attempt, base=2.0, cap=60.0):
+    """
+    지터를 적용한 지수 백오프 대기 시간(초)
+
+    base * 2^(attempt-1)을 cap으로 제한한 값의 절반은 고정, 나머지 절반은 무작위로 더해
+    여러 워커가 같은 시점에 재시도하지 않도록 합니다.
+    """
+    delay = min(cap, base * (2 ** (attempt - 1)))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class AdaptiveLimiter:
+    """응답 상태 기반 동시 요청 수 제어 클래스 (AIMD)
+
+    window건의 요청마다 평균 지연시간이 latency_target 이하이고 오류율이
+    error_threshold 미만이면 동시 요청 수를 1 늘리고, timeout/5xx/KOSIS 이용 제한
+    오류가 발생하면 decrease_factor 비율로 즉시 줄입니다.
+
+    Parameters
+    ----------
+    min_limit : int
+        최소 동시 요청 수
+    max_limit : int
+        최대 동시 요청 수 (ThreadPoolExecutor 스레드 수)
+    initial : int
+        시작 동시 요청 수 (기본값: min_limit와 max_limit의 중간)
+    latency_target : float
+        정상으로 판단하는 평균 응답 시간(초)
+    error_threshold : float
+        정상으로 판단하는 최대 오류율
+    window : int
+        동시성 증가 판단에 사용하는 요청 수
+    decrease_factor : float
+        축소 시 곱하는 비율
+    """
+
+    def __init__(self, min_limit=2, max_limit=30, initial=None, latency_target=10.0,
+                 error_threshold=0.05, window=20, decrease_factor=0.7, logger=None):
+        self.min_limit = max(int(min_limit), 1)
+        self.max_limit = max(int(max_limit), self.min_limit)
+        self.limit = initial if initial is not None else (self.min_limit + self.max_limit) // 2
+        self.limit = min(max(int(self.limit), self.min_limit), self.max_limit)
+        self.latency_target = latency_target
+        self.error_threshold = error_threshold
+        self.window = window
+        self.decrease_factor = decrease_factor
+        self.logger = logger
+        self.inflight = 0
+        self._cond = threading.Condition()
+        self._reset_window()
+        self._last_decrease = 0.0
+
+    def _reset_window(self):
+        self._count = 0
+        self._errors = 0
+        self._latency_sum = 0.0
+
+    def acquire(self):
+        with self._cond:
+            while self.inflight >= self.limit:
+                self._cond.wait()
+            self.inflight += 1
+
+    def try_acquire(self):
+        """
+        슬롯이 비어 있으면 점유 후 True, 없으면 기다리지 않고 False (asyncio 이벤트 루프에서 사용)
+        """
+        with self._cond:
+            if self.inflight >= self.limit:
+                return False
+            self.inflight += 1
+            return True
+
+    def release(self, latency=None, ok=True, throttled=False):
+        with self._cond:
+            self.inflight -= 1
+            if throttled:
+                self._decrease()
+            else:
+                self._count += 1
+                self._errors += 0 if ok else 1
+                self._latency_sum += latency or 0.0
+                if self._count >= self.window:
+                    healthy = (self._latency_sum / self._count <= self.latency_target
+                               and self._errors / self._count < self.error_threshold)
+                    if healthy and self.limit < self.max_limit:
+                        self.limit += 1
+                        self._log(f"📈 동시 요청 수 증가: {self.limit}")
+                    self._reset_window()
+            self._cond.notify_all()
+
+    def _decrease(self):
+        # 같은 원인으로 동시에 실패한 요청들이 연달아 축소하지 않도록 1초 내 재축소는 무시
+        now = time.monotonic()
+        if now - self._last_decrease < 1.0:
+            return
+        self._last_decrease = now
+        new_limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+        if new_limit < self.limit:
+            self.limit = new_limit
+            self._log(f"📉 동시 요청 수 축소: {self.limit}")
+        self._reset_window()
+
+    def _log(self, message):
+        if self.logger:
+            self.logger.info(message)
+
+    @contextmanager
+    def slot(self):
+        """
+        요청 1건 실행 구간 (예외 종류에 따라 자동으로 축소/정상 기록)
+        """
+        self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except KosisApiError as e:
+            self.release(time.monotonic() - start, ok=e.code in KOSIS_NO_DATA_CODES, throttled=e.throttled)
+            raise
+        except Exception as e:
+            self.release(time.monotonic() - start, ok=False, throttled=is_throttle_error(e))
+            raise
+        else:
+            self.release(time.monotonic() - start, ok=True)
+
+
+def limiter_slot(limiter):
+    """
+    limiter가 없으면 아무 제한 없는 컨텍스트 반환
+    """
+    return limiter.slot() if limiter is not None else nullcontext()
@@ -0,0 +1,119 @@
+"""
+KOSIS URL Checkpoint Ledger Module
+
+수집 URL별 처리 상태를 Oracle 테이블(CD_COLLECT_KOSIS_URL_LOG)에 기록하여,
+실행이 중간에 실패한 뒤 재실행(Airflow retries)하면 이미 저장이 끝난 URL은 건너뛰고
+실패/미처리 URL만 다시 수집할 수 있게 합니다.
+- STATUS = 'Y' : 응답 수신 후 DB 커밋까지 완료 (조회결과 없음 포함)
+- STATUS = 'N' : 요청 실패 또는 저장 실패 (다음 실행에서 다시 수집)
+- ROW_CNT : 응답 행 수, ATTEMPT_CNT : 실행 회차별 시도 횟수 누적
+- URL은 apiKey를 제거한 값과 그 SHA-256 해시(URL_HASH)로 저장 (라이선스 키를 남기지 않음)
+
+테이블 DDL
+    CREATE TABLE CD_COLLECT_KOSIS_URL_LOG (
+        COLLECT_DATE VARCHAR2(8)    NOT NULL,
+        URL_HASH     VARCHAR2(64)   NOT NULL,
+        URL          VARCHAR2(1000),
+        STATUS       CHAR(1)        NOT NULL,
+        ROW_CNT      NUMBER,
+        ATTEMPT_CNT  NUMBER         DEFAULT 0,
+        Z_REG_DTM    TIMESTAMP,
+        Z_MOD_DTM    TIMESTAMP,
+        CONSTRAINT PK_CD_COLLECT_KOSIS_URL_LOG PRIMARY KEY (COLLECT_DATE, URL_HASH)
+    );
+"""
+import hashlib
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from scripts import kosis_archive
+
+LEDGER_SELECT_DONE_SQL = """
+    SELECT URL_HASH FROM CD_COLLECT_KOSIS_URL_LOG
+    WHERE COLLECT_DATE = :1 AND STATUS = 'Y'
+"""
+
+LEDGER_MERGE_SQL = """
+    MERGE INTO CD_COLLECT_KOSIS_URL_LOG t
+    USING (
+        SELECT :1 AS COLLECT_DATE, :2 AS URL_HASH, :3 AS URL, :4 AS STATUS, :5 AS ROW_CNT, :6 AS NOW_DTM
+        FROM DUAL
+    ) s
+    ON (t.COLLECT_DATE = s.COLLECT_DATE AND t.URL_HASH = s.URL_HASH)
+    WHEN MATCHED THEN UPDATE SET
+        t.STATUS = s.STATUS, t.ROW_CNT = s.ROW_CNT, t.ATTEMPT_CNT = t.ATTEMPT_CNT + 1, t.Z_MOD_DTM = s.NOW_DTM
+    WHEN NOT MATCHED THEN INSERT (
+        COLLECT_DATE, URL_HASH, URL, STATUS, ROW_CNT, ATTEMPT_CNT, Z_REG_DTM, Z_MOD_DTM
+    ) VALUES (
+        s.COLLECT_DATE, s.URL_HASH, s.URL, s.STATUS, s.ROW_CNT, 1, s.NOW_DTM, s.NOW_DTM
+    )
+"""
+
+
+def url_hash(url):
+    """
+    apiKey를 제거한 URL의 SHA-256 해시
+    """
+    return hashlib.sha256(kosis_archive.redact_url(url).encode("utf-8")).hexdigest()
+
+
+class UrlLedger:
+    """URL 단위 수집 체크포인트 클래스
+
+    Parameters
+    ----------
+    collect_date : str
+        수집일자 (YYYYMMDD, CD_COLLECT_KOSIS_OPENAPI_YN의 COLLECT_DATE와 같은 값)
+    logger : logging.Logger
+        로그 출력용 로거
+    """
+
+    def __init__(self, collect_date, logger=None):
+        self.collect_date = collect_date
+        self.logger = logger
+
+    def load_done(self, connection):
+        """
+        완료(STATUS = 'Y')된 URL 해시 집합 조회
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(LEDGER_SELECT_DONE_SQL, [self.collect_date])
+            return {row[0] for row in cursor.fetchall()}
+
+    def split_done(self, connection, urls):
+        """
+        URL 목록을 (미완료 URL 목록, 완료 URL 집합)으로 분리 (입력 순서 유지)
+        """
+        done_hashes = self.load_done(connection)
+        pending, done = [], set()
+        for url in urls:
+            if url_hash(url) in done_hashes:
+                done.add(url)
+            else:
+                pending.append(url)
+        return pending, done
+
+    def record(self, connection, entries):
+        """
+        URL 처리 결과 기록 후 커밋
+
+        Parameters
+        ----------
+        entries : list of tuple
+            (url, status('Y'/'N'), row_count)
+        """
+        if not entries:
+            return
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        rows = [
+            (self.collect_date, url_hash(url), kosis_archive.redact_url(url)[:1000], status, row_count, now)
+            for url, status, row_count in entries
+        ]
+        try:
+            with connection.cursor() as cursor:
+                cursor.executemany(LEDGER_MERGE_SQL, rows)
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            # 체크포인트 기록 실패는 수집 자체를 멈추지 않음 (다음 실행에서 해당 URL을 다시 수집)
+            self.logger and self.logger.warning(f"⚠️ URL 체크포인트 기록 실패 ({len(rows)}건): {e}")
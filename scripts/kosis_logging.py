@@ -0,0 +1,152 @@
+"""
+KOSIS Logging Module
+
+수집 중 요청 스레드의 로그 출력이 파일/콘솔 I/O와 핸들러 잠금을 기다리지 않도록 하는 로깅 도구입니다.
+- attach_queue_listener() : 로거 핸들러를 QueueListener(전용 스레드)로 옮기고 로거에는 QueueHandler만 연결
+  (요청 스레드는 큐에 레코드를 넣기만 하고, 실제 출력은 리스너 스레드 1개가 순서대로 수행)
+  - 반환된 리스너의 stop()은 큐에 남은 로그를 모두 출력하고 원래 핸들러를 로거에 되돌림
+  - Airflow 태스크 프로세스는 os._exit로 끝나 atexit가 실행되지 않으므로 호출한 쪽에서 try/finally로 stop() 호출
+- UrlLogSampler : URL별 INFO 로그 표본 추출 + 생략한 로그의 주기적 요약 (WARNING 이상은 항상 출력)
+  - sample_rate : INFO 로그를 남길 URL 비율 (URL 해시 기준, 같은 URL의 시도/성공 로그는 함께 남거나 함께 생략)
+  - summary_interval : 생략한 로그 건수를 종류(접두 이모지)별로 모아 interval초마다 1줄 출력 (0이면 요약 없음)
+
+사용 예시
+    listener = attach_queue_listener(logger)
+    try:
+        ...
+    finally:
+        listener.stop()
+
+    sampler = UrlLogSampler(logger, sample_rate=0.1, summary_interval=30)
+    fetch_url(url, sampler.for_url(url))
+    sampler.flush()
+"""
+import time
+import zlib
+import queue
+import atexit
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+def attach_queue_listener(logger):
+    """
+    로거의 기존 핸들러를 QueueListener로 옮기고 QueueHandler 1개만 남긴 뒤 리스너 반환
+
+    큐 크기는 제한하지 않으므로 로그 출력이 요청 스레드를 막지 않습니다.
+    이미 연결되어 있으면 기존 리스너를 반환합니다.
+    stop()을 호출하지 않고 정상 종료하면 atexit에서 멈춥니다. (os._exit 종료 시에는 실행되지 않음)
+    """
+    for handler in logger.handlers:
+        if isinstance(handler, QueueHandler) and isinstance(getattr(handler, "listener", None), _LoggerQueueListener):
+            return handler.listener
+    listener = _LoggerQueueListener(logger, queue.SimpleQueue())
+    listener.start()
+    return listener
+
+
+class _LoggerQueueListener(QueueListener):
+    """로거 1개 전용 QueueListener (stop() 시 남은 로그 출력 후 원래 핸들러 복원, 여러 번 호출해도 안전)"""
+
+    def __init__(self, logger, log_queue):
+        self.logger = logger
+        self.original_handlers = list(logger.handlers)
+        super().__init__(log_queue, *self.original_handlers, respect_handler_level=True)
+        self.queue_handler = QueueHandler(log_queue)
+        self.queue_handler.listener = self
+        self._stop_lock = threading.Lock()
+
+    def start(self):
+        for handler in self.original_handlers:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(self.queue_handler)
+        super().start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        with self._stop_lock:
+            if self._thread is None:
+                return
+            self.logger.removeHandler(self.queue_handler)
+            super().stop()
+            for handler in self.original_handlers:
+                self.logger.addHandler(handler)
+        atexit.unregister(self.stop)
+
+
+class UrlLogSampler:
+    """URL별 로그 표본 추출 / 요약 클래스
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        출력 로거
+    sample_rate : float
+        INFO 로그를 남길 URL 비율 (0 ~ 1, 기본값: 1 - 모두 출력)
+    summary_interval : float
+        생략한 로그 요약 출력 주기(초), 0이면 요약 없음
+    """
+
+    def __init__(self, logger, sample_rate=1.0, summary_interval=0):
+        self.logger = logger
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.summary_interval = summary_interval
+        self._threshold = int(self.sample_rate * 0xFFFFFFFF)
+        self._suppressed = {}
+        self._last_summary = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.sample_rate < 1.0
+
+    def for_url(self, url):
+        """
+        URL 1개의 로그를 받을 어댑터 반환 (표본 추출하지 않으면 원래 로거 그대로 반환)
+        """
+        if not self.enabled:
+            return self.logger
+        sampled = zlib.crc32(url.encode("utf-8")) <= self._threshold and self.sample_rate > 0
+        return _UrlLogAdapter(self, sampled)
+
+    def suppress(self, msg):
+        """
+        생략한 로그 건수 누적 후 요약 주기가 지났으면 요약 1줄 출력
+        """
+        kind = str(msg).split(" ", 1)[0]
+        now = time.monotonic()
+        with self._lock:
+            self._suppressed[kind] = self._suppressed.get(kind, 0) + 1
+            if not self.summary_interval or now - self._last_summary < self.summary_interval:
+                return
+            counts, self._suppressed, self._last_summary = self._suppressed, {}, now
+        self._log_summary(counts)
+
+    def flush(self):
+        """
+        남은 요약 출력 (수집 종료 시 호출)
+        """
+        with self._lock:
+            counts, self._suppressed = self._suppressed, {}
+        if counts and self.summary_interval:
+            self._log_summary(counts)
+
+    def _log_summary(self, counts):
+        detail = ", ".join(f"{kind} {count:,}" for kind, count in counts.items())
+        self.logger.info(f"📊 URL 로그 요약 (생략 {sum(counts.values()):,}건): {detail}")
+
+
+class _UrlLogAdapter(logging.LoggerAdapter):
+    """URL 1개의 로그 어댑터 (표본에 포함되지 않은 URL의 INFO 이하 로그는 요약 건수로만 집계)"""
+
+    def __init__(self, sampler, sampled):
+        super().__init__(sampler.logger, {})
+        self.sampler = sampler
+        self.sampled = sampled
+
+    def log(self, level, msg, *args, **kwargs):
+        if self.sampled or level >= logging.WARNING:
+            self.logger.log(level, msg, *args, **kwargs)
+        elif self.isEnabledFor(level):
+            self.sampler.suppress(msg)
@@ -0,0 +1,223 @@
+"""
+KOSIS Run Metrics Module
+
+수집 1회 실행의 단계별 소요시간, 처리량, URL 지연시간 분포를 집계하여
+JSON과 Prometheus textfile(node_exporter textfile collector) 형식으로 저장합니다.
+- stage() : 단계별 소요시간 누적 (병렬 단계는 스레드별 시간이 합산됨)
+- observe() : 지연시간 히스토그램 (URL별 요청 시간 등, 고정 구간 집계로 분위수는 구간 보간 추정)
+- inc() : 누적 카운터 (다운로드 bytes, 저장 행 수, 재시도 수 등)
+- summary() : Airflow XCom으로 전달할 요약 dict
+"""
+import os
+import json
+import bisect
+import time
+import threading
+from contextlib import contextmanager
+
+# ✅ 지연시간 히스토그램 구간(초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# ✅ 단계 이름 (보고서 출력 순서)
+STAGES = ("target_query", "meta_fetch", "url_build", "http_fetch", "json_normalize", "cleaning", "change_detect",
+          "db_insert")
+
+
+class Histogram:
+    """고정 구간 히스토그램 (관측값을 보관하지 않아 URL 수와 무관하게 메모리 일정)
+
+    분위수는 Prometheus histogram_quantile과 같이 구간 내 선형 보간으로 추정합니다.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 최대 구간 초과(+Inf)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        running = 0
+        for i, count in enumerate(self.counts):
+            if count and running + count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                estimate = lower + (upper - lower) * (rank - running) / count
+                return min(estimate, self.max)
+            running += count
+        return self.max
+
+    def to_dict(self):
+        cumulative, running = [], 0
+        for count in self.counts:
+            running += count
+            cumulative.append(running)
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": round(self.quantile(0.5), 6),
+            "p90": round(self.quantile(0.9), 6),
+            "p99": round(self.quantile(0.99), 6),
+            "max": round(self.max, 6),
+            "buckets": {str(bound): c for bound, c in zip(self.buckets, cumulative)},
+        }
+
+
+class RunMetrics:
+    """수집 실행 지표 클래스
+
+    Parameters
+    ----------
+    run_id : str
+        실행 식별자 (예: 수집일자 YYYYMMDD)
+    labels : dict
+        Prometheus 출력에 공통으로 붙일 라벨
+    """
+
+    def __init__(self, run_id, labels=None):
+        self.run_id = run_id
+        self.labels = dict(labels or {})
+        self.started_at = time.time()
+        self.finished_at = None
+        self.stage_seconds = {}
+        self.stage_calls = {}
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage_time(name, time.perf_counter() - start)
+
+    def add_stage_time(self, name, seconds):
+        with self._lock:
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+            self.stage_calls[name] = self.stage_calls.get(name, 0) + 1
+
+    def inc(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        with self._lock:
+            self.histograms.setdefault(name, Histogram()).observe(value)
+
+    def finish(self):
+        self.finished_at = time.time()
+        return self
+
+    @property
+    def elapsed(self):
+        return (self.finished_at or time.time()) - self.started_at
+
+    def summary(self):
+        """
+        XCom 전달용 요약 (JSON 직렬화 가능)
+        """
+        elapsed = self.elapsed
+        rows_written = self.counters.get("rows_written", 0)
+        insert_seconds = self.stage_seconds.get("db_insert", 0.0)
+        url_latency = self.histograms.get("url_latency_seconds")
+        return {
+            "run_id": self.run_id,
+            "elapsed_seconds": round(elapsed, 3),
+            "stage_seconds": {k: round(v, 3) for k, v in self.stage_seconds.items()},
+            "counters": dict(self.counters),
+            "rows_written_per_second": round(rows_written / elapsed, 2) if elapsed else 0.0,
+            "db_insert_rows_per_second": round(rows_written / insert_seconds, 2) if insert_seconds else 0.0,
+            "url_latency_p50": url_latency.to_dict()["p50"] if url_latency else 0.0,
+            "url_latency_p99": url_latency.to_dict()["p99"] if url_latency else 0.0,
+        }
+
+    def to_dict(self):
+        data = self.summary()
+        data.update({
+            "labels": self.labels,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "stage_calls": dict(self.stage_calls),
+            "histograms": {name: h.to_dict() for name, h in self.histograms.items()},
+        })
+        return data
+
+    def to_prometheus(self):
+        labels = {"run_id": self.run_id, **self.labels}
+
+        def fmt(extra=None):
+            merged = {**labels, **(extra or {})}
+            return "{" + ",".join(f'{k}="{v}"' for k, v in merged.items()) + "}"
+
+        lines = [
+            "# HELP kosis_run_elapsed_seconds KOSIS 수집 전체 소요시간",
+            "# TYPE kosis_run_elapsed_seconds gauge",
+            f"kosis_run_elapsed_seconds{fmt()} {self.elapsed:.6f}",
+            "# HELP kosis_stage_seconds KOSIS 수집 단계별 소요시간 (병렬 단계는 스레드 합산)",
+            "# TYPE kosis_stage_seconds gauge",
+        ]
+        for stage, seconds in self.stage_seconds.items():
+            lines.append(f"kosis_stage_seconds{fmt({'stage': stage})} {seconds:.6f}")
+        for name, value in sorted(self.counters.items()):
+            lines += [f"# TYPE kosis_{name}_total counter", f"kosis_{name}_total{fmt()} {value}"]
+        summary = self.summary()
+        lines += ["# TYPE kosis_rows_written_per_second gauge",
+                  f"kosis_rows_written_per_second{fmt()} {summary['rows_written_per_second']}"]
+        for name, histogram in self.histograms.items():
+            lines.append(f"# TYPE kosis_{name} histogram")
+            running = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                running += count
+                lines.append(f"kosis_{name}_bucket{fmt({'le': bound})} {running}")
+            lines.append(f"kosis_{name}_bucket{fmt({'le': '+Inf'})} {histogram.count}")
+            lines.append(f"kosis_{name}_sum{fmt()} {histogram.sum:.6f}")
+            lines.append(f"kosis_{name}_count{fmt()} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, metrics_dir, prefix="kosis_metrics"):
+        """
+        JSON / Prometheus textfile 저장 (임시 파일 작성 후 교체)
+
+        Returns
+        -------
+        dict
+            {"json": 경로, "prom": 경로}
+        """
+        os.makedirs(metrics_dir, exist_ok=True)
+        paths = {
+            "json": os.path.join(metrics_dir, f"{prefix}_{self.run_id}.json"),
+            "prom": os.path.join(metrics_dir, f"{prefix}_{self.run_id}.prom"),
+        }
+        contents = {
+            "json": json.dumps(self.to_dict(), ensure_ascii=False, indent=2),
+            "prom": self.to_prometheus(),
+        }
+        for kind, path in paths.items():
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(contents[kind])
+            os.replace(tmp_path, path)
+        return paths
+
+
+@contextmanager
+def stage(metrics, name):
+    """
+    metrics가 None이면 아무것도 측정하지 않는 stage 컨텍스트
+    """
+    if metrics is None:
+        yield
+    else:
+        with metrics.stage(name):
+            yield
@@ -0,0 +1,313 @@
+"""
+KOSIS Request Planner Module
+
+통계표별 수록시점 요청을 (ORG_ID, TBL_ID, URL 코드, 수록주기) 단위로 묶고,
+연속된 수록시점을 하나의 startPrdDe ~ endPrdDe 범위 요청으로 병합합니다.
+- 범위당 최대 시점 수(max_periods)와 KOSIS 요청당 셀 제한(max_cells)을 넘지 않도록 분할
+- 셀 제한 오류(err 31) 응답 시 범위 URL을 반으로 나누는 split_range_url 제공
+- Airflow 동적 태스크 매핑용으로 URL 목록을 TBL_ID 해시 / 예상 크기 기준 샤드로 분할 (shard_urls)
+- 통계표설명/분류항목 응답으로 통계표 분류 구성(TableDims)과 시점당 셀 수를 구하고,
+  userStatsId 응답으로 저장된 선택 범위(selection_dims)를 구하여
+  예상 셀 수가 큰 요청을 C1(또는 ITM_ID) 묶음으로 나누는 split_by_dims 제공
+"""
+import re
+import math
+import zlib
+from collections import namedtuple
+
+# ✅ 수록주기별 1년당 시점 수 (연속 시점 판단용)
+# - Y: YYYY / S: YYYY01~YYYY02 / Q: YYYY01~YYYY04 / M: YYYY01~YYYY12
+PERIODS_PER_YEAR = {"Y": 1, "S": 2, "Q": 4, "M": 12}
+
+# ✅ KOSIS 요청 1건당 최대 셀 수
+KOSIS_MAX_CELLS = 40000
+
+RequestSpec = namedtuple(
+    "RequestSpec", ["org_id", "tbl_id", "url_code", "prd_se", "start_prd_de", "end_prd_de", "n_periods"])
+
+# ✅ 통계표 분류 구성 (items: 항목 ITM_ID 목록, objs: [(분류ID, 분류값ID 목록), ...] - objL1부터 순서대로)
+TableDims = namedtuple("TableDims", ["items", "objs"])
+
+
+def period_to_ordinal(prd_se, prd_de):
+    """
+    수록시점을 연속 정수로 변환 (병합 불가한 주기/형식이면 None)
+    """
+    per_year = PERIODS_PER_YEAR.get(prd_se)
+    prd_de = str(prd_de or "")
+    if per_year is None or not prd_de.isdigit():
+        return None
+    if per_year == 1:
+        return int(prd_de) if len(prd_de) == 4 else None
+    if len(prd_de) != 6:
+        return None
+    year, sub = int(prd_de[:4]), int(prd_de[4:])
+    if not 1 <= sub <= per_year:
+        return None
+    return year * per_year + sub - 1
+
+
+def ordinal_to_period(prd_se, ordinal):
+    """
+    period_to_ordinal()의 역변환
+    """
+    per_year = PERIODS_PER_YEAR[prd_se]
+    if per_year == 1:
+        return f"{ordinal:04d}"
+    year, sub = divmod(ordinal, per_year)
+    return f"{year:04d}{sub + 1:02d}"
+
+
+def coalesce_periods(keys, max_periods=12, cells_per_period=None, max_cells=KOSIS_MAX_CELLS):
+    """
+    수록시점 단위 요청 키를 범위 요청으로 병합
+
+    Parameters
+    ----------
+    keys : iterable of tuple
+        (org_id, tbl_id, url_code, prd_se, prd_de) 요청 키 (중복 허용)
+    max_periods : int
+        범위 요청 1건당 최대 시점 수 (1이면 병합하지 않음)
+    cells_per_period : dict
+        (org_id, tbl_id, url_code) → 시점당 예상 셀 수 (선택). 지정된 통계표는 max_cells 이내로 범위를 제한
+    max_cells : int
+        요청 1건당 최대 셀 수
+
+    Returns
+    -------
+    (list of RequestSpec, dict)
+        병합된 요청 목록(입력 순서 기준)과 입력 키 → RequestSpec 매핑
+    """
+    cells_per_period = cells_per_period or {}
+    groups = {}
+    for key in dict.fromkeys(keys):
+        org_id, tbl_id, url_code, prd_se, prd_de = key
+        groups.setdefault((org_id, tbl_id, url_code, prd_se), []).append(prd_de)
+
+    specs, key_to_spec = [], {}
+    for (org_id, tbl_id, url_code, prd_se), periods in groups.items():
+        limit = max(int(max_periods), 1)
+        cells = cells_per_period.get((org_id, tbl_id, url_code))
+        if cells:
+            limit = max(min(limit, max_cells // cells), 1)
+
+        ordered = sorted(
+            ((period_to_ordinal(prd_se, prd_de), prd_de) for prd_de in periods),
+            key=lambda item: (item[0] is None, item[0] if item[0] is not None else 0, str(item[1])))
+
+        run = []
+        for ordinal, prd_de in ordered + [(None, None)]:
+            contiguous = (run and ordinal is not None and run[-1][0] is not None
+                          and ordinal == run[-1][0] + 1 and len(run) < limit)
+            if run and not contiguous:
+                spec = RequestSpec(org_id, tbl_id, url_code, prd_se, run[0][1], run[-1][1], len(run))
+                specs.append(spec)
+                for _, run_prd_de in run:
+                    key_to_spec[(org_id, tbl_id, url_code, prd_se, run_prd_de)] = spec
+                run = []
+            if prd_de is not None:
+                run.append((ordinal, prd_de))
+    return specs, key_to_spec
+
+
+def table_dims(records):
+    """
+    통계표설명/분류항목 레코드로 TableDims 구성
+
+    Parameters
+    ----------
+    records : iterable of tuple
+        (분류ID, 분류값ID, 분류순번) - 분류ID가 'ITEM'인 행은 항목(itmId), 나머지는 분류(objL1~objL8)
+    """
+    items, objs, order = [], {}, {}
+    for obj_id, itm_id, obj_sn in records:
+        if obj_id is None or itm_id is None:
+            continue
+        if obj_id == "ITEM":
+            items.append(itm_id)
+        else:
+            objs.setdefault(obj_id, []).append(itm_id)
+            order.setdefault(obj_id, (int(obj_sn) if str(obj_sn).isdigit() else len(order), len(order)))
+    return TableDims(
+        list(dict.fromkeys(items)),
+        [(obj_id, list(dict.fromkeys(codes))) for obj_id, codes in sorted(objs.items(), key=lambda kv: order[kv[0]])])
+
+
+def selection_dims(rows):
+    """
+    userStatsId 통계자료 응답 행(수록시점 1개)으로 저장된 선택 범위의 TableDims 구성
+
+    items는 응답의 ITM_ID 목록, objs는 [("C1", 분류값 목록), ...] (값이 있는 분류까지, 응답 순서 유지)
+    값이 '-', 빈 값인 셀도 응답 행으로 포함되므로 원본 응답 행(정제 전)을 사용합니다.
+    """
+    items = list(dict.fromkeys(row.get("ITM_ID") for row in rows if row.get("ITM_ID") is not None))
+    objs = []
+    for level in range(1, 9):
+        codes = list(dict.fromkeys(row.get(f"C{level}") for row in rows if row.get(f"C{level}") is not None))
+        if not codes:
+            break
+        objs.append((f"C{level}", codes))
+    return TableDims(items, objs)
+
+
+def dims_cells(dims):
+    """
+    수록시점 1개당 셀 수 (항목 수 x 분류별 분류값 수의 곱)
+    """
+    cells = len(dims.items) or 1
+    for _, codes in dims.objs:
+        cells *= len(codes) or 1
+    return cells
+
+
+def _chunk(values, n_chunks):
+    n_chunks = max(1, min(n_chunks, len(values)))
+    size = math.ceil(len(values) / n_chunks)
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+def split_by_dims(dims, n_periods, max_cells):
+    """
+    예상 셀 수(n_periods x 시점당 셀 수)가 max_cells를 넘는 요청을 (항목 묶음, C1 묶음) 조각으로 분할
+
+    C1(objL1) 분류값을 먼저 나누고, C1 분류값 수보다 많은 조각이 필요하면 C1 1개씩 x ITM_ID 묶음으로 나눕니다.
+
+    Returns
+    -------
+    list of tuple or None
+        [(ITM_ID 목록, C1 분류값 목록), ...] (분할이 필요 없거나 나눌 분류가 없으면 None)
+    """
+    total = n_periods * dims_cells(dims)
+    if total <= max_cells:
+        return None
+    c1_codes = dims.objs[0][1] if dims.objs else []
+    n_pieces = math.ceil(total / max_cells)
+    if len(c1_codes) >= n_pieces:
+        c1_groups, item_groups = _chunk(c1_codes, n_pieces), [dims.items]
+    else:
+        c1_groups = [[code] for code in c1_codes] or [[]]
+        item_groups = _chunk(dims.items, math.ceil(n_pieces / len(c1_groups))) or [[]]
+    pieces = [(items, codes) for codes in c1_groups for items in item_groups]
+    return pieces if len(pieces) > 1 else None
+
+
+def _query_value(url, name):
+    match = re.search(rf"[?&]{name}=([^&]*)", url)
+    return match.group(1) if match else None
+
+
+def replace_period_range(url, start_prd_de, end_prd_de):
+    """
+    URL의 startPrdDe / endPrdDe 값만 교체 (apiKey 등 나머지 파라미터는 원문 유지)
+    """
+    url = re.sub(r"([?&]startPrdDe=)[^&]*", rf"\g<1>{start_prd_de}", url)
+    return re.sub(r"([?&]endPrdDe=)[^&]*", rf"\g<1>{end_prd_de}", url)
+
+
+def replace_api_key(url, license_key):
+    """
+    URL의 apiKey 값 교체 (보관된 계획 파일의 URL에 라이선스 키를 다시 채울 때 사용)
+    """
+    return re.sub(r"([?&]apiKey=)[^&]*", lambda m: m.group(1) + license_key, url)
+
+
+def url_table_key(url):
+    """
+    URL의 userStatsId에서 (org_id, tbl_id, url_code) 추출
+    (통계자료 파라미터 URL은 orgId / tblId에서 추출, url_code는 None)
+    """
+    user_stats_id = _query_value(url, "userStatsId")
+    if user_stats_id is None and _query_value(url, "tblId"):
+        return _query_value(url, "orgId"), _query_value(url, "tblId"), None
+    parts = (user_stats_id or "").split("/")
+    if len(parts) < 6:
+        return None, None, None
+    return parts[1], parts[2], parts[5]
+
+
+def _count_codes(value):
+    codes = [code for code in re.split(r"[+ ]|%2B|%20", value or "") if code]
+    return len(codes) if codes and codes != ["ALL"] else 1
+
+
+def estimate_url_cells(url, cells_per_period=None):
+    """
+    URL 1건의 예상 셀 수 (수록시점 수 x 시점당 셀 수, 셀 수를 모르면 시점 수)
+
+    통계자료 파라미터 URL(분할 조각)은 itmId / objL1~objL8에 명시된 분류값 수의 곱으로 계산
+    """
+    prd_se = _query_value(url, "prdSe")
+    start = period_to_ordinal(prd_se, _query_value(url, "startPrdDe"))
+    end = period_to_ordinal(prd_se, _query_value(url, "endPrdDe"))
+    n_periods = end - start + 1 if start is not None and end is not None and end >= start else 1
+    key = url_table_key(url)
+    if key[1] is not None and key[2] is None:
+        cells = _count_codes(_query_value(url, "itmId"))
+        for level in range(1, 9):
+            cells *= _count_codes(_query_value(url, f"objL{level}"))
+    else:
+        cells = (cells_per_period or {}).get(key) or 1
+    return n_periods * cells
+
+
+def shard_urls(urls, num_shards, strategy="hash", cells_per_period=None):
+    """
+    URL 목록을 num_shards개 샤드로 분할 (같은 TBL_ID의 URL은 항상 같은 샤드)
+
+    Parameters
+    ----------
+    urls : list of str
+        수집 URL 목록
+    num_shards : int
+        샤드 수
+    strategy : str
+        hash : crc32(TBL_ID) % num_shards (실행마다 같은 통계표가 같은 샤드에 배정)
+        size : 통계표별 예상 셀 수가 큰 순서로 가장 가벼운 샤드에 배정 (부하 균등)
+    cells_per_period : dict
+        (org_id, tbl_id, url_code) -> 시점당 셀 수 (size 전략의 크기 추정용)
+
+    Returns
+    -------
+    list of list
+        샤드별 URL 목록 (빈 샤드 포함, 길이 = num_shards)
+    """
+    num_shards = max(1, int(num_shards))
+    shards = [[] for _ in range(num_shards)]
+
+    by_table = {}
+    for url in urls:
+        by_table.setdefault(url_table_key(url)[1], []).append(url)
+
+    if strategy == "hash":
+        for tbl_id, tbl_urls in by_table.items():
+            shards[zlib.crc32(str(tbl_id).encode("utf-8")) % num_shards].extend(tbl_urls)
+    elif strategy == "size":
+        loads = [0] * num_shards
+        sized = sorted(
+            by_table.values(),
+            key=lambda tbl_urls: sum(estimate_url_cells(url, cells_per_period) for url in tbl_urls),
+            reverse=True)
+        for tbl_urls in sized:
+            target = loads.index(min(loads))
+            shards[target].extend(tbl_urls)
+            loads[target] += sum(estimate_url_cells(url, cells_per_period) for url in tbl_urls)
+    else:
+        raise ValueError(f"지원하지 않는 샤드 분할 방식: {strategy}")
+    return shards
+
+
+def split_range_url(url):
+    """
+    startPrdDe ~ endPrdDe 범위 URL을 두 개의 범위 URL로 분할 (단일 시점이거나 분할 불가하면 None)
+    """
+    prd_se = _query_value(url, "prdSe")
+    start = period_to_ordinal(prd_se, _query_value(url, "startPrdDe"))
+    end = period_to_ordinal(prd_se, _query_value(url, "endPrdDe"))
+    if start is None or end is None or end <= start:
+        return None
+
+    mid = (start + end) // 2
+    return [
+        replace_period_range(url, ordinal_to_period(prd_se, start), ordinal_to_period(prd_se, mid)),
+        replace_period_range(url, ordinal_to_period(prd_se, mid + 1), ordinal_to_period(prd_se, end)),
+    ]
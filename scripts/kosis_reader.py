@@ -1,10 +1,20 @@
 """
 KOSIS Open API Python Module
+
+- Kosis.get_data() : 서비스별 응답을 한글 컬럼명 DataFrame으로 반환
+- Kosis.get_records() : 미리 만든 서비스별 스키마 순서의 튜플(또는 dict) 목록 반환 (pandas 미사용)
+- records_to_frame() : 여러 번 받은 레코드를 모아 마지막에 DataFrame 1개로 변환
+- get_schema() / record_schema() : 서비스별 레코드 스키마 (Kosis 객체 없이 조회)
 """
+import os
 import json
+import time
+import hashlib
+import threading
 import requests
 import pandas as pd
 import logging
+from scripts import kosis_http
 # from common_function import setup_daily_logger
 
 requests.packages.urllib3.disable_warnings()
@@ -14,6 +24,375 @@ requests.packages.urllib3.disable_warnings()
 
 
 
+# ✅ 서비스별 영문 → 한글 컬럼명 (translate_columns, 레코드 스키마에서 공통 사용)
+RENAME_COLUMNS = {
+    "KOSIS통합검색": {
+        'ORG_ID': '기관ID',
+        'ORG_NM': '기관명',
+        'TBL_ID': '통계표ID',
+        'TBL_NM': '통계표명',
+        'STAT_ID': '조사ID',
+        'STAT_NM': '조사명',
+        'VW_CD': 'KOSIS목록구분',
+        'MT_ATITLE': 'KOSIS통계표위치',
+        'FULL_PATH_ID': '통계표위치',
+        'CONTENTS': '통계표주요내용',
+        'STRT_PRD_DE': '수록기간시작일',
+        'END_PRD_DE': '수록기간종료일',
+        'ITEM03': '통계표주석',
+        'REC_TBL_SE': '추천통계표여부',
+        'TBL_VIEW_URL': 'KOSIS목록URL',
+        'LINK_URL': 'KOSIS통계표URL',
+        'STAT_DB_CNT': '검색결과건수',
+        'QUERY': '검색어명',
+    },
+    "통계설명": {
+        'statsNm': '조사명',
+        'statsKind': '통계종류',
+        'statsContinue': '계속여부',
+        'basisLaw': '법적근거',
+        'writingPurps': '조사목적',
+        'statsPeriod': '조사주기',
+        'writingSystem': '조사체계',
+        'pubExtent': '공표범위',
+        'pubPeriod': '공표주기',
+        'writingTel': '연락처',
+        'statsField': '통계활용분야실태',
+        'examinObjrange': '조사대상범위',
+        'examinObjArea': '조사대상지역',
+        'josaUnit': '조사단위및조사대상규모',
+        'applyGroup': '적용분류',
+        'josaItm': '조사항목',
+        'publictMth': '공표방법및URL',
+        'examinTrgetPd': '조사대상기간및조사기준시점',
+        'examinPd': '조사기간',
+        'dataUserNote': '자료이용자유의사항',
+        'mainTermExpl': '주요용어해설',
+        'dataCollectMth': '자료수집방법',
+        'examinHistory': '조사연혁',
+        'confmNo': '승인번호',
+        'confmDt': '승인일자',
+        'statsEnd': '통계종료',
+    },
+    "통계표설명": {
+        "통계표명칭": {
+            'TBL_NM': '통계표명',
+            'TBL_NM_ENG': '통계표영문명',
+        },
+        "기관명칭": {
+            'ORG_NM': '기관명',
+            'ORG_NM_ENG': '기관영문명',
+        },
+        "수록정보": {
+            'PRD_SE': '수록주기',
+            'STRT_PRD_DE': '수록기간시작일',
+            'END_PRD_DE': '수록기간종료일',
+            'PRD_DE': '수록시점',
+        },
+        "분류항목": {
+            'ORG_ID': '기관ID',
+            'TBL_ID': '통계표ID',
+            'CD_ID': '코드ID',
+            'CD_NM': '코드명',
+            'OBJ_ID': '분류ID',
+            'OBJ_NM': '분류명',
+            'OBJ_NM_ENG': '분류영문명',
+            'ITM_ID': '분류값ID',
+            'ITM_NM': '분류값명',
+            'ITM_NM_ENG': '분류값영문명',
+            'UP_ITM_ID': '상위분류값ID',
+            'OBJ_ID_SN': '분류값순번',
+            'UNIT_ID': '단위ID',
+            'UNIT_NM': '단위명',
+            'UNIT_ENG_NM': '단위영문명',
+        },
+        "주석": {
+            'CMMT_NM': '주석유형',
+            'CMMT_DC': '주석',
+            'OBJ_ID': '분류ID',
+            'OBJ_NM': '분류명',
+            'ITM_ID': '분류값ID',
+            'ITM_NM': '분류값명',
+        },
+        "단위": {
+            'UNIT_NM': '단위명',
+            'UNIT_NM_ENG': '단위영문명',
+        },
+        "출처": {
+            'JOSA_NM': '조사명',
+            'DEPT_NM': '통계표담당부서',
+            'DEPT_PHONE': '통계표담당부서전화번호',
+        },
+        "가중치": {
+            'C1': '분류값ID1',
+            'C1_NM': '분류값명1',
+            'C2': '분류값ID2',
+            'C2_NM': '분류값명2',
+            'C3': '분류값ID3',
+            'C3_NM': '분류값명3',
+            'C4': '분류값ID4',
+            'C4_NM': '분류값명4',
+            'C5': '분류값ID5',
+            'C5_NM': '분류값명5',
+            'C6': '분류값ID6',
+            'C6_NM': '분류값명6',
+            'C7': '분류값ID7',
+            'C7_NM': '분류값명7',
+            'C8': '분류값ID8',
+            'C8_NM': '분류값명8',
+            'ITM_ID': '항목ID',
+            'ITM_NM': '항목명',
+            'WGT_CO': '가중치',
+        },
+        "자료갱신일": {
+            'ORG_NM': '기관명',
+            'TBL_NM': '통계표명',
+            'PRD_SE': '수록주기',
+            'PRD_DE': '수록시점',
+            'SEND_DE': '자료갱신일',
+        },
+    },
+    "통계목록": {
+        'VW_CD': '서비스뷰ID',
+        'VW_NM': '서비스뷰명',
+        'LIST_ID': '목록ID',
+        'LIST_NM': '목록명',
+        'ORG_ID': '기관ID',
+        'TBL_ID': '통계표ID',
+        'TBL_NM': '통계표명',
+        'REC_TBL_SE': '추천통계표여부',
+    },
+    "통계자료": {
+        'ORG_ID': '기관ID',
+        'TBL_ID': '통계표ID',
+        'TBL_NM': '통계표명',
+        'C1_OBJ_NM': '분류명1',
+        'C1_OBJ_NM_ENG': '분류영문명1',
+        'C1_NM': '분류값명1',
+        'C1_NM_ENG': '분류값영문명1',
+        'C1': '분류값ID1',
+        'C2_OBJ_NM': '분류명2',
+        'C2_OBJ_NM_ENG': '분류영문명2',
+        'C2_NM': '분류값명2',
+        'C2_NM_ENG': '분류값영문명2',
+        'C2': '분류값ID2',
+        'C3_OBJ_NM': '분류명3',
+        'C3_OBJ_NM_ENG': '분류영문명3',
+        'C3_NM': '분류값명3',
+        'C3_NM_ENG': '분류값영문명3',
+        'C3': '분류값ID3',
+        'C4_OBJ_NM': '분류명4',
+        'C4_OBJ_NM_ENG': '분류영문명4',
+        'C4_NM': '분류값명4',
+        'C4_NM_ENG': '분류값영문명4',
+        'C4': '분류값ID4',
+        'C5_OBJ_NM': '분류명5',
+        'C5_OBJ_NM_ENG': '분류영문명5',
+        'C5_NM': '분류값명5',
+        'C5_NM_ENG': '분류값영문명5',
+        'C5': '분류값ID5',
+        'C6_OBJ_NM': '분류명6',
+        'C6_OBJ_NM_ENG': '분류영문명6',
+        'C6_NM': '분류값명6',
+        'C6_NM_ENG': '분류값영문명6',
+        'C6': '분류값ID6',
+        'C7_OBJ_NM': '분류명7',
+        'C7_OBJ_NM_ENG': '분류영문명7',
+        'C7_NM': '분류값명7',
+        'C7_NM_ENG': '분류값영문명7',
+        'C7': '분류값ID7',
+        'C8_OBJ_NM': '분류명8',
+        'C8_OBJ_NM_ENG': '분류영문명8',
+        'C8_NM': '분류값명8',
+        'C8_NM_ENG': '분류값영문명8',
+        'C8': '분류값ID8',
+        'ITM_ID': '항목ID',
+        'ITM_NM': '항목명',
+        'ITM_NM_ENG': '항목영문명',
+        'UNIT_ID': '단위ID',
+        'UNIT_NM': '단위명',
+        'UNIT_NM_ENG': '단위영문명',
+        'PRD_SE': '수록주기',
+        'PRD_DE': '수록시점',
+        'DT': '수치값',
+    },
+}
+
+# ✅ 서비스별 영문 컬럼 목록 (통계표설명은 상세 서비스별, 인증키 없이 레코드 스키마를 만들 때도 사용)
+SERVICE_COLUMNS = {
+    "KOSIS통합검색": ['ORG_ID', 'ORG_NM', 'TBL_ID', 'TBL_NM', 'STAT_ID', 'STAT_NM', 'VW_CD', 'MT_ATITLE', 'FULL_PATH_ID', 'CONTENTS', 'STRT_PRD_DE', 'END_PRD_DE', 'ITEM03', 'REC_TBL_SE', 'TBL_VIEW_URL', 'LINK_URL', 'STAT_DB_CNT', 'QUERY'],
+    "통계설명": ['statsNm', 'statsKind', 'statsContinue', 'basisLaw', 'writingPurps', 'statsPeriod', 'writingSystem', 'pubExtent', 'pubPeriod', 'writingTel', 'statsField', 'examinObjrange', 'examinObjArea', 'josaUnit', 'applyGroup', 'josaItm', 'publictMth', 'examinTrgetPd', 'examinPd', 'dataUserNote', 'mainTermExpl', 'dataCollectMth', 'examinHistory', 'confmNo', 'confmDt', 'statsEnd',],
+    "통계표설명": {
+        "통계표명칭": ['TBL_NM', 'TBL_NM_ENG',],
+        "기관명칭": ['ORG_NM', 'ORG_NM_ENG',],
+        "수록정보": ['PRD_SE', 'STRT_PRD_DE', 'END_PRD_DE', 'PRD_DE',],
+        "분류항목": ['ORG_ID', 'TBL_ID', 'CD_ID', 'CD_NM', 'OBJ_ID', 'OBJ_NM', 'OBJ_NM_ENG', 'ITM_ID', 'ITM_NM', 'ITM_NM_ENG', 'UP_ITM_ID', 'OBJ_ID_SN', 'UNIT_ID', 'UNIT_NM', 'UNIT_ENG_NM',],
+        "주석": ['CMMT_NM', 'CMMT_DC', 'OBJ_ID', 'OBJ_NM', 'ITM_ID', 'ITM_NM', ],
+        "단위": ['UNIT_NM', 'UNIT_NM_ENG',],
+        "출처": ['JOSA_NM', 'DEPT_NM', 'DEPT_PHONE',],
+        "가중치": ['C1', 'C1_NM', 'C2', 'C2_NM', 'C3', 'C3_NM', 'C4', 'C4_NM', 'C5', 'C5_NM', 'C6', 'C6_NM', 'C7', 'C7_NM', 'C8', 'C8_NM', 'ITM_ID', 'ITM_NM', 'WGT_CO',],
+        "자료갱신일": ['ORG_NM', 'TBL_NM', 'PRD_SE', 'PRD_DE', 'SEND_DE',],
+    },
+    "통계목록": ['VW_CD', 'VW_NM', 'LIST_ID', 'LIST_NM', 'ORG_ID', 'TBL_ID', 'TBL_NM', 'REC_TBL_SE'],
+    "통계자료": ['ORG_ID', 'TBL_ID', 'TBL_NM', 'C1_OBJ_NM', 'C1_OBJ_NM_ENG', 'C1_NM', 'C1_NM_ENG', 'C1', 'C2_OBJ_NM', 'C2_OBJ_NM_ENG', 'C2_NM', 'C2_NM_ENG', 'C2', 'C3_OBJ_NM', 'C3_OBJ_NM_ENG', 'C3_NM', 'C3_NM_ENG', 'C3', 'C4_OBJ_NM', 'C4_OBJ_NM_ENG', 'C4_NM', 'C4_NM_ENG', 'C4', 'C5_OBJ_NM', 'C5_OBJ_NM_ENG', 'C5_NM', 'C5_NM_ENG', 'C5', 'C6_OBJ_NM', 'C6_OBJ_NM_ENG', 'C6_NM', 'C6_NM_ENG', 'C6', 'C7_OBJ_NM', 'C7_OBJ_NM_ENG', 'C7_NM', 'C7_NM_ENG', 'C7', 'C8_OBJ_NM', 'C8_OBJ_NM_ENG', 'C8_NM', 'C8_NM_ENG', 'C8', 'ITM_ID', 'ITM_NM', 'ITM_NM_ENG', 'UNIT_ID', 'UNIT_NM', 'UNIT_NM_ENG', 'PRD_SE', 'PRD_DE', 'DT',],
+}
+
+# ✅ 서비스별 레코드 스키마 (record_schema()가 최초 1회 생성)
+_SCHEMAS = {}
+
+
+class KosisCache:
+    """KOSIS 응답 디스크 캐시 클래스
+
+    서비스명, 상세 서비스명, 요청 파라미터(인증키 제외)를 키로 API 응답(JSON)을
+    디스크에 저장합니다. 서비스별 TTL이 지난 항목은 다시 요청하며, 전체 용량이
+    max_bytes를 넘으면 가장 오래 사용되지 않은 파일부터 삭제합니다.
+    동일한 키에 대한 동시 요청은 하나의 API 호출로 병합됩니다.
+
+    Parameters
+    ----------
+    cache_dir : str
+        캐시 파일 저장 디렉토리
+    ttl : dict
+        서비스별 TTL(초). 키는 서비스명 또는 '통계표설명/자료갱신일' 형태의 상세 서비스명
+    default_ttl : int
+        ttl에 지정되지 않은 서비스의 TTL(초) (기본값: 86400)
+    max_bytes : int
+        캐시 디렉토리 최대 용량(byte) (기본값: 256MB)
+    """
+
+    def __init__(self, cache_dir, ttl=None, default_ttl=86400, max_bytes=256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttl = ttl or {}
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._inflight = {}
+        os.makedirs(cache_dir, exist_ok=True)
+        self._total_bytes = sum(size for _, size, _ in self._scan())
+
+    def make_key(self, service_name, detail_service_name, params):
+        """
+        캐시 키 생성 (인증키는 키에서 제외)
+        """
+        key_params = {k: str(v) for k, v in params.items() if k != "apiKey"}
+        raw = json.dumps([service_name, detail_service_name, key_params],
+                         sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_ttl(self, service_name, detail_service_name=None):
+        if detail_service_name:
+            ttl = self.ttl.get(f"{service_name}/{detail_service_name}")
+            if ttl is not None:
+                return ttl
+        return self.ttl.get(service_name, self.default_ttl)
+
+    def get(self, key, ttl):
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            # 접근 시각 갱신 (LRU 삭제 기준)
+            os.utime(path, (time.time(), os.path.getmtime(path)))
+            return data
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key, data):
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._total_bytes += os.path.getsize(path) - old_size
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        except OSError as e:
+            logging.warning("캐시 저장 실패: %s", e)
+
+    def get_or_fetch(self, service_name, detail_service_name, params, fetch):
+        """
+        캐시 조회 후 없으면 fetch()를 호출하여 저장
+
+        동일 키로 이미 진행 중인 요청이 있으면 새로 요청하지 않고 그 결과를 기다립니다.
+        fetch()가 None을 반환하면 캐시에 저장하지 않습니다.
+        """
+        key = self.make_key(service_name, detail_service_name, params)
+        ttl = self.get_ttl(service_name, detail_service_name)
+        data = self.get(key, ttl)
+        if data is not None:
+            return data
+
+        owner, waiter = self.claim(key)
+        if not owner:
+            waiter["event"].wait()
+            return waiter["data"]
+
+        data = None
+        try:
+            data = fetch()
+            if data is not None:
+                self.set(key, data)
+            return data
+        finally:
+            self.complete(key, waiter, data)
+
+    def claim(self, key):
+        """
+        키의 요청 담당 등록 (반환값: (담당 여부, 대기 정보))
+
+        이미 진행 중인 요청이 있으면 담당 여부 False와 그 요청의 대기 정보를 반환합니다.
+        담당자는 요청이 끝나면 반드시 complete()를 호출해야 합니다. (AsyncKosis와 공유)
+        """
+        with self._lock:
+            waiter = self._inflight.get(key)
+            if waiter is not None:
+                return False, waiter
+            waiter = self._inflight[key] = {"event": threading.Event(), "data": None}
+            return True, waiter
+
+    def complete(self, key, waiter, data):
+        """
+        claim()으로 담당한 요청 종료 (대기 중인 요청에 결과 전달)
+        """
+        waiter["data"] = data
+        with self._lock:
+            self._inflight.pop(key, None)
+        waiter["event"].set()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _scan(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entries.append((name, stat.st_size, stat.st_atime))
+        return entries
+
+    def _evict(self):
+        # 용량의 90% 이하가 될 때까지 오래 사용되지 않은 파일부터 삭제 (lock 보유 상태에서 호출)
+        target = self.max_bytes * 0.9
+        for name, size, _ in sorted(self._scan(), key=lambda e: e[2]):
+            if self._total_bytes <= target:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+                self._total_bytes -= size
+            except OSError:
+                continue
+
+
 class Kosis:
     """KOSIS 공유서비스 클래스
 
@@ -23,42 +402,47 @@ class Kosis:
     ----------
     service_key : str
         KOSIS 공유서비스에서 발급받은 사용자 인증키
+    cache : KosisCache
+        응답 캐시 (선택). 지정하지 않으면 매 호출마다 API를 요청합니다.
+    limiter : kosis_http.AdaptiveLimiter
+        동시 요청 수 제어기 (선택). 수집 프로그램의 데이터 요청과 공유할 수 있습니다.
+    base_url : str
+        KOSIS OpenAPI 주소 (기본값: https://kosis.kr)
+    timeout : tuple or float
+        요청 timeout(초), (연결, 읽기) 튜플 또는 단일 값 (기본값: (30, 120))
     """
 
-    def __init__(self, service_key=None):
+    def __init__(self, service_key=None, cache=None, limiter=None, base_url=None, timeout=(30, 120)):
         self.service_key = service_key
+        self.base_url = base_url
+        self.cache = cache
+        self.limiter = limiter
+        self.timeout = timeout
         self.meta_dict = {
             "KOSIS통합검색": {
                 "url": "https://kosis.kr/openapi/statisticsSearch.do?method=getList",
-                "columns": ['ORG_ID', 'ORG_NM', 'TBL_ID', 'TBL_NM', 'STAT_ID', 'STAT_NM', 'VW_CD', 'MT_ATITLE', 'FULL_PATH_ID', 'CONTENTS', 'STRT_PRD_DE', 'END_PRD_DE', 'ITEM03', 'REC_TBL_SE', 'TBL_VIEW_URL', 'LINK_URL', 'STAT_DB_CNT', 'QUERY'],
+                "columns": SERVICE_COLUMNS["KOSIS통합검색"],
             },
             "통계설명": {
                 "url": "https://kosis.kr/openapi/statisticsExplData.do?method=getList",
-                "columns": ['statsNm', 'statsKind', 'statsContinue', 'basisLaw', 'writingPurps', 'statsPeriod', 'writingSystem', 'pubExtent', 'pubPeriod', 'writingTel', 'statsField', 'examinObjrange', 'examinObjArea', 'josaUnit', 'applyGroup', 'josaItm', 'publictMth', 'examinTrgetPd', 'examinPd', 'dataUserNote', 'mainTermExpl', 'dataCollectMth', 'examinHistory', 'confmNo', 'confmDt', 'statsEnd',]
+                "columns": SERVICE_COLUMNS["통계설명"],
             },
             "통계표설명": {
                 "url": "https://kosis.kr/openapi/statisticsData.do?method=getMeta",
-                "columns": {
-                    "통계표명칭": ['TBL_NM', 'TBL_NM_ENG',],
-                    "기관명칭": ['ORG_NM', 'ORG_NM_ENG',],
-                    "수록정보": ['PRD_SE', 'STRT_PRD_DE', 'END_PRD_DE', 'PRD_DE',],
-                    "분류항목": ['ORG_ID', 'TBL_ID', 'CD_ID', 'CD_NM', 'OBJ_ID', 'OBJ_NM', 'OBJ_NM_ENG', 'ITM_ID', 'ITM_NM', 'ITM_NM_ENG', 'UP_ITM_ID', 'OBJ_ID_SN', 'UNIT_ID', 'UNIT_NM', 'UNIT_ENG_NM',],
-                    "주석": ['CMMT_NM', 'CMMT_DC', 'OBJ_ID', 'OBJ_NM', 'ITM_ID', 'ITM_NM', ],
-                    "단위": ['UNIT_NM', 'UNIT_NM_ENG',],
-                    "출처": ['JOSA_NM', 'DEPT_NM', 'DEPT_PHONE',],
-                    "가중치": ['C1', 'C1_NM', 'C2', 'C2_NM', 'C3', 'C3_NM', 'C4', 'C4_NM', 'C5', 'C5_NM', 'C6', 'C6_NM', 'C7', 'C7_NM', 'C8', 'C8_NM', 'ITM_ID', 'ITM_NM', 'WGT_CO',],
-                    "자료갱신일": ['ORG_NM', 'TBL_NM', 'PRD_SE', 'PRD_DE', 'SEND_DE',],
-                },
+                "columns": SERVICE_COLUMNS["통계표설명"],
             },
             "통계목록": {
                 "url": "https://kosis.kr/openapi/statisticsList.do?method=getList",
-                "columns": ['VW_CD', 'VW_NM', 'LIST_ID', 'LIST_NM', 'ORG_ID', 'TBL_ID', 'TBL_NM', 'REC_TBL_SE']
+                "columns": SERVICE_COLUMNS["통계목록"],
             },
             "통계자료": {
                 "url": "https://kosis.kr/openapi/Param/statisticsParameterData.do?method=getList",
-                "columns": ['ORG_ID', 'TBL_ID', 'TBL_NM', 'C1_OBJ_NM', 'C1_OBJ_NM_ENG', 'C1_NM', 'C1_NM_ENG', 'C1', 'C2_OBJ_NM', 'C2_OBJ_NM_ENG', 'C2_NM', 'C2_NM_ENG', 'C2', 'C3_OBJ_NM', 'C3_OBJ_NM_ENG', 'C3_NM', 'C3_NM_ENG', 'C3', 'C4_OBJ_NM', 'C4_OBJ_NM_ENG', 'C4_NM', 'C4_NM_ENG', 'C4', 'C5_OBJ_NM', 'C5_OBJ_NM_ENG', 'C5_NM', 'C5_NM_ENG', 'C5', 'C6_OBJ_NM', 'C6_OBJ_NM_ENG', 'C6_NM', 'C6_NM_ENG', 'C6', 'C7_OBJ_NM', 'C7_OBJ_NM_ENG', 'C7_NM', 'C7_NM_ENG', 'C7', 'C8_OBJ_NM', 'C8_OBJ_NM_ENG', 'C8_NM', 'C8_NM_ENG', 'C8', 'ITM_ID', 'ITM_NM', 'ITM_NM_ENG', 'UNIT_ID', 'UNIT_NM', 'UNIT_NM_ENG', 'PRD_SE', 'PRD_DE', 'DT',]
+                "columns": SERVICE_COLUMNS["통계자료"],
             },
         }
+        if base_url and base_url != kosis_http.KOSIS_BASE_URL:
+            for meta in self.meta_dict.values():
+                meta["url"] = meta["url"].replace(kosis_http.KOSIS_BASE_URL, base_url.rstrip("/"), 1)
         self.type_dict = {
             "통계표명칭": "TBL",
             "기관명칭": "ORG",
@@ -98,6 +482,81 @@ class Kosis:
         DataFrame
             API 호출 결과를 DataFrame 형태로 반환합니다.
         """
+        url, columns = self._resolve_service(service_name, detail_service_name)
+
+        # 빈 데이터 프레임 생성
+        df = pd.DataFrame(columns=columns)
+
+        res_json = self._fetch_json(url, service_name, detail_service_name, kwargs)
+        if res_json is None:
+            return None
+
+        try:
+            if type(res_json) == dict:
+                if res_json.get("errMsg"):
+                    print(res_json.get("errMsg"))
+                    return None
+            else:
+                sub = pd.DataFrame(res_json)
+                df = pd.concat([df, sub], axis=0, ignore_index=True).dropna(
+                    axis=1, how="all")
+            if translate:
+                df = self.translate_columns(
+                    df, service_name, detail_service_name)
+            return df
+        except:
+            print("Data Frame Failed!")
+            return None
+
+    def get_records(self,
+                    service_name,
+                    detail_service_name=None,
+                    as_dict=False,
+                    **kwargs):
+        """
+        API 호출 (레코드 모드)
+
+        get_data()와 같은 API를 호출하되 DataFrame을 만들지 않고, 서비스별로 미리 만든
+        스키마(get_schema) 순서의 튜플 목록을 반환합니다. 작은 응답을 많이 요청할 때
+        호출당 pandas 비용 없이 모았다가 records_to_frame()으로 한 번에 DataFrame을 만듭니다.
+
+        Parameters
+        ----------
+        service_name : str
+            API 호출에 필요한 서비스명 (ex. KOSIS통합검색, 통계설명, 통계표설명, 통계목록, 통계자료)
+        detail_service_name : str
+            *통계표설명 서비스에만 적용됩니다.
+        as_dict : bool
+            True이면 튜플 대신 {한글 컬럼명: 값} dict 목록을 반환 (기본값: False)
+        **kwargs : dict
+            API 호출에 필요한 파라미터
+
+        Returns
+        -------
+        list
+            레코드 목록 (응답에 없는 컬럼은 None), 요청 실패 또는 errMsg 응답 시 None
+        """
+        url, _ = self._resolve_service(service_name, detail_service_name)
+        res_json = self._fetch_json(url, service_name, detail_service_name, kwargs)
+        if res_json is None or isinstance(res_json, dict):
+            return None
+
+        keys, names = record_schema(service_name, detail_service_name)
+        records = [tuple(map(row.get, keys)) for row in res_json]
+        if as_dict:
+            return [dict(zip(names, record)) for record in records]
+        return records
+
+    def get_schema(self, service_name, detail_service_name=None, translate=True):
+        """
+        get_records() 튜플의 컬럼명 (translate=True이면 한글 컬럼명, 모듈 함수 get_schema()와 동일)
+        """
+        return get_schema(service_name, detail_service_name, translate)
+
+    def _resolve_service(self, service_name, detail_service_name=None):
+        """
+        서비스명으로 API URL과 컬럼 목록 선택
+        """
         try:
             # 서비스명으로 API URL 선택 (ex. KOSIS통합검색, 통계설명, 통계표설명, 통계목록, 통계자료)
             url = self.meta_dict.get(service_name).get("url")
@@ -110,7 +569,23 @@ class Kosis:
         except AttributeError:
             raise AttributeError(
                 "서비스명을 확인해주세요. (ex. KOSIS통합검색, 통계설명, 통계표설명, 통계목록, 통계자료)")
+        return url, columns
 
+    def _fetch_json(self, url, service_name, detail_service_name, kwargs):
+        """
+        요청 파라미터 구성 후 캐시 또는 API에서 JSON 응답 조회
+        """
+        params = self._build_params(service_name, detail_service_name, kwargs)
+        if self.cache is not None:
+            return self.cache.get_or_fetch(
+                service_name, detail_service_name, params,
+                lambda: self._request(url, params))
+        return self._request(url, params)
+
+    def _build_params(self, service_name, detail_service_name, kwargs):
+        """
+        API 요청 파라미터 구성 (인증키, 응답 형식, 상세 서비스 type 포함)
+        """
         params = {
             "apiKey": requests.utils.unquote(self.service_key),
             "format": "json",
@@ -121,249 +596,102 @@ class Kosis:
             # 상세 서비스명으로 파라미터 추가 (ex. 통계표명칭, 기관명칭, 수록정보, 분류항목, 주석, 단위, 출처, 가중치, 자료갱신일)
             params["type"] = self.type_dict.get(detail_service_name)
         params.update(kwargs)
+        return params
 
-        # 빈 데이터 프레임 생성
-        df = pd.DataFrame(columns=columns)
+    def _decode(self, body):
+        """
+        응답 bytes JSON 디코딩 (자료갱신일 응답의 탭 문자 키는 SEND_DE로 보정)
+        """
+        try:
+            return kosis_http.decode_json(body)
+        except ValueError as e:
+            logging.error("%s ", e)
+            return json.loads(body.decode("utf-8").replace("\t", "SEND_DE"))
 
+    def _request(self, url, params):
+        """
+        API 요청 후 JSON 응답 반환 (실패 또는 errMsg 응답 시 None)
+        """
         try:
-            # API 요청
-            # print(url)
-            res = requests.get(url, params=params, verify=False)
-            # logging.info('json 응답 확인 : %s', res.status_code)
-            # print(f"{params}에 대한 json 응답 확인 : {res.status_code}")
-            # API 응답 결과를 JSON 형태로 변환
-            try:
-                res_json = res.json()
-            except Exception as e:
-                res_json = json.loads(res.text.replace("\t", "SEND_DE"))
-                logging.error("%s ", e)
+            with kosis_http.limiter_slot(self.limiter):
+                # API 요청
+                # print(url)
+                res = kosis_http.get_session().get(url, params=params, timeout=self.timeout, verify=False)
+                res.raise_for_status()
+                # logging.info('json 응답 확인 : %s', res.status_code)
+                # print(f"{params}에 대한 json 응답 확인 : {res.status_code}")
+                # API 응답 결과를 JSON 형태로 변환
+                res_json = self._decode(res.content)
+                kosis_http.check_kosis_error(res_json)
+        except kosis_http.KosisApiError as e:
+            print(e.message)
+            return None
         except Exception as e:
             print("API 요청이 실패했습니다.")
             print(e)
             # logger.error(e)
             return None
 
-        try:
-            if type(res_json) == dict:
-                if res_json.get("errMsg"):
-                    print(res_json.get("errMsg"))
-                    return None
-            else:
-                sub = pd.DataFrame(res_json)
-                df = pd.concat([df, sub], axis=0, ignore_index=True).dropna(
-                    axis=1, how="all")
-            if translate:
-                df = self.translate_columns(
-                    df, service_name, detail_service_name)
-            return df
-        except:
-            print("Data Frame Failed!")
-            return None
+        return res_json
 
     def translate_columns(self, df, service_name, detail_service_name=None):
         """
         영문 컬럼명을 한글로 변경
         """
-        rename_columns = {
-            "KOSIS통합검색": {
-                'ORG_ID': '기관ID',
-                'ORG_NM': '기관명',
-                'TBL_ID': '통계표ID',
-                'TBL_NM': '통계표명',
-                'STAT_ID': '조사ID',
-                'STAT_NM': '조사명',
-                'VW_CD': 'KOSIS목록구분',
-                'MT_ATITLE': 'KOSIS통계표위치',
-                'FULL_PATH_ID': '통계표위치',
-                'CONTENTS': '통계표주요내용',
-                'STRT_PRD_DE': '수록기간시작일',
-                'END_PRD_DE': '수록기간종료일',
-                'ITEM03': '통계표주석',
-                'REC_TBL_SE': '추천통계표여부',
-                'TBL_VIEW_URL': 'KOSIS목록URL',
-                'LINK_URL': 'KOSIS통계표URL',
-                'STAT_DB_CNT': '검색결과건수',
-                'QUERY': '검색어명',
-            },
-            "통계설명": {
-                'statsNm': '조사명',
-                'statsKind': '통계종류',
-                'statsContinue': '계속여부',
-                'basisLaw': '법적근거',
-                'writingPurps': '조사목적',
-                'statsPeriod': '조사주기',
-                'writingSystem': '조사체계',
-                'pubExtent': '공표범위',
-                'pubPeriod': '공표주기',
-                'writingTel': '연락처',
-                'statsField': '통계활용분야실태',
-                'examinObjrange': '조사대상범위',
-                'examinObjArea': '조사대상지역',
-                'josaUnit': '조사단위및조사대상규모',
-                'applyGroup': '적용분류',
-                'josaItm': '조사항목',
-                'publictMth': '공표방법및URL',
-                'examinTrgetPd': '조사대상기간및조사기준시점',
-                'examinPd': '조사기간',
-                'dataUserNote': '자료이용자유의사항',
-                'mainTermExpl': '주요용어해설',
-                'dataCollectMth': '자료수집방법',
-                'examinHistory': '조사연혁',
-                'confmNo': '승인번호',
-                'confmDt': '승인일자',
-                'statsEnd': '통계종료',
-            },
-            "통계표설명": {
-                "통계표명칭": {
-                    'TBL_NM': '통계표명',
-                    'TBL_NM_ENG': '통계표영문명',
-                },
-                "기관명칭": {
-                    'ORG_NM': '기관명',
-                    'ORG_NM_ENG': '기관영문명',
-                },
-                "수록정보": {
-                    'PRD_SE': '수록주기',
-                    'STRT_PRD_DE': '수록기간시작일',
-                    'END_PRD_DE': '수록기간종료일',
-                    'PRD_DE': '수록시점',
-                },
-                "분류항목": {
-                    'ORG_ID': '기관ID',
-                    'TBL_ID': '통계표ID',
-                    'CD_ID': '코드ID',
-                    'CD_NM': '코드명',
-                    'OBJ_ID': '분류ID',
-                    'OBJ_NM': '분류명',
-                    'OBJ_NM_ENG': '분류영문명',
-                    'ITM_ID': '분류값ID',
-                    'ITM_NM': '분류값명',
-                    'ITM_NM_ENG': '분류값영문명',
-                    'UP_ITM_ID': '상위분류값ID',
-                    'OBJ_ID_SN': '분류값순번',
-                    'UNIT_ID': '단위ID',
-                    'UNIT_NM': '단위명',
-                    'UNIT_ENG_NM': '단위영문명',
-                },
-                "주석": {
-                    'CMMT_NM': '주석유형',
-                    'CMMT_DC': '주석',
-                    'OBJ_ID': '분류ID',
-                    'OBJ_NM': '분류명',
-                    'ITM_ID': '분류값ID',
-                    'ITM_NM': '분류값명',
-                },
-                "단위": {
-                    'UNIT_NM': '단위명',
-                    'UNIT_NM_ENG': '단위영문명',
-                },
-                "출처": {
-                    'JOSA_NM': '조사명',
-                    'DEPT_NM': '통계표담당부서',
-                    'DEPT_PHONE': '통계표담당부서전화번호',
-                },
-                "가중치": {
-                    'C1': '분류값ID1',
-                    'C1_NM': '분류값명1',
-                    'C2': '분류값ID2',
-                    'C2_NM': '분류값명2',
-                    'C3': '분류값ID3',
-                    'C3_NM': '분류값명3',
-                    'C4': '분류값ID4',
-                    'C4_NM': '분류값명4',
-                    'C5': '분류값ID5',
-                    'C5_NM': '분류값명5',
-                    'C6': '분류값ID6',
-                    'C6_NM': '분류값명6',
-                    'C7': '분류값ID7',
-                    'C7_NM': '분류값명7',
-                    'C8': '분류값ID8',
-                    'C8_NM': '분류값명8',
-                    'ITM_ID': '항목ID',
-                    'ITM_NM': '항목명',
-                    'WGT_CO': '가중치',
-                },
-                "자료갱신일": {
-                    'ORG_NM': '기관명',
-                    'TBL_NM': '통계표명',
-                    'PRD_SE': '수록주기',
-                    'PRD_DE': '수록시점',
-                    'SEND_DE': '자료갱신일',
-                },
-            },
-            "통계목록": {
-                'VW_CD': '서비스뷰ID',
-                'VW_NM': '서비스뷰명',
-                'LIST_ID': '목록ID',
-                'LIST_NM': '목록명',
-                'ORG_ID': '기관ID',
-                'TBL_ID': '통계표ID',
-                'TBL_NM': '통계표명',
-                'REC_TBL_SE': '추천통계표여부',
-            },
-            "통계자료": {
-                'ORG_ID': '기관ID',
-                'TBL_ID': '통계표ID',
-                'TBL_NM': '통계표명',
-                'C1_OBJ_NM': '분류명1',
-                'C1_OBJ_NM_ENG': '분류영문명1',
-                'C1_NM': '분류값명1',
-                'C1_NM_ENG': '분류값영문명1',
-                'C1': '분류값ID1',
-                'C2_OBJ_NM': '분류명2',
-                'C2_OBJ_NM_ENG': '분류영문명2',
-                'C2_NM': '분류값명2',
-                'C2_NM_ENG': '분류값영문명2',
-                'C2': '분류값ID2',
-                'C3_OBJ_NM': '분류명3',
-                'C3_OBJ_NM_ENG': '분류영문명3',
-                'C3_NM': '분류값명3',
-                'C3_NM_ENG': '분류값영문명3',
-                'C3': '분류값ID3',
-                'C4_OBJ_NM': '분류명4',
-                'C4_OBJ_NM_ENG': '분류영문명4',
-                'C4_NM': '분류값명4',
-                'C4_NM_ENG': '분류값영문명4',
-                'C4': '분류값ID4',
-                'C5_OBJ_NM': '분류명5',
-                'C5_OBJ_NM_ENG': '분류영문명5',
-                'C5_NM': '분류값명5',
-                'C5_NM_ENG': '분류값영문명5',
-                'C5': '분류값ID5',
-                'C6_OBJ_NM': '분류명6',
-                'C6_OBJ_NM_ENG': '분류영문명6',
-                'C6_NM': '분류값명6',
-                'C6_NM_ENG': '분류값영문명6',
-                'C6': '분류값ID6',
-                'C7_OBJ_NM': '분류명7',
-                'C7_OBJ_NM_ENG': '분류영문명7',
-                'C7_NM': '분류값명7',
-                'C7_NM_ENG': '분류값영문명7',
-                'C7': '분류값ID7',
-                'C8_OBJ_NM': '분류명8',
-                'C8_OBJ_NM_ENG': '분류영문명8',
-                'C8_NM': '분류값명8',
-                'C8_NM_ENG': '분류값영문명8',
-                'C8': '분류값ID8',
-                'ITM_ID': '항목ID',
-                'ITM_NM': '항목명',
-                'ITM_NM_ENG': '항목영문명',
-                'UNIT_ID': '단위ID',
-                'UNIT_NM': '단위명',
-                'UNIT_NM_ENG': '단위영문명',
-                'PRD_SE': '수록주기',
-                'PRD_DE': '수록시점',
-                'DT': '수치값',
-            },
-        }
         try:
             if service_name == "통계표설명" and detail_service_name:
-                rename_columns = rename_columns.get(
+                rename_columns = RENAME_COLUMNS.get(
                     service_name).get(detail_service_name)
             else:
-                rename_columns = rename_columns.get(service_name)
+                rename_columns = RENAME_COLUMNS.get(service_name)
         except AttributeError:
             raise AttributeError(
                 "서비스명을 확인해주세요. (ex. KOSIS통합검색, 통계설명, 통계표설명, 통계목록, 통계자료)")
 
         return df.rename(columns=rename_columns)
+
+
+def record_schema(service_name, detail_service_name=None):
+    """
+    서비스별 레코드 스키마 (영문 키 튜플, 한글 컬럼명 튜플)
+
+    인증키/요청 주소와 무관하므로 Kosis 객체 없이 조회할 수 있으며, 서비스별로 최초 1회만 생성합니다.
+    """
+    # 통계표설명만 상세 서비스별 스키마 사용
+    schema_key = (service_name, detail_service_name if service_name == "통계표설명" else None)
+    schema = _SCHEMAS.get(schema_key)
+    if schema is None:
+        try:
+            columns = SERVICE_COLUMNS[service_name]
+            if service_name == "통계표설명":
+                columns = columns[detail_service_name]
+        except KeyError:
+            raise AttributeError(
+                "서비스명을 확인해주세요. (ex. KOSIS통합검색, 통계설명, 통계표설명, 통계목록, 통계자료)")
+        rename = RENAME_COLUMNS.get(service_name, {})
+        if service_name == "통계표설명":
+            rename = rename.get(detail_service_name, {})
+        schema = _SCHEMAS[schema_key] = (tuple(columns), tuple(rename.get(col, col) for col in columns))
+    return schema
+
+
+def get_schema(service_name, detail_service_name=None, translate=True):
+    """
+    get_records() 튜플의 컬럼명 (translate=True이면 한글 컬럼명)
+    """
+    keys, names = record_schema(service_name, detail_service_name)
+    return list(names if translate else keys)
+
+
+def records_to_frame(records, columns):
+    """
+    get_records() 결과(튜플 목록)를 모아 DataFrame 1개로 변환
+
+    Parameters
+    ----------
+    records : list of tuple
+        레코드 목록 (여러 호출 결과를 이어 붙인 목록)
+    columns : list of str
+        컬럼명 (get_schema() 결과에 추가 컬럼을 덧붙여 사용 가능)
+    """
+    return pd.DataFrame.from_records(records, columns=columns)